@@ -8,6 +8,7 @@ import subprocess
 from pathlib import Path
 from typing import Any, Dict, List
 
+import click
 import typer
 
 
@@ -112,10 +113,13 @@ def extract_command_info(app: typer.Typer, command_path: List[str] = None) -> Di
 
     # Get the underlying Click group
     click_group = typer.main.get_group(app)
+    ctx = click.Context(click_group)
 
-    # Extract subcommands
-    if hasattr(click_group, "commands"):
-        for name, cmd in click_group.commands.items():
+    # Extract subcommands. They're resolved through the group rather than read from
+    # ``commands``, since sup registers its command modules lazily.
+    if isinstance(click_group, click.Group):
+        for name in click_group.list_commands(ctx):
+            cmd = click_group.get_command(ctx, name)
             full_path = command_path + [name]
 
             # Get command help
@@ -145,8 +149,10 @@ def extract_command_info(app: typer.Typer, command_path: List[str] = None) -> Di
             }
 
             # Check if this command has subcommands (is a group)
-            if hasattr(cmd, "commands"):
-                for sub_name, sub_cmd in cmd.commands.items():
+            if isinstance(cmd, click.Group):
+                sub_ctx = click.Context(cmd, parent=ctx)
+                for sub_name in cmd.list_commands(sub_ctx):
+                    sub_cmd = cmd.get_command(sub_ctx, sub_name)
                     commands[name]["subcommands"][sub_name] = {
                         "name": sub_name,
                         "help": clean_help_text(sub_cmd.help or ""),
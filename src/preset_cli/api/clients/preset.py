@@ -284,13 +284,18 @@ class PresetClient:  # pylint: disable=too-few-public-methods
         self,
         team_name: str,
         page: int,
+        count: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Lists all user/SCIM groups associated with a team
+
+        ``page`` is the 1-based SCIM ``startIndex``; ``count`` optionally asks the
+        server for a larger page than its default.
         """
-        url = (
-            self.get_base_url() / "teams" / team_name / "scim/v2/Groups" % {"startIndex": str(page)}
-        )
+        params = {"startIndex": str(page)}
+        if count is not None:
+            params["count"] = str(count)
+        url = self.get_base_url() / "teams" / team_name / "scim/v2/Groups" % params
         self.session.headers["Accept"] = "application/scim+json"
         _logger.debug("GET %s", url)
         response = self.session.get(url)
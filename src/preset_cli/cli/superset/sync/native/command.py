@@ -11,10 +11,11 @@ import logging
 import os
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Dict, Iterator, Set, Tuple
+from typing import Any, Dict, Iterator, Optional, Set, TextIO, Tuple
 from zipfile import ZipFile
 
 import backoff
@@ -35,7 +36,7 @@ from preset_cli.cli.superset.lib import (
     write_logs_to_file,
 )
 from preset_cli.exceptions import SupersetError
-from preset_cli.lib import dict_merge
+from preset_cli.lib import YAML_LOADER, dict_merge
 
 _logger = logging.getLogger(__name__)
 
@@ -43,6 +44,9 @@ YAML_EXTENSIONS = {".yaml", ".yml"}
 ASSET_DIRECTORIES = {"databases", "datasets", "charts", "dashboards"}
 OVERRIDES_SUFFIX = ".overrides"
 
+# Number of compiled asset templates kept around for reuse
+TEMPLATE_CACHE_SIZE = 1024
+
 # This should be identical to ``superset.models.core.PASSWORD_MASK``. It's duplicated here
 # because we don't want to have the CLI to depend on the ``superset`` package.
 PASSWORD_MASK = "X" * 10
@@ -143,30 +147,55 @@ def load_yaml(path: Path) -> Dict[str, Any]:
     with open(path, encoding="utf-8") as input_:
         content = input_.read()
 
-    return yaml.load(content, Loader=yaml.SafeLoader)
+    return yaml.load(content, Loader=YAML_LOADER)
+
+
+def load_template(path: Path) -> Template:
+    """
+    Load a YAML file as a compiled Jinja template.
+    """
+    with open(path, encoding="utf-8") as input_:
+        asset_content = input_.read()
+
+    return compile_template(asset_content)
 
 
-def render_yaml(path: Path, env: Dict[str, Any]) -> Dict[str, Any]:
+def render_yaml(
+    path: Path,
+    env: Dict[str, Any],
+    template: Optional[Template] = None,
+) -> Dict[str, Any]:
     """
     Load a YAML file as a template, render it, and deserialize it.
+
+    The template can be passed in when it was already loaded from ``path``, to render
+    the same file several times without reading it again.
     """
     env["filepath"] = path
 
-    with open(path, encoding="utf-8") as input_:
-        asset_content = input_.read()
+    if template is None:
+        template = load_template(path)
 
+    content = template.render(**env)
+    return yaml.load(content, Loader=YAML_LOADER)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(asset_content: str) -> Template:
+    """
+    Compile the content of a YAML asset into a Jinja template.
+
+    Compiled templates are cached by content, so pushing the same assets to several
+    targets only pays for compilation once.
+    """
     try:
-        template = Template(asset_content)
+        return Template(asset_content)
 
     # For charts with a `query_context` -> ``str(JSON)``, templating the YAML structure directly
     # was failing. The route str(YAML) -> dict -> str(JSON) is more consistent.
     except TemplateSyntaxError:
-        content = yaml.load(asset_content, Loader=yaml.SafeLoader)
-        content = json.dumps(content)
-        template = Template(content)
-
-    content = template.render(**env)
-    return yaml.load(content, Loader=yaml.SafeLoader)
+        content = yaml.load(asset_content, Loader=YAML_LOADER)
+        return Template(json.dumps(content))
 
 
 @click.command()
@@ -334,6 +363,7 @@ def import_resources_individually(  # pylint: disable=too-many-locals
     overwrite: bool,
     asset_type: ResourceType,
     continue_on_error: bool = False,
+    output: Optional[TextIO] = None,
 ) -> None:
     """
     Import contents individually.
@@ -345,6 +375,8 @@ def import_resources_individually(  # pylint: disable=too-many-locals
     By default, the import logs all assets imported correctly to a checkpoint file so that
     if one fails, a future import continues from where it's left. If ``continue_on_error``
     is set to True, then only failures are logged to the file, and the import continues.
+
+    Import errors are echoed to ``output`` (stdout by default).
     """
     imports = [
         ("databases", lambda config: []),
@@ -355,6 +387,10 @@ def import_resources_individually(  # pylint: disable=too-many-locals
     asset_configs: Dict[Path, AssetConfig]
     related_configs: Dict[str, Dict[Path, AssetConfig]] = {}
 
+    # related assets are bundled again with every asset that depends on them, so
+    # each config is serialized only once
+    serialized: Dict[Path, str] = {}
+
     log_file_path, logs = get_logs(LogType.ASSETS)
     assets_to_skip = {Path(log["path"]) for log in logs[LogType.ASSETS]}
 
@@ -384,8 +420,12 @@ def import_resources_individually(  # pylint: disable=too-many-locals
 
                     _logger.info("Importing %s", path.relative_to("bundle"))
 
-                    contents = {str(k): yaml.dump(v) for k, v in asset_configs.items()}
-                    import_resources(contents, client, overwrite, asset_type)
+                    contents = {}
+                    for asset_path, asset_config in asset_configs.items():
+                        if asset_path not in serialized:
+                            serialized[asset_path] = yaml.dump(asset_config)
+                        contents[str(asset_path)] = serialized[asset_path]
+                    import_resources(contents, client, overwrite, asset_type, output)
                 except Exception:  # pylint: disable=broad-except
                     if not continue_on_error:
                         raise
@@ -487,9 +527,12 @@ def import_resources(
     client: SupersetClient,
     overwrite: bool,
     asset_type: ResourceType,
+    output: Optional[TextIO] = None,
 ) -> None:
     """
     Import a bundle of assets.
+
+    Import errors are echoed to ``output`` (stdout by default).
     """
     contents["bundle/metadata.yaml"] = yaml.dump(
         dict(
@@ -502,8 +545,8 @@ def import_resources(
     buf = BytesIO()
     with ZipFile(buf, "w") as bundle:
         for file_path, file_content in contents.items():
-            with bundle.open(file_path, "w") as output:
-                output.write(file_content.encode())
+            with bundle.open(file_path, "w") as bundle_file:
+                bundle_file.write(file_content.encode())
     buf.seek(0)
     try:
         client.import_zip(asset_type.resource_name, buf, overwrite=overwrite)
@@ -513,6 +556,7 @@ def import_resources(
                 "\n".join(error["message"] for error in ex.errors),
                 fg="bright_red",
             ),
+            file=output,
         )
 
         # check if overwrite is needed:
@@ -534,4 +578,5 @@ def import_resources(
                 ),
                 fg="bright_red",
             ),
+            file=output,
         )
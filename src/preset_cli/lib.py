@@ -6,16 +6,21 @@ import json
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, cast
 
 import click
-from requests import Response
-from rich.logging import RichHandler
+import yaml
 
 from preset_cli.exceptions import CLIError, ErrorLevel, ErrorPayload, SupersetError
 
+if TYPE_CHECKING:
+    from requests import Response
+
 _logger = logging.getLogger(__name__)
 
+# libyaml's C loader is several times faster than the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def remove_root(file_path: str) -> str:
     """
@@ -29,6 +34,8 @@ def setup_logging(loglevel: str) -> None:
     """
     Setup basic logging.
     """
+    from rich.logging import RichHandler
+
     level = getattr(logging, loglevel.upper(), None)
     if not isinstance(level, int):
         raise ValueError(f"Invalid log level: {loglevel}")
@@ -64,7 +71,7 @@ def is_sip_40_payload(errors: List[Dict[str, Any]]) -> bool:
     )
 
 
-def validate_response(response: Response) -> None:
+def validate_response(response: "Response") -> None:
     """
     Check for errors in a response.
     """
@@ -12,6 +12,7 @@ from rich.table import Table
 from preset_cli.api.clients.preset import PresetClient
 from sup.auth.preset import SupPresetAuth
 from sup.config.settings import SupContext
+from sup.config.workspace_cache import load_workspaces, save_workspaces
 from sup.output.console import console
 from sup.output.styles import COLORS, EMOJIS, RICH_STYLES
 
@@ -24,6 +25,9 @@ class SupPresetClient:
     def __init__(self, auth: SupPresetAuth):
         self.auth = auth
         self.client = PresetClient(auth.baseurl, auth)
+        self._workspaces_fetched = False
+        self._workspace_index: Optional[Dict[int, Dict[str, Any]]] = None
+        self._workspace_ids_by_hostname: Dict[str, int] = {}
 
     @classmethod
     def from_context(
@@ -79,16 +83,69 @@ class SupPresetClient:
 
         return all_workspaces
 
+    def get_workspace_index(
+        self,
+        silent: bool = False,
+        refresh: bool = False,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get all workspaces by id.
+
+        Workspaces come from the on-disk cache when it's fresh. With ``refresh`` they
+        come from the API instead, fetched at most once per client.
+        """
+        if self._workspace_index is None or (refresh and not self._workspaces_fetched):
+            workspaces = None if refresh else load_workspaces(self.auth.api_token)
+            if workspaces is None:
+                workspaces = self.get_all_workspaces(silent=silent)
+                self._workspaces_fetched = True
+                # An empty list usually means the request failed; don't cache it
+                if workspaces:
+                    save_workspaces(self.auth.api_token, workspaces)
+
+            self._workspace_index = {
+                workspace["id"]: workspace for workspace in workspaces if "id" in workspace
+            }
+            self._workspace_ids_by_hostname = {
+                workspace["hostname"]: workspace_id
+                for workspace_id, workspace in self._workspace_index.items()
+                if workspace.get("hostname")
+            }
+
+        return self._workspace_index
+
+    def get_workspace(
+        self,
+        workspace_id: int,
+        silent: bool = False,
+        refresh: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a workspace by id, or None if not found."""
+        workspace = self.get_workspace_index(silent=silent, refresh=refresh).get(workspace_id)
+        if workspace is None and not self._workspaces_fetched:
+            # The cache may predate the workspace, so check the API before giving up
+            workspace = self.get_workspace_index(silent=silent, refresh=True).get(workspace_id)
+        return workspace
+
     def get_workspace_hostname(
         self,
         workspace_id: int,
         silent: bool = False,
     ) -> Optional[str]:
         """Resolve the hostname for a workspace id, or None if not found."""
-        for workspace in self.get_all_workspaces(silent=silent):
-            if workspace.get("id") == workspace_id:
-                return workspace.get("hostname")
-        return None
+        workspace = self.get_workspace(workspace_id, silent=silent)
+        return workspace.get("hostname") if workspace else None
+
+    def get_workspace_id_by_hostname(
+        self,
+        hostname: str,
+        silent: bool = False,
+    ) -> Optional[int]:
+        """Resolve the id of the workspace with a given hostname, or None if not found."""
+        self.get_workspace_index(silent=silent)
+        if hostname not in self._workspace_ids_by_hostname and not self._workspaces_fetched:
+            self.get_workspace_index(silent=silent, refresh=True)
+        return self._workspace_ids_by_hostname.get(hostname)
 
     def display_workspaces_table(self, workspaces: List[Dict[str, Any]]) -> None:
         """Display workspaces in a beautiful Rich table."""
@@ -67,16 +67,8 @@ class SupSupersetClient:
             from sup.clients.preset import SupPresetClient
 
             preset_client = SupPresetClient.from_context(ctx, silent=True)
-            workspaces = preset_client.get_all_workspaces(
-                silent=True,
-            )  # Silent for internal operation
-
-            # Find our workspace
-            workspace = None
-            for ws in workspaces:
-                if ws.get("id") == workspace_id:
-                    workspace = ws
-                    break
+            # Silent for internal operation
+            workspace = preset_client.get_workspace(workspace_id, silent=True)
 
             if not workspace:
                 console.print(
@@ -1 +1,22 @@
 """Command modules for sup CLI."""
+
+# One-line help for each top-level command, shared by the command's own Typer app
+# and ``sup --help``, which lists commands without importing their modules
+COMMAND_SUMMARIES = {
+    "config": "⚙️ Configuration Management",
+    "sql": "🔍 Get direct access to your data",
+    "workspace": "Manage workspaces",
+    "database": "Manage databases",
+    "dataset": "Manage datasets",
+    "chart": "Manage charts",
+    "dashboard": "Manage dashboards",
+    "query": "Manage saved queries",
+    "user": "Manage users",
+    "group": "Manage SCIM groups",
+    "rls": "Manage row-level security",
+    "role": "Manage roles and permissions",
+    "ownership": "Manage asset ownership",
+    "sync": "🔄 Multi-target asset synchronization",
+    "dbt": "🔄 dbt to Superset synchronization",
+    "theme": "Manage themes",
+}
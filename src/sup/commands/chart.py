@@ -10,6 +10,7 @@ import typer
 from rich.table import Table
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.commands.template_params import DisableJinjaOption, LoadEnvOption, TemplateOptions
 from sup.filters.chart import parse_chart_filters
 from sup.output.console import console
@@ -17,7 +18,7 @@ from sup.output.formatters import display_porcelain_list
 from sup.output.spinners import data_spinner, query_spinner
 from sup.output.styles import COLORS, EMOJIS, RICH_STYLES
 
-app = typer.Typer(help="Manage charts", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["chart"], no_args_is_help=True)
 
 
 @app.command("list")
@@ -1272,13 +1273,7 @@ def push_charts(
         from sup.clients.preset import SupPresetClient
 
         preset_client = SupPresetClient.from_context(ctx, silent=True)
-        workspaces = preset_client.get_all_workspaces(silent=True)
-
-        target_workspace = None
-        for ws in workspaces:
-            if ws.get("id") == target_workspace_id:
-                target_workspace = ws
-                break
+        target_workspace = preset_client.get_workspace(target_workspace_id, silent=True)
 
         if not target_workspace:
             console.print(
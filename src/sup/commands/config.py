@@ -8,13 +8,14 @@ import typer
 from rich.theme import Theme
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.output.console import get_console
 from sup.output.styles import COLORS, EMOJIS, RICH_STYLES
 
 
 def format_config_help():
     """Create beautifully formatted help text for config command group."""
-    return f"""[not dim][bold bright_white]⚙️ Configuration Management[/bold bright_white][/not dim]
+    return f"""[not dim][bold bright_white]{COMMAND_SUMMARIES["config"]}[/bold bright_white][/not dim]
 
 [bold {COLORS.primary}]Configuration Sources (priority order):[/bold {COLORS.primary}]
 • [bright_white]Environment variables:[/bright_white] [cyan]SUP_*[/cyan] (highest priority)
@@ -458,6 +459,11 @@ def show_env_vars():
         ("SUP_MAX_ROWS", "Maximum rows to display (default: 1000)"),
         ("SUP_SHOW_QUERY_TIME", "Show query execution time (true/false)"),
         ("SUP_COLOR_OUTPUT", "Enable colored output (true/false)"),
+        ("SUP_DEBUG_BUNDLE", "Save a debug_bundle.zip of each sync push (true/false)"),
+        (
+            "SUP_CAPTURE_IMPORT_OUTPUT",
+            "Collect sync push import output and show it after (true/false)",
+        ),
     ]
 
     from rich.table import Table
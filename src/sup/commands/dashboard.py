@@ -13,13 +13,14 @@ from rich.panel import Panel
 from rich.table import Table
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.commands.template_params import DisableJinjaOption, LoadEnvOption, TemplateOptions
 from sup.output.console import console
 from sup.output.formatters import display_porcelain_list
 from sup.output.styles import COLORS, EMOJIS, RICH_STYLES
 from sup.output.tables import display_dashboards_table
 
-app = typer.Typer(help="Manage dashboards", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["dashboard"], no_args_is_help=True)
 
 
 @app.command("list")
@@ -11,11 +11,12 @@ import typer
 # Removed: from rich.console import Console
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.lib import escape_jinja
 from sup.output.console import console
 from sup.output.styles import EMOJIS, RICH_STYLES
 
-app = typer.Typer(help="Manage databases", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["database"], no_args_is_help=True)
 
 
 @app.command("list")
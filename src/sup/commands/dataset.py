@@ -12,12 +12,13 @@ import typer
 from rich.table import Table
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.commands.template_params import DisableJinjaOption, LoadEnvOption, TemplateOptions
 from sup.output.console import console
 from sup.output.formatters import display_porcelain_list
 from sup.output.styles import COLORS, EMOJIS, RICH_STYLES
 
-app = typer.Typer(help="Manage datasets", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["dataset"], no_args_is_help=True)
 
 
 @app.command("list")
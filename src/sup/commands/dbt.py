@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 import typer
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.output.console import console
 from sup.output.styles import EMOJIS, RICH_STYLES
 
@@ -20,7 +21,7 @@ def format_dbt_help():
     from sup.output.styles import COLORS
 
     return f"""\
-[not dim][bold bright_white]🔄 dbt to Superset synchronization[/bold bright_white][/not dim]
+[not dim][bold bright_white]{COMMAND_SUMMARIES["dbt"]}[/bold bright_white][/not dim]
 
 [bold {COLORS.primary}]Key Features:[/bold {COLORS.primary}]
 • [bright_white]Model sync:[/bright_white] dbt models → Superset datasets with schema & metrics
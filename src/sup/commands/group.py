@@ -6,19 +6,30 @@ Enables group management for customers not using Okta/SCIM sync.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import typer
 from typing_extensions import Annotated
 
+from preset_cli.api.clients.preset import PresetClient
+from sup.auth.preset import get_preset_auth
+from sup.commands import COMMAND_SUMMARIES
+from sup.config.settings import SupContext
+from sup.lib import YAML_LOADER
 from sup.output.console import console
+from sup.output.spinners import data_spinner, spinner
 from sup.output.styles import EMOJIS, RICH_STYLES
 
-# Constants for SCIM API pagination
-SCIM_PAGE_SIZE = 100  # Number of groups per page
-SCIM_INITIAL_TOTAL = 100  # Default total count to ensure at least one iteration
+# Number of groups requested per SCIM page; the server may return fewer
+SCIM_PAGE_SIZE = 500
 
-app = typer.Typer(help="Manage SCIM groups", no_args_is_help=True)
+# YAML sync configs above this size are slow to parse; suggest JSON instead
+LARGE_CONFIG_BYTES = 10 * 1024 * 1024
+
+# Column headings for the CSV group listing
+GROUP_CSV_HEADER = ("ID", "Name", "Member Count", "Members")
+
+app = typer.Typer(help=COMMAND_SUMMARIES["group"], no_args_is_help=True)
 
 
 @app.command("list")
@@ -49,11 +60,6 @@ def list_groups(
     Shows group ID, name, and member count. Supports pagination for large teams.
     If no team is specified, lists teams for selection.
     """
-    from preset_cli.api.clients.preset import PresetClient
-    from sup.auth.preset import get_preset_auth
-    from sup.config.settings import SupContext
-    from sup.output.spinners import data_spinner
-
     try:
         with data_spinner("groups", silent=porcelain) as sp:
             ctx = SupContext()
@@ -62,35 +68,12 @@ def list_groups(
             # Use the Preset client directly for SCIM operations
             client = PresetClient("https://api.app.preset.io/", auth)
 
-            # Get team if not specified
+            team = _resolve_team(client, team, porcelain)
             if not team:
-                teams = client.get_teams()
-                if len(teams) == 0:
-                    if not porcelain:
-                        console.print("No teams found.")
-                    return
-                elif len(teams) == 1:
-                    team = teams[0]["name"]
-                else:
-                    if not porcelain:
-                        console.print("\nAvailable teams:", style=RICH_STYLES["dim"])
-                        for t in teams:
-                            console.print(f"  • {t['title']} ({t['name']})")
-                        team = typer.prompt("Select team name")
+                return
 
             # Collect all groups with pagination
-            all_groups = []
-            start_at = 1
-            total_count = SCIM_INITIAL_TOTAL  # Default to ensure at least one iteration
-
-            while start_at <= total_count:
-                response = client.get_group_membership(team, start_at)  # type: ignore[arg-type]
-                total_count = response.get("totalResults", 0)
-
-                if response.get("Resources"):
-                    all_groups.extend(response["Resources"])
-
-                start_at += SCIM_PAGE_SIZE
+            all_groups = get_all_groups(client, team)
 
             # Apply limit if specified
             if limit and limit > 0:
@@ -102,7 +85,7 @@ def list_groups(
 
         # Handle different output formats
         if save_file:
-            save_groups_to_file(all_groups, save_file, team)  # type: ignore[arg-type]
+            save_groups_to_file(all_groups, save_file, team)
             if not porcelain:
                 console.print(
                     f"{EMOJIS['success']} Saved groups to {save_file}",
@@ -111,7 +94,7 @@ def list_groups(
         elif porcelain:
             # Tab-separated: ID, Name, Member Count
             for group in all_groups:
-                member_count = len(group.get("members", []))
+                member_count = len(group.get("members") or ())
                 print(f"{group['id']}\t{group['displayName']}\t{member_count}")
         elif json_output:
             import json
@@ -124,7 +107,7 @@ def list_groups(
         elif csv_output:
             display_groups_csv(all_groups)
         else:
-            display_groups_table(all_groups, team)  # type: ignore[arg-type]
+            display_groups_table(all_groups, team)
 
     except Exception as e:
         if not porcelain:
@@ -139,7 +122,7 @@ def list_groups(
 def sync_groups(
     config_file: Annotated[
         Path,
-        typer.Argument(help="Path to YAML configuration file with group definitions"),
+        typer.Argument(help="Path to YAML or JSON configuration file with group definitions"),
     ],
     team: Annotated[
         Optional[str],
@@ -159,10 +142,11 @@ def sync_groups(
     ] = False,
 ):
     """
-    Synchronize SCIM groups from a YAML configuration file.
+    Synchronize SCIM groups from a YAML or JSON configuration file.
 
     This creates and manages groups for customers not using Okta/SCIM sync.
-    The configuration file should define groups and their members.
+    The configuration file should define groups and their members. Files with
+    a .json suffix are parsed as JSON, which is much faster for large configs.
 
     Example YAML format:
 
@@ -175,13 +159,6 @@ def sync_groups(
         members:
           - email: analyst1@company.com
     """
-    import yaml
-
-    from preset_cli.api.clients.preset import PresetClient
-    from sup.auth.preset import get_preset_auth
-    from sup.config.settings import SupContext
-    from sup.output.spinners import spinner
-
     try:
         # Load configuration
         if not config_file.exists():
@@ -192,8 +169,18 @@ def sync_groups(
                 )
             raise typer.Exit(1)
 
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
+        if (
+            not porcelain
+            and config_file.suffix.lower() != ".json"
+            and config_file.stat().st_size > LARGE_CONFIG_BYTES
+        ):
+            console.print(
+                f"{EMOJIS['warning']} Large YAML configuration; "
+                "a .json file with the same structure loads much faster",
+                style=RICH_STYLES["warning"],
+            )
+
+        config = load_group_config(config_file)
 
         if "groups" not in config:
             if not porcelain:
@@ -210,28 +197,21 @@ def sync_groups(
         auth = get_preset_auth(ctx)
         client = PresetClient("https://api.app.preset.io/", auth)
 
-        # Get team if not specified
+        team = _resolve_team(client, team, porcelain)
         if not team:
-            teams = client.get_teams()
-            if len(teams) == 0:
-                if not porcelain:
-                    console.print("No teams found.")
-                return
-            elif len(teams) == 1:
-                team = teams[0]
-            else:
-                if not porcelain:
-                    console.print("\nAvailable teams:", style=RICH_STYLES["dim"])
-                    for t in teams:
-                        console.print(f"  • {t}")
-                    team = typer.prompt("Select team")
+            return
 
         # Get existing groups
-        existing_groups = get_all_groups(client, team)  # type: ignore[arg-type]
+        existing_groups = get_all_groups(client, team)
         existing_by_name = {g["displayName"]: g for g in existing_groups}
 
+        # Index team users once so member emails resolve to SCIM IDs in O(1)
+        user_index = None
+        if any(group.get("members") for group in groups_to_sync):
+            user_index = _build_user_index(client, team)
+
         # Plan sync operations
-        operations = plan_group_sync(groups_to_sync, existing_by_name)
+        operations = plan_group_sync(groups_to_sync, existing_by_name, user_index)
 
         if not operations["create"] and not operations["update"] and not operations["delete"]:
             if not porcelain:
@@ -258,7 +238,7 @@ def sync_groups(
 
         # Execute sync
         with spinner("Synchronizing groups", silent=porcelain) as sp:
-            results = execute_group_sync(client, team, operations)  # type: ignore[arg-type]
+            results = execute_group_sync(client, team, operations, user_index, porcelain)
 
             if sp:
                 sp.text = f"Synchronized {results['total']} groups"
@@ -305,32 +285,15 @@ def create_group(
     Example:
         sup group create "Data Engineers" -m user1@company.com -m user2@company.com
     """
-    from preset_cli.api.clients.preset import PresetClient
-    from sup.auth.preset import get_preset_auth
-    from sup.config.settings import SupContext
-    from sup.output.spinners import spinner
-
     try:
         with spinner(f"Creating group '{name}'", silent=porcelain):
             ctx = SupContext()
             auth = get_preset_auth(ctx)
             client = PresetClient("https://api.app.preset.io/", auth)
 
-            # Get team if not specified
+            team = _resolve_team(client, team, porcelain)
             if not team:
-                teams = client.get_teams()
-                if len(teams) == 0:
-                    if not porcelain:
-                        console.print("No teams found.")
-                    return
-                elif len(teams) == 1:
-                    team = teams[0]["name"]
-                else:
-                    if not porcelain:
-                        console.print("\nAvailable teams:", style=RICH_STYLES["dim"])
-                        for t in teams:
-                            console.print(f"  • {t['title']} ({t['name']})")
-                        team = typer.prompt("Select team name")
+                return
 
             # Create the group via SCIM API
             group_data = {
@@ -339,19 +302,19 @@ def create_group(
                 "members": [],
             }
 
-            # Add members if specified
+            # Add members if specified, resolving emails to SCIM user IDs
             if members:
-                # Note: This would require user lookup to get SCIM IDs
-                # For now, we'll create the group empty and note this limitation
-                if not porcelain:
+                user_index = _build_user_index(client, team)
+                group_data["members"], missing = resolve_members(members, user_index)
+                if missing and not porcelain:
                     console.print(
-                        f"{EMOJIS['warning']} Member addition during creation not yet implemented. "
-                        "Please use 'sup group add-members' after creation.",
+                        f"{EMOJIS['warning']} Skipping members not found in team {team}: "
+                        f"{', '.join(missing)}",
                         style=RICH_STYLES["warning"],
                     )
 
             # Create the group
-            response = create_scim_group(client, team, group_data)  # type: ignore[arg-type]
+            response = create_scim_group(client, team, group_data)
             group_id = response.get("id")
 
         if porcelain:
@@ -374,22 +337,121 @@ def create_group(
 # Helper functions
 
 
-def get_all_groups(client, team: str) -> List[Dict[str, Any]]:
-    """Fetch all groups for a team with pagination."""
-    all_groups = []
+def _resolve_team(client, team: Optional[str], porcelain: bool) -> Optional[str]:
+    """
+    Resolve the team to operate on, prompting when there is more than one.
+
+    Returns ``None`` when no team can be selected.
+    """
+    if team:
+        return team
+
+    teams = client.get_teams()
+    if not teams:
+        if not porcelain:
+            console.print("No teams found.")
+        return None
+
+    if len(teams) == 1:
+        return teams[0]["name"]
+
+    if porcelain:
+        return None
+
+    console.print("\nAvailable teams:", style=RICH_STYLES["dim"])
+    console.print("\n".join(f"  • {t['title']} ({t['name']})" for t in teams))
+    return typer.prompt("Select team name")
+
+
+def _collect_scim_pages(fetch_page: Callable[[int], Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collect the resources of a paginated SCIM list response.
+
+    SCIM ``startIndex`` is 1-based; advance by the number of resources actually
+    returned so servers with a smaller page size are handled, and stop as soon as
+    a page is empty or the reported total has been reached.
+    """
+    all_resources: List[Dict[str, Any]] = []
     start_at = 1
-    total_count = SCIM_INITIAL_TOTAL  # Default to ensure at least one iteration
 
-    while start_at <= total_count:
-        response = client.get_group_membership(team, start_at)
+    while True:
+        response = fetch_page(start_at)
+        resources = response.get("Resources") or []
+        all_resources.extend(resources)
+
         total_count = response.get("totalResults", 0)
+        if not resources or start_at + len(resources) > total_count:
+            break
+
+        start_at += len(resources)
+
+    return all_resources
+
+
+def load_group_config(config_file: Path) -> Dict[str, Any]:
+    """Load a group sync configuration from a YAML or JSON file."""
+    if config_file.suffix.lower() == ".json":
+        import json
+
+        with open(config_file) as f:
+            return json.load(f)
+
+    import yaml
+
+    with open(config_file) as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def get_all_groups(client, team: str) -> List[Dict[str, Any]]:
+    """Fetch all groups for a team with pagination."""
+    return _collect_scim_pages(
+        lambda start_at: client.get_group_membership(team, start_at, count=SCIM_PAGE_SIZE),
+    )
+
+
+def get_all_scim_users(client, team: str) -> List[Dict[str, Any]]:
+    """Fetch all SCIM users for a team with pagination."""
+    url = client.get_base_url() / "teams" / team / "scim/v2/Users"
+    client.session.headers["Accept"] = "application/scim+json"
+
+    def fetch_page(start_at: int) -> Dict[str, Any]:
+        response = client.session.get(
+            url % {"startIndex": str(start_at), "count": str(SCIM_PAGE_SIZE)},
+        )
+        response.raise_for_status()
+        return response.json()
+
+    return _collect_scim_pages(fetch_page)
 
-        if response.get("Resources"):
-            all_groups.extend(response["Resources"])
 
-        start_at += SCIM_PAGE_SIZE
+def _build_user_index(client, team: str) -> Dict[str, str]:
+    """Map lower-cased user emails to SCIM user IDs for a team."""
+    index = {}
+    for user in get_all_scim_users(client, team):
+        emails = user.get("emails") or ()
+        email = emails[0].get("value") if emails else user.get("userName")
+        if email:
+            index[email.lower()] = user["id"]
+    return index
 
-    return all_groups
+
+def resolve_members(
+    emails: Iterable[str], user_index: Dict[str, str]
+) -> Tuple[List[Dict[str, str]], List[str]]:
+    """
+    Resolve member emails to SCIM member references.
+
+    Returns the resolved members and the emails that are not in the index.
+    """
+    resolved = []
+    missing = []
+    for email in emails:
+        user_id = user_index.get(email.lower())
+        if user_id is None:
+            missing.append(email)
+        else:
+            resolved.append({"value": user_id, "display": email})
+    return resolved, missing
 
 
 def display_groups_table(groups: List[Dict[str, Any]], team: str) -> None:
@@ -402,46 +464,44 @@ def display_groups_table(groups: List[Dict[str, Any]], team: str) -> None:
     table.add_column("Members", style="yellow")
     table.add_column("Member List", style="dim")
 
+    add_row = table.add_row
     for group in groups:
-        group_id = group.get("id", "")
-        name = group.get("displayName", "")
-        members = group.get("members", [])
-        member_count = str(len(members))
+        members = group.get("members") or ()
+        member_count = len(members)
 
         # Format member list (first 3 members)
-        member_list = ""
         if members:
-            member_names = [m.get("display", m.get("value", "")) for m in members[:3]]
-            member_list = ", ".join(member_names)
-            if len(members) > 3:
-                member_list += f" (+{len(members) - 3} more)"
+            member_list = ", ".join(m.get("display") or m.get("value", "") for m in members[:3])
+            if member_count > 3:
+                member_list += f" (+{member_count - 3} more)"
         else:
             member_list = "No members"
 
-        table.add_row(group_id, name, member_count, member_list)
+        add_row(group.get("id", ""), group.get("displayName", ""), str(member_count), member_list)
 
     console.print(table)
 
 
+def _group_csv_rows(groups: List[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Yield one CSV row per group, matching ``GROUP_CSV_HEADER``."""
+    for group in groups:
+        members = group.get("members") or ()
+        yield (
+            group.get("id", ""),
+            group.get("displayName", ""),
+            len(members),
+            ";".join(m.get("value", "") for m in members),
+        )
+
+
 def display_groups_csv(groups: List[Dict[str, Any]]) -> None:
     """Display groups in CSV format."""
     import csv
     import sys
 
     writer = csv.writer(sys.stdout)
-    writer.writerow(["ID", "Name", "Member Count", "Members"])
-
-    for group in groups:
-        members = group.get("members", [])
-        member_emails = [m.get("value", "") for m in members]
-        writer.writerow(
-            [
-                group.get("id", ""),
-                group.get("displayName", ""),
-                len(members),
-                ";".join(member_emails),
-            ]
-        )
+    writer.writerow(GROUP_CSV_HEADER)
+    writer.writerows(_group_csv_rows(groups))
 
 
 def save_groups_to_file(groups: List[Dict[str, Any]], filepath: Path, team: str) -> None:
@@ -453,19 +513,8 @@ def save_groups_to_file(groups: List[Dict[str, Any]], filepath: Path, team: str)
     if filepath.suffix.lower() == ".csv":
         with open(filepath, "w", newline="") as f:
             writer = csv.writer(f)
-            writer.writerow(["ID", "Name", "Member Count", "Members"])
-
-            for group in groups:
-                members = group.get("members", [])
-                member_emails = [m.get("value", "") for m in members]
-                writer.writerow(
-                    [
-                        group.get("id", ""),
-                        group.get("displayName", ""),
-                        len(members),
-                        ";".join(member_emails),
-                    ]
-                )
+            writer.writerow(GROUP_CSV_HEADER)
+            writer.writerows(_group_csv_rows(groups))
     else:
         # Default to YAML
         output = {
@@ -477,7 +526,9 @@ def save_groups_to_file(groups: List[Dict[str, Any]], filepath: Path, team: str)
 
 
 def plan_group_sync(
-    desired_groups: List[Dict[str, Any]], existing_groups: Dict[str, Dict[str, Any]]
+    desired_groups: List[Dict[str, Any]],
+    existing_groups: Dict[str, Dict[str, Any]],
+    user_index: Optional[Dict[str, str]] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Plan sync operations for groups."""
     operations: Dict[str, List[Dict[str, Any]]] = {
@@ -495,13 +546,15 @@ def plan_group_sync(
         if name in existing_groups:
             # Check if update is needed
             existing = existing_groups[name]
-            if needs_update(group, existing):
+            diff = diff_members(group, existing, user_index)
+            if diff["added"] or diff["removed"]:
                 operations["update"].append(
                     {
                         "id": existing["id"],
                         "name": name,
                         "desired": group,
                         "existing": existing,
+                        "diff": diff,
                     }
                 )
         else:
@@ -515,13 +568,44 @@ def plan_group_sync(
     return operations
 
 
-def needs_update(desired: Dict[str, Any], existing: Dict[str, Any]) -> bool:
-    """Check if a group needs updating."""
-    # Compare members
-    desired_members = set(m["email"] for m in desired.get("members", []))
+def diff_members(
+    desired: Dict[str, Any],
+    existing: Dict[str, Any],
+    user_index: Optional[Dict[str, str]] = None,
+) -> Dict[str, Set[str]]:
+    """
+    Compute the member changes needed to bring a group to its desired state.
+
+    Returns the desired member emails missing from the group under ``added`` and
+    the existing member values that are no longer wanted under ``removed``.
+    When ``user_index`` is given, emails are compared as SCIM user IDs, and emails
+    missing from the index are left out since they can't be added.
+    """
+    desired_by_value = {}
+    for member in desired.get("members", []):
+        email = member["email"]
+        if user_index is None:
+            desired_by_value[email] = email
+        elif email.lower() in user_index:
+            desired_by_value[user_index[email.lower()]] = email
     existing_members = set(m.get("value", "") for m in existing.get("members", []))
 
-    return desired_members != existing_members
+    return {
+        "added": {
+            email for value, email in desired_by_value.items() if value not in existing_members
+        },
+        "removed": existing_members - desired_by_value.keys(),
+    }
+
+
+def needs_update(
+    desired: Dict[str, Any],
+    existing: Dict[str, Any],
+    user_index: Optional[Dict[str, str]] = None,
+) -> bool:
+    """Check if a group needs updating."""
+    diff = diff_members(desired, existing, user_index)
+    return bool(diff["added"] or diff["removed"])
 
 
 def display_sync_plan(operations: Dict[str, List[Dict[str, Any]]], dry_run: bool) -> None:
@@ -534,7 +618,7 @@ def display_sync_plan(operations: Dict[str, List[Dict[str, Any]]], dry_run: bool
     if operations["create"]:
         lines.append(Text(f"\n{EMOJIS['plus']} Groups to create:", style="green"))
         for group in operations["create"]:
-            member_count = len(group.get("members", []))
+            member_count = len(group.get("members") or ())
             lines.append(Text(f"  • {group['name']} ({member_count} members)", style="dim"))
 
     if operations["update"]:
@@ -552,7 +636,7 @@ def display_sync_plan(operations: Dict[str, List[Dict[str, Any]]], dry_run: bool
 
     title = "Sync Plan (DRY RUN)" if dry_run else "Sync Plan"
     panel = Panel(
-        Text.from_markup("\n".join(str(line) for line in lines)),
+        Text("\n").join(lines),
         title=title,
         border_style=RICH_STYLES["brand"],
     )
@@ -560,9 +644,32 @@ def display_sync_plan(operations: Dict[str, List[Dict[str, Any]]], dry_run: bool
 
 
 def execute_group_sync(
-    client, team: str, operations: Dict[str, List[Dict[str, Any]]]
+    client,
+    team: str,
+    operations: Dict[str, List[Dict[str, Any]]],
+    user_index: Optional[Dict[str, str]] = None,
+    porcelain: bool = False,
 ) -> Dict[str, Any]:
-    """Execute the group sync operations."""
+    """
+    Execute the group sync operations.
+
+    When ``user_index`` is given, member emails are resolved to SCIM user IDs;
+    emails missing from the index are reported and left out. Updates only send
+    the member additions and removals rather than replacing the whole list.
+    """
+
+    def group_members(name: str, emails: List[str]) -> List[Dict[str, str]]:
+        if user_index is None:
+            return [{"value": email, "display": email} for email in emails]
+        members, missing = resolve_members(emails, user_index)
+        if missing and not porcelain:
+            console.print(
+                f"{EMOJIS['warning']} Skipping unknown members of group {name}: "
+                f"{', '.join(missing)}",
+                style=RICH_STYLES["warning"],
+            )
+        return members
+
     results = {
         "created": 0,
         "updated": 0,
@@ -577,7 +684,11 @@ def execute_group_sync(
             group_data = {
                 "schemas": ["urn:ietf:params:scim:schemas:core:2.0:Group"],
                 "displayName": group["name"],
-                "members": [],  # Will need to add members in a separate step
+                "members": (
+                    group_members(group["name"], [m["email"] for m in group.get("members", [])])
+                    if user_index is not None
+                    else []
+                ),
             }
             create_scim_group(client, team, group_data)
             results["created"] += 1
@@ -588,19 +699,26 @@ def execute_group_sync(
     # Update existing groups
     for op in operations["update"]:
         try:
-            # Prepare update data using SCIM PATCH format
+            diff = op.get("diff") or diff_members(op["desired"], op["existing"], user_index)
+
+            # Prepare a single SCIM PATCH carrying only the member deltas
+            patch_ops: List[Dict[str, Any]] = []
+            added = [
+                m["email"] for m in op["desired"].get("members", []) if m["email"] in diff["added"]
+            ]
+            members = group_members(op["name"], added) if added else []
+            if members:
+                patch_ops.append({"op": "add", "path": "members", "value": members})
+            patch_ops.extend(
+                {"op": "remove", "path": f'members[value eq "{value}"]'}
+                for value in sorted(diff["removed"])
+            )
+            if not patch_ops:
+                continue
+
             group_data = {
                 "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
-                "Operations": [
-                    {
-                        "op": "replace",
-                        "path": "members",
-                        "value": [
-                            {"value": m["email"], "display": m["email"]}
-                            for m in op["desired"].get("members", [])
-                        ],
-                    }
-                ],
+                "Operations": patch_ops,
             }
             update_scim_group(client, team, op["id"], group_data)
             results["updated"] += 1
@@ -624,6 +742,7 @@ def execute_group_sync(
 def display_sync_results(results: Dict[str, Any]) -> None:
     """Display the results of sync operations."""
     from rich.panel import Panel
+    from rich.text import Text
 
     lines = []
 
@@ -646,7 +765,7 @@ def display_sync_results(results: Dict[str, Any]) -> None:
     lines.append(summary)
 
     panel = Panel(
-        "\n".join(lines),
+        Text("\n".join(lines)),
         title="Sync Results",
         border_style="green" if results["errors"] == 0 else "yellow",
     )
@@ -13,12 +13,13 @@ import typer
 import yaml
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.output.console import console
 from sup.output.styles import EMOJIS, RICH_STYLES
 
 _logger = logging.getLogger(__name__)
 
-app = typer.Typer(help="Manage asset ownership", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["ownership"], no_args_is_help=True)
 
 RESOURCE_TYPES = ["dataset", "chart", "dashboard"]
 
@@ -134,13 +134,7 @@ def push_assets(
 
     # Resolve target workspace URL
     preset_client = SupPresetClient.from_context(ctx, silent=True)
-    workspaces = preset_client.get_all_workspaces(silent=True)
-
-    target_workspace = None
-    for ws in workspaces:
-        if ws.get("id") == target_workspace_id:
-            target_workspace = ws
-            break
+    target_workspace = preset_client.get_workspace(target_workspace_id, silent=True)
 
     if not target_workspace:
         console.print(
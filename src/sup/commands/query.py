@@ -13,12 +13,13 @@ from rich.panel import Panel
 from rich.syntax import Syntax
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.output.console import console
 from sup.output.formatters import display_porcelain_list
 from sup.output.styles import COLORS, EMOJIS, RICH_STYLES
 from sup.output.tables import display_saved_queries_table
 
-app = typer.Typer(help="Manage saved queries", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["query"], no_args_is_help=True)
 
 
 @app.command("list")
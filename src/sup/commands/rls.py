@@ -11,10 +11,11 @@ import typer
 import yaml
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.output.console import console
 from sup.output.styles import EMOJIS, RICH_STYLES
 
-app = typer.Typer(help="Manage row-level security rules", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["rls"], no_args_is_help=True)
 
 
 @app.command("pull")
@@ -11,11 +11,12 @@ import typer
 # Removed: from rich.console import Console
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.output.console import console
 from sup.output.styles import EMOJIS, RICH_STYLES
 
 # Create SQL app for better sectioning control
-app = typer.Typer(help="🔍 Get direct access to your data", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["sql"], no_args_is_help=True)
 
 
 @app.callback(
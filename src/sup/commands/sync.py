@@ -6,19 +6,41 @@ Handles complex workflows like pulling from one workspace and pushing to multipl
 targets with environment-specific customization.
 """
 
+import operator
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
+import click
 import typer
-
-# Removed: from rich.console import Console
+from typer.core import TyperGroup
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.commands.template_params import DisableJinjaOption, LoadEnvOption, TemplateOptions
-from sup.config.sync import SyncConfig, validate_sync_folder
 from sup.output.console import console
 from sup.output.styles import EMOJIS, RICH_STYLES
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+    from sup.config.sync import AssetSelection, SyncConfig
+
+
+# Asset types handled by sync, in dependency order
+_ASSET_TYPES = ("databases", "datasets", "charts", "dashboards", "themes")
+
+# Fetches the selection of every asset type from a source's assets in one call
+_get_asset_selections = operator.attrgetter(*_ASSET_TYPES)
+
+# Resource names used by the Superset API for each asset type
+_ASSET_SINGULAR = {
+    "databases": "database",
+    "datasets": "dataset",
+    "charts": "chart",
+    "dashboards": "dashboard",
+    "themes": "theme",
+}
+
 
 def format_sync_help():
     """Create beautifully formatted help text for sync command group."""
@@ -45,7 +67,20 @@ def format_sync_help():
 • [bold]Step 3:[/bold] [cyan]sup sync run ./my_sync[/cyan] - Execute synchronization"""  # noqa: E501
 
 
-app = typer.Typer(help=format_sync_help(), rich_markup_mode="rich", no_args_is_help=True)
+class SyncGroup(TyperGroup):
+    """Command group that only builds the full sync help when it is shown."""
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self.help = format_sync_help()
+        super().format_help(ctx, formatter)
+
+
+app = typer.Typer(
+    cls=SyncGroup,
+    help=COMMAND_SUMMARIES["sync"],
+    rich_markup_mode="rich",
+    no_args_is_help=True,
+)
 
 
 @app.command("run")
@@ -93,6 +128,8 @@ def run_sync(
         sup sync run ./multi_customer_sync --target customer_a # Push to specific target
         sup sync run ./multi_customer_sync --dry-run          # Preview actions
     """
+    from sup.config.sync import SyncConfig, validate_sync_folder
+
     if pull_only and push_only:
         if not porcelain:
             console.print(
@@ -103,6 +140,7 @@ def run_sync(
 
     # Validate and load sync configuration
     sync_path = Path(sync_folder).resolve()
+    config_path = sync_path / "sync_config.yml"
     if not validate_sync_folder(sync_path):
         if not porcelain:
             console.print(
@@ -113,7 +151,7 @@ def run_sync(
         raise typer.Exit(1)
 
     try:
-        sync_config = SyncConfig.from_yaml(sync_path / "sync_config.yml")
+        sync_config = SyncConfig.from_yaml(config_path)
     except Exception as e:
         if not porcelain:
             console.print(
@@ -126,13 +164,9 @@ def run_sync(
     selected_targets = sync_config.targets
     if target:
         target_config = sync_config.get_target_by_name(target)
-        if not target_config:
+        if not target_config and target.isdecimal():
             # Try by workspace ID
-            try:
-                target_workspace_id = int(target)
-                target_config = sync_config.get_target_by_workspace_id(target_workspace_id)
-            except ValueError:
-                pass
+            target_config = sync_config.get_target_by_workspace_id(int(target))
 
         if not target_config:
             if not porcelain:
@@ -212,6 +246,8 @@ def create_sync(
         sup sync create ./my_sync --source 123 --targets 456,789
         sup sync create ./customer_sync --source 100 --targets 200,300,400
     """
+    from sup.config.sync import SyncConfig
+
     sync_path = Path(sync_folder).resolve()
 
     # Check if folder exists
@@ -223,15 +259,17 @@ def create_sync(
         console.print("Use --force to overwrite")
         raise typer.Exit(1)
 
-    # Parse target workspace IDs
-    try:
-        target_ids = [int(id_.strip()) for id_ in target_workspace_ids.split(",")]
-    except ValueError as e:
-        console.print(
-            f"{EMOJIS['error']} Invalid target workspace IDs: {e}",
-            style=RICH_STYLES["error"],
-        )
-        raise typer.Exit(1)
+    # Parse target workspace IDs, reporting the first one that isn't a number
+    target_ids = []
+    for position, id_ in enumerate(target_workspace_ids.split(","), start=1):
+        try:
+            target_ids.append(int(id_))
+        except ValueError:
+            console.print(
+                f"{EMOJIS['error']} Invalid target workspace ID #{position}: '{id_.strip()}'",
+                style=RICH_STYLES["error"],
+            )
+            raise typer.Exit(1)
 
     try:
         # Create sync configuration
@@ -240,14 +278,11 @@ def create_sync(
             target_workspace_ids=target_ids,
         )
 
-        # Create folder structure
-        sync_path.mkdir(parents=True, exist_ok=True)
+        # Create subdirectories for assets; the first one also creates the
+        # sync and assets folders
         assets_folder = sync_config.assets_folder(sync_path)
-        assets_folder.mkdir(exist_ok=True)
-
-        # Create subdirectories for assets
-        for asset_type in ["charts", "dashboards", "datasets", "databases", "themes"]:
-            (assets_folder / asset_type).mkdir(exist_ok=True)
+        for asset_type in _ASSET_TYPES:
+            (assets_folder / asset_type).mkdir(parents=True, exist_ok=True)
 
         # Save configuration
         config_file = sync_config.sync_config_path(sync_path)
@@ -283,6 +318,10 @@ def validate_sync(
         str,
         typer.Argument(help="Path to sync folder to validate"),
     ],
+    porcelain: Annotated[
+        bool,
+        typer.Option("--porcelain", help="No output, only the exit code"),
+    ] = False,
 ) -> None:
     """
     Validate a sync configuration folder.
@@ -292,44 +331,59 @@ def validate_sync(
 
     Examples:
         sup sync validate ./my_sync
+        sup sync validate ./my_sync --porcelain   # For scripts, check the exit code
     """
-    sync_path = Path(sync_folder).resolve()
-
-    if not sync_path.exists():
-        console.print(
-            f"{EMOJIS['error']} Sync folder does not exist: {sync_path}",
-            style=RICH_STYLES["error"],
-        )
-        raise typer.Exit(1)
+    from sup.config.sync import SyncConfig
 
+    sync_path = Path(sync_folder).resolve()
     config_path = sync_path / "sync_config.yml"
-    if not config_path.exists():
-        console.print(
-            f"{EMOJIS['error']} sync_config.yml not found in {sync_path}",
-            style=RICH_STYLES["error"],
-        )
-        raise typer.Exit(1)
 
     try:
         sync_config = SyncConfig.from_yaml(config_path)
-        console.print(
-            f"{EMOJIS['success']} Sync configuration is valid",
-            style=RICH_STYLES["success"],
-        )
+        if not porcelain:
+            console.print(
+                f"{EMOJIS['success']} Sync configuration is valid",
+                style=RICH_STYLES["success"],
+            )
 
-        # Show configuration summary
-        display_sync_summary(sync_config, sync_config.targets, False, False, False, sync_path)
+            # Show configuration summary
+            display_sync_summary(sync_config, sync_config.targets, False, False, False, sync_path)
 
+    except FileNotFoundError:
+        # Only look at the folder when the config is missing, to explain why
+        if porcelain:
+            raise typer.Exit(1)
+        if not sync_path.exists():
+            console.print(
+                f"{EMOJIS['error']} Sync folder does not exist: {sync_path}",
+                style=RICH_STYLES["error"],
+            )
+        else:
+            console.print(
+                f"{EMOJIS['error']} sync_config.yml not found in {sync_path}",
+                style=RICH_STYLES["error"],
+            )
+        raise typer.Exit(1)
     except Exception as e:
-        console.print(
-            f"{EMOJIS['error']} Invalid sync configuration: {e}",
-            style=RICH_STYLES["error"],
-        )
+        if not porcelain:
+            console.print(
+                f"{EMOJIS['error']} Invalid sync configuration: {e}",
+                style=RICH_STYLES["error"],
+            )
         raise typer.Exit(1)
 
 
+def _selected_assets(assets) -> List[Tuple[str, "AssetSelection"]]:
+    """Return the configured ``(asset_type, selection)`` pairs of a source."""
+    return [
+        (asset_type, asset_config)
+        for asset_type, asset_config in zip(_ASSET_TYPES, _get_asset_selections(assets))
+        if asset_config
+    ]
+
+
 def display_sync_summary(
-    sync_config: SyncConfig,
+    sync_config: "SyncConfig",
     targets: List,
     pull_only: bool,
     push_only: bool,
@@ -337,10 +391,8 @@ def display_sync_summary(
     sync_path: Path,
 ) -> None:
     """Display a summary of the sync operation."""
-    console.print(
-        f"\n{EMOJIS['sync']} Sync Operation Summary",
-        style=RICH_STYLES["header"],
-    )
+    from rich.console import Group
+    from rich.text import Text
 
     # Operation type
     if pull_only:
@@ -353,36 +405,52 @@ def display_sync_summary(
     if dry_run:
         operation += " (Dry Run)"
 
-    console.print(f"🔄 Operation: {operation}")
-    console.print(f"📁 Sync folder: {sync_path}")
-
-    # Source info
-    console.print("\n📤 Source:")
-    console.print(f"   Workspace ID: {sync_config.source.workspace_id}")
+    lines = [
+        f"🔄 Operation: {operation}",
+        f"📁 Sync folder: {sync_path}",
+        # Source info
+        "\n📤 Source:",
+        f"   Workspace ID: {sync_config.source.workspace_id}",
+    ]
 
     # Asset selection summary
     assets = sync_config.source.assets
     asset_summary = []
-    for asset_type in ["charts", "dashboards", "datasets", "databases", "themes"]:
-        asset_config = getattr(assets, asset_type)
-        if asset_config:
-            summary = f"{asset_type}: {asset_config.selection}"
-            if asset_config.selection == "ids":
-                summary += f" ({len(asset_config.ids or [])} items)"
-            asset_summary.append(summary)
+    for asset_type, asset_config in _selected_assets(assets):
+        summary = f"{asset_type}: {asset_config.selection}"
+        if asset_config.selection == "ids":
+            summary += f" ({len(asset_config.ids or [])} items)"
+        asset_summary.append(summary)
 
     if asset_summary:
-        console.print(f"   Assets: {', '.join(asset_summary)}")
+        lines.append(f"   Assets: {', '.join(asset_summary)}")
 
     # Targets info
-    console.print(f"\n📥 Targets ({len(targets)}):")
+    lines.append(f"\n📥 Targets ({len(targets)}):")
     for target in targets:
         name_display = f" ({target.name})" if target.name else ""
         overwrite = target.get_effective_overwrite(sync_config.target_defaults)
-        console.print(f"   • {target.workspace_id}{name_display} [overwrite: {overwrite}]")
+        lines.append(f"   • {target.workspace_id}{name_display} \\[overwrite: {overwrite}]")
+
+    # Rendered with a single print, so the markup is parsed and written once
+    console.print(
+        Group(
+            Text(f"\n{EMOJIS['sync']} Sync Operation Summary", style=RICH_STYLES["header"]),
+            "\n".join(lines),
+        ),
+    )
 
 
-def execute_pull(sync_config: SyncConfig, sync_path: Path, dry_run: bool, porcelain: bool) -> None:
+# Shared empty selection, so asset types without ids don't allocate a set
+_NO_IDS: FrozenSet[int] = frozenset()
+
+# Upper bound on the number of asset types exported concurrently
+MAX_PULL_WORKERS = 8
+
+
+def execute_pull(
+    sync_config: "SyncConfig", sync_path: Path, dry_run: bool, porcelain: bool
+) -> None:
     """Execute the pull operation from source workspace."""
     if not porcelain:
         console.print(
@@ -394,13 +462,11 @@ def execute_pull(sync_config: SyncConfig, sync_path: Path, dry_run: bool, porcel
         # Show what would be pulled for each asset type
         asset_summary = []
         assets = sync_config.source.assets
-        for asset_type in ["databases", "datasets", "charts", "dashboards", "themes"]:
-            asset_config = getattr(assets, asset_type)
-            if asset_config:
-                summary = f"{asset_type}: {asset_config.selection}"
-                if asset_config.selection == "ids":
-                    summary += f" ({len(asset_config.ids or [])} items)"
-                asset_summary.append(summary)
+        for asset_type, asset_config in _selected_assets(assets):
+            summary = f"{asset_type}: {asset_config.selection}"
+            if asset_config.selection == "ids":
+                summary += f" ({len(asset_config.ids or [])} items)"
+            asset_summary.append(summary)
 
         if not porcelain:
             console.print("   [DRY RUN] Would pull assets to assets/ folder:")
@@ -408,13 +474,10 @@ def execute_pull(sync_config: SyncConfig, sync_path: Path, dry_run: bool, porcel
                 console.print(f"     • {summary}")
         return
 
-    # Import the export functionality from legacy CLI
-    from zipfile import ZipFile as _ZipFile
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    from preset_cli.cli.superset.export import export_resource
     from sup.clients.superset import SupSupersetClient
     from sup.config.settings import SupContext
-    from sup.lib import remove_root, safe_extract_path
 
     try:
         # Get current context and client
@@ -430,22 +493,19 @@ def execute_pull(sync_config: SyncConfig, sync_path: Path, dry_run: bool, porcel
         # Process each asset type
         assets = sync_config.source.assets
         total_files = 0
+        pulls = []
 
-        for asset_type in ["databases", "datasets", "charts", "dashboards", "themes"]:
-            asset_config = getattr(assets, asset_type)
-            if not asset_config:
-                continue
-
+        for asset_type, asset_config in _selected_assets(assets):
             if not porcelain:
                 console.print(f"   Pulling {asset_type}...")
 
             # Get asset IDs based on selection
             if asset_config.selection == "all":
                 # Get all assets of this type
-                resources = client.client.get_resources(asset_type.rstrip("s"))  # Remove plural
-                requested_ids = set(resource["id"] for resource in resources)
+                resources = client.client.get_resources(_ASSET_SINGULAR[asset_type])
+                requested_ids = {resource["id"] for resource in resources}
             elif asset_config.selection == "ids":
-                requested_ids = set(asset_config.ids or [])
+                requested_ids = set(asset_config.ids) if asset_config.ids else _NO_IDS
             else:
                 # TODO: Support other selection types (mine, filter)
                 if not porcelain:
@@ -459,45 +519,52 @@ def execute_pull(sync_config: SyncConfig, sync_path: Path, dry_run: bool, porcel
                     console.print(f"     No {asset_type} to pull")
                 continue
 
-            if asset_type == "themes":
-                # Themes use export_zip directly (no legacy export_resource support)
-                zip_buffer = client.client.export_zip("theme", list(requested_ids))
-
-                resolved_base = assets_path.resolve()
-                with _ZipFile(zip_buffer) as bundle:
-                    for name in bundle.namelist():
-                        if name.endswith("/"):
-                            continue  # skip directory entries
-                        rel = remove_root(name)
-                        # Only extract theme YAML files — skip metadata.yaml and
-                        # any other bundle-level files to avoid collisions with
-                        # metadata written by other asset types in the same sync run.
-                        if not Path(rel).parts or Path(rel).parts[0] != "themes":
-                            continue
-                        target = safe_extract_path(resolved_base, rel)
-                        target.parent.mkdir(parents=True, exist_ok=True)
-                        try:
-                            content = bundle.read(name).decode("utf-8")
-                        except UnicodeDecodeError as exc:
-                            raise ValueError(f"Non-UTF-8 content in theme export: {name}") from exc
-                        target.write_text(content, encoding="utf-8", newline="")
-            else:
-                # Use the legacy export_resource function with overwrite=True
-                export_resource(
-                    resource_name=asset_type.rstrip("s"),  # Remove plural: charts -> chart
-                    requested_ids=requested_ids,
-                    root=assets_path,
-                    client=client.client,  # Use underlying SupersetClient
-                    overwrite=True,  # Always overwrite in sync
-                    disable_jinja_escaping=False,
-                    skip_related=not asset_config.include_dependencies,
-                    force_unix_eol=False,
-                )
+            pulls.append((asset_type, asset_config, requested_ids))
 
-            total_files += len(requested_ids)
-
-            if not porcelain:
-                console.print(f"     Pulled {len(requested_ids)} {asset_type}")
+        # Each asset type is exported with its own requests, so run them side by side.
+        # Exports that include dependencies write the related assets' files too, and
+        # could clobber each other, so those keep the serial, dependency-ordered export.
+        serial = any(
+            asset_config.include_dependencies and asset_type != "themes"
+            for asset_type, asset_config, _ in pulls
+        )
+        if pulls and serial:
+            for asset_type, asset_config, requested_ids in pulls:
+                _pull_asset_type(
+                    client.client,  # Use underlying SupersetClient
+                    asset_type,
+                    asset_config,
+                    requested_ids,
+                    assets_path,
+                )
+                total_files += len(requested_ids)
+                if not porcelain:
+                    console.print(f"     Pulled {len(requested_ids)} {asset_type}")
+        elif pulls:
+            with ThreadPoolExecutor(max_workers=min(MAX_PULL_WORKERS, len(pulls))) as executor:
+                futures = {
+                    executor.submit(
+                        _pull_asset_type,
+                        client.client,  # Use underlying SupersetClient
+                        asset_type,
+                        asset_config,
+                        requested_ids,
+                        assets_path,
+                    ): (asset_type, len(requested_ids))
+                    for asset_type, asset_config, requested_ids in pulls
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception:
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+
+                    asset_type, count = futures[future]
+                    total_files += count
+                    if not porcelain:
+                        console.print(f"     Pulled {count} {asset_type}")
 
         if not porcelain:
             console.print(f"   Pull operation completed - {total_files} assets exported")
@@ -511,8 +578,62 @@ def execute_pull(sync_config: SyncConfig, sync_path: Path, dry_run: bool, porcel
         raise
 
 
+def _pull_asset_type(
+    client,
+    asset_type: str,
+    asset_config,
+    requested_ids: AbstractSet[int],
+    assets_path: Path,
+) -> None:
+    """Export the requested assets of one type into the assets folder."""
+    # Import the export functionality from legacy CLI
+    from zipfile import ZipFile as _ZipFile
+
+    from preset_cli.cli.superset.export import export_resource
+    from sup.lib import remove_root, safe_extract_path
+
+    if asset_type == "themes":
+        # Themes use export_zip directly (no legacy export_resource support)
+        zip_buffer = client.export_zip(_ASSET_SINGULAR[asset_type], list(requested_ids))
+
+        resolved_base = assets_path.resolve()
+        with _ZipFile(zip_buffer) as bundle:
+            for name in bundle.namelist():
+                if name.endswith("/"):
+                    continue  # skip directory entries
+                rel = remove_root(name)
+                # Only extract theme YAML files — skip metadata.yaml and
+                # any other bundle-level files to avoid collisions with
+                # metadata written by other asset types in the same sync run.
+                if not Path(rel).parts or Path(rel).parts[0] != "themes":
+                    continue
+                target = safe_extract_path(resolved_base, rel)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    content = bundle.read(name).decode("utf-8")
+                except UnicodeDecodeError as exc:
+                    raise ValueError(f"Non-UTF-8 content in theme export: {name}") from exc
+                target.write_text(content, encoding="utf-8", newline="")
+    else:
+        # Use the legacy export_resource function with overwrite=True
+        export_resource(
+            resource_name=_ASSET_SINGULAR[asset_type],
+            requested_ids=requested_ids,
+            root=assets_path,
+            client=client,
+            overwrite=True,  # Always overwrite in sync
+            disable_jinja_escaping=False,
+            skip_related=not asset_config.include_dependencies,
+            force_unix_eol=False,
+        )
+
+
+# Upper bound on the number of target workspaces rendered concurrently
+MAX_PUSH_WORKERS = 8
+
+
 def execute_push(
-    sync_config: SyncConfig,
+    sync_config: "SyncConfig",
     targets: List,
     sync_path: Path,
     dry_run: bool,
@@ -520,20 +641,9 @@ def execute_push(
 ) -> None:
     """Execute push operations to target workspaces."""
     import logging
-    from pathlib import Path as PathlibPath
+    from concurrent.futures import ThreadPoolExecutor
 
-    import yaml
-
-    from preset_cli.cli.superset.sync.native.command import (
-        ResourceType,
-        import_resources_individually,
-        is_yaml_config,
-        load_user_modules,
-        raise_helper,
-        render_yaml,
-    )
-    from sup.clients.superset import SupSupersetClient
-    from sup.config.settings import SupContext
+    from sup.config.paths import get_env_flag
 
     _logger = logging.getLogger(__name__)
 
@@ -547,195 +657,365 @@ def execute_push(
                 style=RICH_STYLES["warning"],
             )
 
-    for target in targets:
-        name_display = f" ({target.name})" if target.name else ""
+    # The asset files, their compiled templates and the user functions are the same
+    # for every target, only the Jinja context differs
+    asset_files: List[Tuple[Path, Path, Optional[Path]]] = []
+    templates: Dict[Path, "Template"] = {}
+    shared_jinja_env: Dict[str, Any] = {}
+    if not dry_run:
+        assets_path = sync_config.assets_folder(sync_path)
+        if assets_path.exists():
+            from preset_cli.cli.superset.sync.native.command import (
+                load_user_modules,
+                raise_helper,
+            )
 
-        if not porcelain:
-            console.print(
-                f"\n{EMOJIS['upload']} Pushing to workspace {target.workspace_id}{name_display}...",
-                style=RICH_STYLES["info"],
+            asset_files = _find_push_assets(assets_path)
+            shared_jinja_env = {
+                "functions": load_user_modules(assets_path / "functions"),
+                "raise": raise_helper,
+            }
+
+    capture_import_output = get_env_flag("capture_import_output")
+
+    if dry_run or len(targets) <= 1:
+        for target in targets:
+            rendered = _render_target(
+                target,
+                sync_config,
+                sync_path,
+                dry_run,
+                porcelain,
+                asset_files,
+                templates,
+                shared_jinja_env,
+                console.print,
             )
+            if rendered is not None:
+                _import_target(
+                    target,
+                    sync_config,
+                    sync_path,
+                    porcelain,
+                    *rendered,
+                    console.print,
+                    capture_import_output,
+                )
+        return
+
+    # Client setup and rendering overlap across targets, with each target's lines
+    # buffered until its import starts. The imports then run one at a time in
+    # target order, streaming their output like a serial push: they share the
+    # debug bundle and the progress log in the working directory, and the first
+    # failure stops the remaining targets.
+    buffers: List[List[Tuple[Tuple[Any, ...], Dict[str, Any]]]] = [[] for _ in targets]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PUSH_WORKERS, len(targets))) as executor:
+        futures = [
+            executor.submit(
+                _render_target,
+                target,
+                sync_config,
+                sync_path,
+                dry_run,
+                porcelain,
+                asset_files,
+                templates,
+                shared_jinja_env,
+                lambda *args, lines=lines, **kwargs: lines.append((args, kwargs)),
+            )
+            for target, lines in zip(targets, buffers)
+        ]
+        try:
+            for target, lines, future in zip(targets, buffers, futures):
+                try:
+                    client, configs = future.result()
+                finally:
+                    for args, kwargs in lines:
+                        console.print(*args, **kwargs)
+
+                _import_target(
+                    target,
+                    sync_config,
+                    sync_path,
+                    porcelain,
+                    client,
+                    configs,
+                    console.print,
+                    capture_import_output,
+                )
+        finally:
+            for pending in futures:
+                pending.cancel()
 
-        if dry_run:
+
+def _find_push_assets(assets_path: Path) -> List[Tuple[Path, Path, Optional[Path]]]:
+    """
+    Find the YAML assets to push, with their relative path and overrides file.
+    """
+    import os
+
+    from preset_cli.cli.superset.sync.native.command import is_yaml_config
+
+    asset_files = []
+    queue = [(str(assets_path), Path())]
+
+    while queue:
+        directory, relative_dir = queue.pop()
+        # ``scandir`` entries carry their file type, so no extra stat per path
+        with os.scandir(directory) as it:
+            entries = list(it)
+        names = {entry.name for entry in entries}
+
+        for entry in entries:
+            relative_path = relative_dir / entry.name
+
+            if entry.is_dir():
+                # Skip theme files — push doesn't support themes yet
+                # TODO(theme-push): remove when theme sync push is implemented
+                if not entry.name.startswith(".") and entry.name != "themes":
+                    queue.append((entry.path, relative_path))
+            elif is_yaml_config(relative_path):
+                # Skip metadata.yaml and tags.yaml - they'll be generated by import_resources
+                if entry.name in ("metadata.yaml", "tags.yaml"):
+                    continue
+
+                path_name = Path(entry.path)
+                overrides_name = f"{path_name.stem}.overrides{path_name.suffix}"
+                overrides_path = (
+                    path_name.with_name(overrides_name) if overrides_name in names else None
+                )
+                asset_files.append((path_name, relative_path, overrides_path))
+
+    return asset_files
+
+
+def _render_target(
+    target,
+    sync_config: "SyncConfig",
+    sync_path: Path,
+    dry_run: bool,
+    porcelain: bool,
+    asset_files: List[Tuple[Path, Path, Optional[Path]]],
+    templates: Dict[Path, "Template"],
+    shared_jinja_env: Dict[str, Any],
+    emit: Callable[..., None],
+) -> Optional[Tuple[Any, Dict[Path, Any]]]:
+    """
+    Set up the client for a single target and render the discovered assets for it.
+
+    Returns the client and the rendered configs, or ``None`` on a dry run.
+    """
+    from pathlib import Path as PathlibPath
+
+    from preset_cli.cli.superset.sync.native.command import load_template, render_yaml
+    from preset_cli.lib import dict_merge
+    from sup.clients.superset import SupSupersetClient
+    from sup.config.settings import SupContext
+
+    name_display = f" ({target.name})" if target.name else ""
+
+    if not porcelain:
+        emit(
+            f"\n{EMOJIS['upload']} Pushing to workspace {target.workspace_id}{name_display}...",
+            style=RICH_STYLES["info"],
+        )
+
+    if dry_run:
+        if not porcelain:
             context = target.get_effective_jinja_context(sync_config.target_defaults)
-            if not porcelain:
-                console.print(f"   [DRY RUN] Would push with Jinja context: {context}")
-            continue
+            emit(f"   [DRY RUN] Would push with Jinja context: {context}")
+        return
 
-        try:
-            # Get client for target workspace
-            ctx = SupContext()
-            if not porcelain:
-                console.print(f"   🎯 Target workspace ID from config: {target.workspace_id}")
-            client = SupSupersetClient.from_context(ctx, target.workspace_id)
+    try:
+        # Get client for target workspace
+        ctx = SupContext()
+        if not porcelain:
+            emit(f"   🎯 Target workspace ID from config: {target.workspace_id}")
+        client = SupSupersetClient.from_context(ctx, target.workspace_id)
 
-            # Verify we're using the right workspace
-            if not porcelain:
-                console.print(f"   🔗 Client base URL: {client.client.baseurl}")
+        # Verify we're using the right workspace
+        if not porcelain:
+            emit(f"   🔗 Client base URL: {client.client.baseurl}")
 
-            # Get Jinja context for this target
-            # Get assets folder from sync config
-            assets_path = sync_config.assets_folder(sync_path)
+        # Get Jinja context for this target
+        # Get assets folder from sync config
+        assets_path = sync_config.assets_folder(sync_path)
 
-            if not assets_path.exists():
-                raise Exception(f"Assets folder not found: {assets_path}")
+        if not assets_path.exists():
+            raise Exception(f"Assets folder not found: {assets_path}")
 
-            jinja_env = dict(target.get_effective_jinja_context(sync_config.target_defaults))
-            jinja_env["instance"] = client.client.baseurl
-            jinja_env["functions"] = load_user_modules(assets_path / "functions")
-            jinja_env["raise"] = raise_helper
+        jinja_env = {
+            **target.get_effective_jinja_context(sync_config.target_defaults),
+            "instance": client.client.baseurl,
+            **shared_jinja_env,
+        }
 
-            # Read all YAML files and render with Jinja2
-            configs = {}
-            queue = [assets_path]
+        def render(path: Path) -> Dict[str, Any]:
+            # Each file is read and compiled by the first target that needs it
+            if path not in templates:
+                templates[path] = load_template(path)
+            return render_yaml(path, jinja_env, templates[path])
 
-            while queue:
-                path_name = queue.pop()
-                relative_path = path_name.relative_to(assets_path)
+        # Render the discovered YAML files with this target's Jinja context
+        configs = {}
+        for path_name, relative_path, overrides_path in asset_files:
+            config = render(path_name)
 
-                if path_name.is_dir() and not path_name.stem.startswith("."):
-                    queue.extend(path_name.glob("*"))
-                elif is_yaml_config(relative_path):
-                    # Skip metadata.yaml and tags.yaml - they'll be generated by import_resources
-                    if path_name.name in ("metadata.yaml", "tags.yaml"):
-                        continue
+            # Handle overrides if they exist
+            if overrides_path is not None:
+                overrides = render(overrides_path)
+                dict_merge(config, overrides)
 
-                    # Skip theme files — push doesn't support themes yet
-                    # TODO(theme-push): remove when theme sync push is implemented
-                    if "themes" in relative_path.parts:
-                        continue
+            configs[PathlibPath("bundle") / relative_path] = config
+    except Exception as e:
+        if not porcelain:
+            emit(
+                f"{EMOJIS['error']} Push to {target.workspace_id} failed: {e}",
+                style=RICH_STYLES["error"],
+            )
+        raise
 
-                    # Render YAML with Jinja context
-                    config = render_yaml(path_name, jinja_env)
+    return client, configs
 
-                    # Handle overrides if they exist
-                    overrides_path = path_name.with_suffix(".overrides" + path_name.suffix)
-                    if overrides_path.exists():
-                        overrides = render_yaml(overrides_path, jinja_env)
-                        from preset_cli.lib import dict_merge
 
-                        dict_merge(config, overrides)
+def _import_target(
+    target,
+    sync_config: "SyncConfig",
+    sync_path: Path,
+    porcelain: bool,
+    client,
+    configs: Dict[Path, Any],
+    emit: Callable[..., None],
+    capture_import_output: bool,
+) -> None:
+    """Import the rendered assets into a single target workspace."""
+    from functools import partial
 
-                    configs[PathlibPath("bundle") / relative_path] = config
+    import yaml
 
-            # Get overwrite setting for this target
-            overwrite = target.get_effective_overwrite(sync_config.target_defaults)
+    from preset_cli.cli.superset.sync.native.command import (
+        ResourceType,
+        import_resources_individually,
+    )
+    from sup.config.paths import get_env_flag
+    from sup.lib import YAML_DUMPER
 
-            # Import all assets as a bundle
-            if configs:
-                if not porcelain:
-                    console.print(f"   📦 Preparing to push {len(configs)} assets...")
-                    console.print(f"   🔧 Overwrite mode: {overwrite}")
+    try:
+        # Get overwrite setting for this target
+        overwrite = target.get_effective_overwrite(sync_config.target_defaults)
+
+        # Import all assets as a bundle
+        if configs:
+            if not porcelain:
+                emit(f"   📦 Preparing to push {len(configs)} assets...")
+                emit(f"   🔧 Overwrite mode: {overwrite}")
 
-                contents = {str(k): yaml.dump(v) for k, v in configs.items()}
+            # Log what we're pushing
+            if not porcelain:
+                asset_counts: Dict[str, int] = {}
+                for path in configs.keys():
+                    asset_type = path.parts[1] if len(path.parts) > 1 else "unknown"
+                    asset_counts[asset_type] = asset_counts.get(asset_type, 0) + 1
+                emit(f"   📊 Asset breakdown: {dict(asset_counts)}")
+
+            try:
+                # Debug: Save the bundle for inspection
+                if not porcelain and get_env_flag("debug_bundle"):
+                    debug_zip_path = sync_path / "debug_bundle.zip"
+                    emit(f"   🐛 Saving debug bundle to: {debug_zip_path}")
+
+                    from datetime import datetime, timezone
+                    from zipfile import ZIP_DEFLATED, ZipFile
+
+                    # Create the same bundle that will be sent
+                    debug_contents = {
+                        str(k): yaml.dump(v, Dumper=YAML_DUMPER) for k, v in configs.items()
+                    }
+                    debug_contents["bundle/metadata.yaml"] = yaml.dump(
+                        dict(
+                            version="1.0.0",
+                            type=ResourceType.ASSET.metadata_type,
+                            timestamp=datetime.now(tz=timezone.utc).isoformat(),
+                        ),
+                        Dumper=YAML_DUMPER,
+                    )
 
-                # Log what we're pushing
+                    with ZipFile(
+                        debug_zip_path,
+                        "w",
+                        compression=ZIP_DEFLATED,
+                        compresslevel=1,
+                    ) as bundle:
+                        for file_path, file_content in debug_contents.items():
+                            bundle.writestr(file_path, file_content.encode())
+
+                    emit(f"   📋 Bundle contains {len(debug_contents)} files")
+
+                # Try individual import for better error messages
                 if not porcelain:
-                    asset_counts: Dict[str, int] = {}
-                    for path in configs.keys():
-                        asset_type = path.parts[1] if len(path.parts) > 1 else "unknown"
-                        asset_counts[asset_type] = asset_counts.get(asset_type, 0) + 1
-                    console.print(f"   📊 Asset breakdown: {dict(asset_counts)}")
+                    emit("   🔍 Using split import for better error visibility...")
+                run_import = partial(
+                    import_resources_individually,
+                    configs,
+                    client.client,  # Use underlying SupersetClient
+                    overwrite,
+                    ResourceType.ASSET,
+                    continue_on_error=False,
+                )
 
-                try:
-                    # Debug: Save the bundle for inspection
-                    if not porcelain:
-                        debug_zip_path = sync_path / "debug_bundle.zip"
-                        console.print(f"   🐛 Saving debug bundle to: {debug_zip_path}")
-
-                        from datetime import datetime, timezone
-                        from io import BytesIO
-                        from zipfile import ZipFile
-
-                        # Create the same bundle that will be sent
-                        debug_contents = dict(contents)
-                        debug_contents["bundle/metadata.yaml"] = yaml.dump(
-                            dict(
-                                version="1.0.0",
-                                type=ResourceType.ASSET.metadata_type,
-                                timestamp=datetime.now(tz=timezone.utc).isoformat(),
-                            ),
-                        )
-
-                        with open(debug_zip_path, "wb") as f:
-                            buf = BytesIO()
-                            with ZipFile(buf, "w") as bundle:
-                                for file_path, file_content in debug_contents.items():
-                                    content = (
-                                        file_content.encode()
-                                        if isinstance(file_content, str)
-                                        else file_content
-                                    )
-                                    bundle.writestr(file_path, content)
-                            f.write(buf.getvalue())
-
-                        console.print(f"   📋 Bundle contains {len(debug_contents)} files")
-
-                    # Capture click output
-                    import sys
+                # Import output goes straight to the terminal unless it has to be
+                # kept off stdout (porcelain) or was asked to be captured
+                if not porcelain and not capture_import_output:
+                    run_import()
+                else:
+                    # Collect the import's messages in an explicit stream rather than
+                    # swapping ``sys.stdout``, which other threads may be printing to
                     from io import StringIO
 
-                    old_stdout = sys.stdout
-                    old_stderr = sys.stderr
                     captured_output = StringIO()
-
                     try:
-                        sys.stdout = captured_output
-                        sys.stderr = captured_output
-
-                        # Try individual import for better error messages
-                        if not porcelain:
-                            console.print("   🔍 Using split import for better error visibility...")
-                        import_resources_individually(
-                            configs,
-                            client.client,  # Use underlying SupersetClient
-                            overwrite,
-                            ResourceType.ASSET,
-                            continue_on_error=False,
-                        )
+                        run_import(output=captured_output)
                     finally:
-                        sys.stdout = old_stdout
-                        sys.stderr = old_stderr
-
                         # Show captured output if any
                         output = captured_output.getvalue()
                         if output and not porcelain:
-                            console.print("   📝 Import output:")
-                            console.print(output)
+                            emit("   📝 Import output:")
+                            emit(output)
 
-                    if not porcelain:
-                        success_message = (
-                            f"   {EMOJIS['success']} Pushed {len(configs)} assets to "
-                            f"workspace {target.workspace_id}"
-                        )
-                        console.print(success_message, style=RICH_STYLES["success"])
-                except Exception as import_error:
-                    if not porcelain:
-                        console.print(
-                            f"   {EMOJIS['error']} Import failed with error: {import_error}",
-                            style=RICH_STYLES["error"],
-                        )
-                        # Try to extract more details from the error
-                        errors = getattr(import_error, "errors", None)
-                        if errors:
-                            console.print("   📋 Error details:")
-                            for err in errors:
-                                console.print(f"      - {err}")
-                    raise
-            else:
                 if not porcelain:
-                    console.print(
-                        f"   {EMOJIS['warning']} No assets found to push",
-                        style=RICH_STYLES["warning"],
+                    success_message = (
+                        f"   {EMOJIS['success']} Pushed {len(configs)} assets to "
+                        f"workspace {target.workspace_id}"
                     )
-
-        except Exception as e:
+                    emit(success_message, style=RICH_STYLES["success"])
+            except Exception as import_error:
+                if not porcelain:
+                    emit(
+                        f"   {EMOJIS['error']} Import failed with error: {import_error}",
+                        style=RICH_STYLES["error"],
+                    )
+                    # Try to extract more details from the error
+                    errors = getattr(import_error, "errors", None)
+                    if errors:
+                        emit("   📋 Error details:")
+                        for err in errors:
+                            emit(f"      - {err}")
+                raise
+        else:
             if not porcelain:
-                console.print(
-                    f"{EMOJIS['error']} Push to {target.workspace_id} failed: {e}",
-                    style=RICH_STYLES["error"],
+                emit(
+                    f"   {EMOJIS['warning']} No assets found to push",
+                    style=RICH_STYLES["warning"],
                 )
-            raise
+
+    except Exception as e:
+        if not porcelain:
+            emit(
+                f"{EMOJIS['error']} Push to {target.workspace_id} failed: {e}",
+                style=RICH_STYLES["error"],
+            )
+        raise
 
 
 @app.command("native")
@@ -915,13 +1195,7 @@ def sync_native(
 
         # Resolve target workspace URL
         preset_client = SupPresetClient.from_context(ctx, silent=True)
-        workspaces = preset_client.get_all_workspaces(silent=True)
-
-        target_workspace = None
-        for ws in workspaces:
-            if ws.get("id") == target_workspace_id:
-                target_workspace = ws
-                break
+        target_workspace = preset_client.get_workspace(target_workspace_id, silent=True)
 
         if not target_workspace:
             console.print(
@@ -13,12 +13,13 @@ import typer
 from rich.table import Table
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.lib import remove_root, safe_extract_path
 from sup.output.console import console
 from sup.output.formatters import display_porcelain_list
 from sup.output.styles import COLORS, EMOJIS, RICH_STYLES
 
-app = typer.Typer(help="Manage themes", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["theme"], no_args_is_help=True)
 
 
 @app.command("list")
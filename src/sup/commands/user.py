@@ -5,18 +5,20 @@ Handles user listing, role management, pull/push, and invitations.
 """
 
 import logging
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import typer
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.output.console import console
 from sup.output.styles import EMOJIS, RICH_STYLES
 
 _logger = logging.getLogger(__name__)
 
-app = typer.Typer(help="Manage users", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["user"], no_args_is_help=True)
 
 
 @app.command("list")
@@ -43,7 +45,6 @@ def list_users(
     """
     from sup.clients.superset import SupSupersetClient
     from sup.config.settings import SupContext
-    from sup.output.formatters import display_porcelain_list
     from sup.output.spinners import data_spinner
 
     try:
@@ -52,18 +53,20 @@ def list_users(
             client = SupSupersetClient.from_context(ctx, workspace_id)
 
             # Get users from the Superset API
-            users_list = list(client.client.export_users())
-            users = [dict(user) for user in users_list]  # Convert UserType to Dict[str, Any]
+            users_iter = client.client.export_users()
 
-            # Apply limit if specified
+            # Apply limit if specified, stopping the export once it's reached
             if limit and limit > 0:
-                users = users[:limit]
+                users_iter = islice(users_iter, limit)
+            users = [dict(user) for user in users_iter]  # Convert UserType to Dict[str, Any]
 
             # Update spinner with results
             if sp:
                 sp.text = f"Found {len(users)} users"
 
         if porcelain:
+            from sup.output.formatters import display_porcelain_list
+
             # Tab-separated: ID, Email, First Name, Last Name, Username, Roles
             display_porcelain_list(
                 users,
@@ -72,11 +75,13 @@ def list_users(
         elif json_output:
             import json
 
-            console.print(json.dumps(users, indent=2))
+            print(json.dumps(users, indent=2))
         elif yaml_output:
             import yaml
 
-            console.print(yaml.safe_dump(users, default_flow_style=False, indent=2))
+            from sup.lib import YAML_DUMPER
+
+            console.print(yaml.dump(users, Dumper=YAML_DUMPER, default_flow_style=False, indent=2))
         else:
             client.display_users_table(users)
 
@@ -117,13 +122,11 @@ def user_info(
             ctx = SupContext()
             client = SupSupersetClient.from_context(ctx, workspace_id)
 
-            # Get all users and find the specific one
-            users_list = list(client.client.export_users())
-            user = None
-            for u in users_list:
-                if u.get("id") == user_id:
-                    user = dict(u)
-                    break
+            # Find the user, stopping the export as soon as it shows up
+            user = next(
+                (dict(u) for u in client.client.export_users() if u.get("id") == user_id),
+                None,
+            )
 
             if not user:
                 if not porcelain:
@@ -142,11 +145,13 @@ def user_info(
         elif json_output:
             import json
 
-            console.print(json.dumps(user, indent=2, default=str))
+            print(json.dumps(user, indent=2, default=str))
         elif yaml_output:
             import yaml
 
-            console.print(yaml.safe_dump(user, default_flow_style=False, indent=2))
+            from sup.lib import YAML_DUMPER
+
+            console.print(yaml.dump(user, Dumper=YAML_DUMPER, default_flow_style=False, indent=2))
         else:
             display_user_details(user)
 
@@ -301,11 +306,15 @@ def pull_users(
         if json_output:
             import json
 
-            console.print(json.dumps(users_list, indent=2))
+            print(json.dumps(users_list, indent=2))
         elif yaml_output:
             import yaml
 
-            console.print(yaml.safe_dump(users_list, default_flow_style=False, sort_keys=False))
+            from sup.lib import YAML_DUMPER
+
+            console.print(
+                yaml.dump(users_list, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
+            )
         elif porcelain:
             for user in users_list:
                 email = user.get("email", "")
@@ -315,8 +324,16 @@ def pull_users(
         else:
             import yaml
 
+            from sup.lib import YAML_DUMPER
+
             with open(path, "w", encoding="utf-8") as output:
-                yaml.dump(users_list, output, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    users_list,
+                    output,
+                    Dumper=YAML_DUMPER,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
 
             console.print(
                 f"{EMOJIS['success']} Pulled {len(users_list)} users to {path}",
@@ -367,15 +384,7 @@ def push_users(
     """
     import yaml
 
-    from preset_cli.api.clients.preset import PresetClient
-    from preset_cli.cli.main import (
-        UserFileFormat,
-        detect_users_file_format,
-        import_users_with_workspace_roles,
-    )
-    from sup.auth.preset import get_preset_auth
-    from sup.config.settings import SupContext
-    from sup.output.spinners import spinner
+    from sup.lib import YAML_LOADER
 
     try:
         if not path.exists():
@@ -387,13 +396,20 @@ def push_users(
             raise typer.Exit(1)
 
         with open(path, encoding="utf-8") as input_:
-            users = yaml.load(input_, Loader=yaml.SafeLoader)
+            users = yaml.load(input_, Loader=YAML_LOADER)
 
         if not users:
             if not porcelain:
                 console.print("No users found in file.", style=RICH_STYLES["dim"])
             return
 
+        # The legacy CLI is slow to import, so only load it once there is work to do
+        from preset_cli.cli.main import (
+            UserFileFormat,
+            detect_users_file_format,
+            import_users_with_workspace_roles,
+        )
+
         file_format = detect_users_file_format(users)
 
         if dry_run:
@@ -417,6 +433,11 @@ def push_users(
                     print(f"push\t{user.get('email', 'unknown')}")
             return
 
+        from preset_cli.api.clients.preset import PresetClient
+        from sup.auth.preset import get_preset_auth
+        from sup.config.settings import SupContext
+        from sup.output.spinners import spinner
+
         ctx = SupContext()
         auth = get_preset_auth(ctx)
         client = PresetClient("https://api.app.preset.io/", auth)
@@ -482,10 +503,7 @@ def invite_users(
     """
     import yaml
 
-    from preset_cli.api.clients.preset import PresetClient
-    from sup.auth.preset import get_preset_auth
-    from sup.config.settings import SupContext
-    from sup.output.spinners import spinner
+    from sup.lib import YAML_LOADER
 
     try:
         if not path.exists():
@@ -497,7 +515,7 @@ def invite_users(
             raise typer.Exit(1)
 
         with open(path, encoding="utf-8") as input_:
-            config = yaml.load(input_, Loader=yaml.SafeLoader)
+            config = yaml.load(input_, Loader=YAML_LOADER)
 
         if not config:
             if not porcelain:
@@ -519,6 +537,11 @@ def invite_users(
                     print(f"invite\t{email}")
             return
 
+        from preset_cli.api.clients.preset import PresetClient
+        from sup.auth.preset import get_preset_auth
+        from sup.config.settings import SupContext
+        from sup.output.spinners import spinner
+
         ctx = SupContext()
         auth = get_preset_auth(ctx)
         client = PresetClient("https://api.app.preset.io/", auth)
@@ -4,18 +4,32 @@ Workspace management commands for sup CLI.
 Handles workspace listing, selection, and context management.
 """
 
+import string
 from typing import Optional
-from urllib.parse import urlparse
 
 import typer
 
 # Removed: from rich.console import Console
 from typing_extensions import Annotated
 
+from sup.commands import COMMAND_SUMMARIES
 from sup.output.console import console
 from sup.output.styles import EMOJIS, RICH_STYLES
 
-app = typer.Typer(help="Manage workspaces", no_args_is_help=True)
+app = typer.Typer(help=COMMAND_SUMMARIES["workspace"], no_args_is_help=True)
+
+_HOSTNAME_CHARS = frozenset(string.ascii_letters + string.digits + "-._")
+
+
+def _extract_hostname(value: str) -> str:
+    """Get the lowercased hostname from a URL or bare hostname, or "" if there's none."""
+    scheme, sep, rest = value.partition("://")
+    host = rest if sep and scheme.lower() in ("http", "https") else value
+    for delimiter in "/?#":
+        host = host.partition(delimiter)[0]
+    # Drop any user info and port
+    host = host.rpartition("@")[2].partition(":")[0].lower()
+    return host if all(char in _HOSTNAME_CHARS for char in host) else ""
 
 
 def parse_workspace_identifier(value: str, client=None) -> int:
@@ -38,21 +52,12 @@ def parse_workspace_identifier(value: str, client=None) -> int:
     Raises:
         ValueError: If value cannot be parsed as valid workspace identifier
     """
-    # Try parsing as integer first
-    try:
-        return int(value)
-    except ValueError:
-        pass
+    # Numeric IDs are the common case; int() tolerates surrounding whitespace
+    stripped = value.strip()
+    if stripped.isdecimal():
+        return int(stripped)
 
-    # Try parsing as URL or hostname
-    hostname = None
-
-    # Add scheme if missing for urlparse to work correctly
-    if not value.startswith(("http://", "https://")):
-        value = f"https://{value}"
-
-    parsed = urlparse(value)
-    hostname = parsed.hostname or parsed.netloc
+    hostname = _extract_hostname(value)
 
     if not hostname:
         raise ValueError(
@@ -70,11 +75,9 @@ def parse_workspace_identifier(value: str, client=None) -> int:
             "Please use workspace ID instead, or ensure you're authenticated."
         )
 
-    # Get all workspaces and find matching hostname
-    workspaces = client.get_all_workspaces(silent=True)
-    for workspace in workspaces:
-        if workspace.get("hostname") == hostname:
-            return workspace["id"]
+    workspace_id = client.get_workspace_id_by_hostname(hostname, silent=True)
+    if workspace_id is not None:
+        return workspace_id
 
     raise ValueError(
         f"No workspace found with hostname '{hostname}'.\n"
@@ -132,7 +135,6 @@ def list_workspaces(
     """
     from sup.clients.preset import SupPresetClient
     from sup.config.settings import SupContext
-    from sup.output.formatters import display_porcelain_list
     from sup.output.spinners import data_spinner
 
     try:
@@ -160,6 +162,8 @@ def list_workspaces(
                 sp.text = f"Found {len(workspaces)} workspaces"
 
         if porcelain:
+            from sup.output.formatters import display_porcelain_list
+
             # Tab-separated: ID, Name, Team, Hostname, Status
             display_porcelain_list(
                 workspaces,
@@ -168,12 +172,14 @@ def list_workspaces(
         elif json_output:
             import json
 
-            console.print(json.dumps(workspaces, indent=2))
+            print(json.dumps(workspaces, indent=2))
         elif yaml_output:
             import yaml
 
+            from sup.lib import YAML_DUMPER
+
             console.print(
-                yaml.safe_dump(workspaces, default_flow_style=False, indent=2),
+                yaml.dump(workspaces, Dumper=YAML_DUMPER, default_flow_style=False, indent=2),
             )
         else:
             client.display_workspaces_table(workspaces)
@@ -309,13 +315,8 @@ def workspace_info(
             workspace_id = safe_parse_workspace(workspace, client, porcelain)
 
         with data_spinner(f"workspace {workspace_id}", silent=porcelain):
-            # Get all workspaces and find the specific one
-            workspaces = client.get_all_workspaces(silent=True)
-            workspace_obj = None
-            for ws in workspaces:
-                if ws.get("id") == workspace_id:
-                    workspace_obj = ws
-                    break
+            # Show current details; reuses the workspaces if parsing a URL fetched them
+            workspace_obj = client.get_workspace(workspace_id, silent=True, refresh=True)
 
             if not workspace_obj:
                 if not porcelain:
@@ -334,11 +335,15 @@ def workspace_info(
         elif json_output:
             import json
 
-            console.print(json.dumps(workspace_obj, indent=2, default=str))
+            print(json.dumps(workspace_obj, indent=2, default=str))
         elif yaml_output:
             import yaml
 
-            console.print(yaml.safe_dump(workspace_obj, default_flow_style=False, indent=2))
+            from sup.lib import YAML_DUMPER
+
+            console.print(
+                yaml.dump(workspace_obj, Dumper=YAML_DUMPER, default_flow_style=False, indent=2)
+            )
         else:
             display_workspace_details(workspace_obj)
 
@@ -355,7 +360,9 @@ def workspace_info(
 
 def display_workspace_details(workspace: dict) -> None:
     """Display detailed workspace information."""
+    from rich.markup import escape
     from rich.panel import Panel
+    from rich.text import Text
 
     workspace_id = workspace.get("id", "")
     title = workspace.get("title", "Unknown")
@@ -393,9 +400,14 @@ def display_workspace_details(workspace: dict) -> None:
     if features:
         info_lines.append(f"Features: {', '.join(features)}")
 
-    panel_content = "\n".join(info_lines)
+    # Values are plain text, so skip markup parsing (and don't misread "[...]" in them)
+    panel_content = Text("\n".join(info_lines))
     console.print(
-        Panel(panel_content, title=f"Workspace: {title}", border_style=RICH_STYLES["brand"])
+        Panel(
+            panel_content,
+            title=f"Workspace: {escape(str(title))}",
+            border_style=RICH_STYLES["brand"],
+        )
     )
 
 
@@ -418,12 +430,17 @@ def set_import_target(
     • Backup → Restore scenarios
     • Cross-workspace asset sharing
     """
-    from sup.clients.preset import SupPresetClient
     from sup.config.settings import SupContext
 
     try:
         ctx = SupContext()
-        client = SupPresetClient.from_context(ctx, silent=True)
+
+        # Only hostnames and URLs need a client to look the workspace up
+        client = None
+        if not workspace.isdecimal():
+            from sup.clients.preset import SupPresetClient
+
+            client = SupPresetClient.from_context(ctx, silent=True)
 
         # Parse workspace identifier
         workspace_id = safe_parse_workspace(workspace, client)
@@ -465,6 +482,9 @@ def show_workspace_context():
 
     Displays the configured workspaces for exports (source) and imports (target).
     """
+    from rich.console import Group
+    from rich.text import Text
+
     from sup.config.settings import SupContext
 
     try:
@@ -472,42 +492,47 @@ def show_workspace_context():
         source_workspace_id = ctx.get_workspace_id()
         target_workspace_id = ctx.get_target_workspace_id()
 
-        console.print(
-            f"{EMOJIS['workspace']} Current Workspace Context",
-            style=RICH_STYLES["header"],
-        )
+        lines = [(f"{EMOJIS['workspace']} Current Workspace Context", RICH_STYLES["header"])]
 
         if source_workspace_id:
-            console.print(
-                f"📤 Source (exports, queries): [cyan]{source_workspace_id}[/cyan]",
-                style=RICH_STYLES["info"],
+            lines.append(
+                (
+                    f"📤 Source (exports, queries): [cyan]{source_workspace_id}[/cyan]",
+                    RICH_STYLES["info"],
+                )
             )
         else:
-            console.print(
-                "📤 Source: [dim]Not configured[/dim]",
-                style=RICH_STYLES["warning"],
-            )
-            console.print(
-                "💡 Run [bold]sup workspace use <ID>[/] to set source workspace",
-                style=RICH_STYLES["dim"],
+            lines.append(("📤 Source: [dim]Not configured[/dim]", RICH_STYLES["warning"]))
+            lines.append(
+                (
+                    "💡 Run [bold]sup workspace use <ID>[/] to set source workspace",
+                    RICH_STYLES["dim"],
+                )
             )
 
         if target_workspace_id and target_workspace_id != source_workspace_id:
-            console.print(
-                f"📥 Import Target: [cyan]{target_workspace_id}[/cyan] [dim](cross)[/dim]",
-                style=RICH_STYLES["info"],
+            lines.append(
+                (
+                    f"📥 Import Target: [cyan]{target_workspace_id}[/cyan] [dim](cross)[/dim]",
+                    RICH_STYLES["info"],
+                )
             )
         elif target_workspace_id == source_workspace_id:
-            console.print(
-                f"📥 Import Target: [cyan]{target_workspace_id}[/cyan] [dim](same as source)[/dim]",
-                style=RICH_STYLES["info"],
+            lines.append(
+                (
+                    f"📥 Import Target: [cyan]{target_workspace_id}[/cyan] "
+                    "[dim](same as source)[/dim]",
+                    RICH_STYLES["info"],
+                )
             )
         else:
-            console.print(
-                "📥 Import Target: [dim]Same as source (default)[/dim]",
-                style=RICH_STYLES["info"],
+            lines.append(
+                ("📥 Import Target: [dim]Same as source (default)[/dim]", RICH_STYLES["info"])
             )
 
+        # One print lays the whole context out at once
+        console.print(Group(*(Text.from_markup(text, style=style) for text, style in lines)))
+
     except Exception as e:
         console.print(
             f"{EMOJIS['error']} Failed to show workspace context: {e}",
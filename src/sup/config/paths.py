@@ -54,3 +54,9 @@ def find_project_root() -> Optional[Path]:
 def get_env_var(name: str, default: Optional[str] = None) -> Optional[str]:
     """Get environment variable with SUP_ prefix."""
     return os.getenv(f"SUP_{name.upper()}", default)
+
+
+def get_env_flag(name: str) -> bool:
+    """Get a boolean environment variable with SUP_ prefix (1/true/yes/on, case-insensitive)."""
+    value = get_env_var(name)
+    return value is not None and value.strip().lower() in ("1", "true", "yes", "on")
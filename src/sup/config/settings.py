@@ -4,9 +4,12 @@ Pydantic configuration models for sup CLI.
 Type-safe configuration management with YAML support.
 """
 
+import copy
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field
@@ -18,6 +21,30 @@ from sup.config.paths import (
     get_global_config_file,
     get_project_state_file,
 )
+from sup.lib import YAML_LOADER
+
+
+def _read_yaml_file(file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a YAML config file, or return None if it doesn't exist.
+
+    Every command builds a ``SupContext``, often more than once, so the parsed content
+    is cached until the file changes or sup saves a config file. A copy is returned,
+    since callers may modify it.
+    """
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        return None
+
+    return copy.deepcopy(_parse_yaml_file(str(file_path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml_file(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config file; cached by path, modification time and size."""
+    with open(file_path, "r") as f:
+        return yaml.load(f, Loader=YAML_LOADER) or {}
 
 
 class OutputFormat(str, Enum):
@@ -129,12 +156,10 @@ class SupGlobalConfig(BaseSettings):
         """Load global configuration from ~/.sup/config.yml."""
         config_file = get_global_config_file()
 
-        if not config_file.exists():
-            return cls()
-
         try:
-            with open(config_file, "r") as f:
-                data = yaml.safe_load(f) or {}
+            data = _read_yaml_file(config_file)
+            if data is None:
+                return cls()
             return cls(**data)
         except Exception as e:
             # If config is corrupted, return default config
@@ -151,6 +176,7 @@ class SupGlobalConfig(BaseSettings):
 
         with open(config_file, "w") as f:
             yaml.safe_dump(data, f, default_flow_style=False, indent=2)
+        _parse_yaml_file.cache_clear()
 
 
 class SupProjectState(BaseSettings):
@@ -178,12 +204,10 @@ class SupProjectState(BaseSettings):
         """Load project state from .sup/state.yml."""
         state_file = get_project_state_file()
 
-        if not state_file.exists():
-            return cls()
-
         try:
-            with open(state_file, "r") as f:
-                data = yaml.safe_load(f) or {}
+            data = _read_yaml_file(state_file)
+            if data is None:
+                return cls()
             return cls(**data)
         except Exception as e:
             print(f"Warning: Could not load project state from {state_file}: {e}")
@@ -199,6 +223,7 @@ class SupProjectState(BaseSettings):
 
         with open(state_file, "w") as f:
             yaml.safe_dump(data, f, default_flow_style=False, indent=2)
+        _parse_yaml_file.cache_clear()
 
 
 class SupContext:
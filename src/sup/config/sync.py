@@ -5,11 +5,15 @@ Defines the data structures for sync files that orchestrate multi-target
 asset synchronization with Jinja templating support.
 """
 
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Type
 
 import yaml
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
+
+from sup.config.sync_cache import load_sync_data
+from sup.lib import YAML_DUMPER
 
 
 class AssetSelection(BaseModel):
@@ -123,6 +127,10 @@ class TargetConfig(BaseModel):
 class SyncConfig(BaseModel):
     """Complete sync configuration for multi-target asset synchronization."""
 
+    # Frozen so the cached target lookups below can't go stale, and because
+    # ``from_yaml`` hands the same instance to every caller
+    model_config = ConfigDict(frozen=True)
+
     source: SourceConfig = Field(description="Source workspace configuration")
     target_defaults: TargetDefaults = Field(
         default_factory=TargetDefaults,
@@ -145,19 +153,22 @@ class SyncConfig(BaseModel):
             raise ValueError("Target workspace IDs must be unique")
         return v
 
+    @cached_property
+    def _targets_by_name(self) -> Dict[str, TargetConfig]:
+        # Reversed so that the first target wins if names are repeated
+        return {target.name: target for target in reversed(self.targets) if target.name}
+
+    @cached_property
+    def _targets_by_workspace_id(self) -> Dict[int, TargetConfig]:
+        return {target.workspace_id: target for target in self.targets}
+
     def get_target_by_name(self, name: str) -> Optional[TargetConfig]:
         """Get a target configuration by name."""
-        for target in self.targets:
-            if target.name == name:
-                return target
-        return None
+        return self._targets_by_name.get(name)
 
     def get_target_by_workspace_id(self, workspace_id: int) -> Optional[TargetConfig]:
         """Get a target configuration by workspace ID."""
-        for target in self.targets:
-            if target.workspace_id == workspace_id:
-                return target
-        return None
+        return self._targets_by_workspace_id.get(workspace_id)
 
     def sync_config_path(self, base_folder: Path) -> Path:
         """Get the path to the sync config file."""
@@ -170,22 +181,12 @@ class SyncConfig(BaseModel):
     @classmethod
     def from_yaml(cls, file_path: Path) -> "SyncConfig":
         """Load sync configuration from a YAML file."""
-        if not file_path.exists():
-            raise FileNotFoundError(f"Sync config file not found: {file_path}")
-
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            if not data:
-                raise ValueError("Sync config file is empty")
-
-            return cls(**data)
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Sync config file not found: {file_path}")
 
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML in sync config: {e}")
-        except Exception as e:
-            raise ValueError(f"Error loading sync config: {e}")
+        return _load_sync_config(cls, str(file_path), stat.st_mtime_ns, stat.st_size)
 
     def to_yaml(self, file_path: Path) -> None:
         """Save sync configuration to a YAML file."""
@@ -197,9 +198,10 @@ class SyncConfig(BaseModel):
 
         try:
             with open(file_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(
+                yaml.dump(
                     config_dict,
                     f,
+                    Dumper=YAML_DUMPER,
                     default_flow_style=False,
                     indent=2,
                     sort_keys=False,  # Preserve field order
@@ -245,15 +247,39 @@ class SyncConfig(BaseModel):
         )
 
 
-def validate_sync_folder(folder_path: Path) -> bool:
-    """Validate that a folder contains a valid sync configuration."""
-    sync_config_path = folder_path / "sync_config.yml"
+@lru_cache(maxsize=32)
+def _load_sync_config(
+    cls: Type[SyncConfig],
+    file_path: str,
+    mtime_ns: int,
+    size: int,
+) -> SyncConfig:
+    """
+    Parse a sync config file.
+
+    Results are cached by path, modification time and size, so validating a sync
+    folder and then loading its config only parses the file once. Across runs the
+    parsed content comes from the on-disk cache in ``sync_cache``.
+    """
+    try:
+        data = load_sync_data(Path(file_path), mtime_ns, size)
 
-    if not sync_config_path.exists():
-        return False
+        if not data:
+            raise ValueError("Sync config file is empty")
+
+        return cls.model_validate(data)
 
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in sync config: {e}")
+    except Exception as e:
+        raise ValueError(f"Error loading sync config: {e}")
+
+
+def validate_sync_folder(folder_path: Path) -> bool:
+    """Validate that a folder contains a valid sync configuration."""
     try:
-        SyncConfig.from_yaml(sync_config_path)
+        # A missing file raises FileNotFoundError, so no separate exists() check
+        SyncConfig.from_yaml(folder_path / "sync_config.yml")
         return True
     except Exception:
         return False
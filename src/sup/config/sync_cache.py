@@ -0,0 +1,82 @@
+"""
+On-disk cache of parsed sync configuration files.
+
+The parsed content of a ``sync_config.yml`` is stored as JSON under
+``~/.sup/cache/sync/`` together with the size and modification time of the
+YAML file it came from. Later runs load the JSON instead of parsing the YAML,
+as long as the YAML file hasn't changed. Sync folders are meant to live in git,
+so nothing is written next to them.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import yaml
+
+from sup.config.paths import get_global_config_dir
+from sup.lib import YAML_LOADER
+
+
+def get_sync_cache_dir() -> Path:
+    """Get the directory holding cached sync configs (~/.sup/cache/sync/)."""
+    return get_global_config_dir() / "cache" / "sync"
+
+
+def get_cache_file(file_path: Path) -> Path:
+    """Get the cache file for a given sync config file."""
+    digest = hashlib.sha1(str(file_path.resolve()).encode()).hexdigest()
+    return get_sync_cache_dir() / f"{digest}.json"
+
+
+def load_sync_data(file_path: Path, mtime_ns: int, size: int) -> Any:
+    """
+    Load the content of a sync config file, from the cache when it's fresh.
+
+    Content that doesn't survive a JSON round trip (dates, non-string keys) is
+    never cached, so the result is always what ``yaml.load`` would return.
+    """
+    cache_file = get_cache_file(file_path)
+    cached = _read_cache(cache_file)
+    if cached is not None and cached.get("mtime_ns") == mtime_ns and cached.get("size") == size:
+        return cached["data"]
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=YAML_LOADER)
+
+    _write_cache(
+        cache_file,
+        {"mtime_ns": mtime_ns, "size": size, "data": data},
+    )
+    return data
+
+
+def _read_cache(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """Read a cache file, ignoring missing or unreadable ones."""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) and "data" in cached else None
+
+
+def _write_cache(cache_file: Path, entry: Dict[str, Any]) -> None:
+    """Write a cache file if its content round-trips through JSON."""
+    try:
+        content = json.dumps(entry)
+    except (TypeError, ValueError):
+        return
+    if json.loads(content) != entry:
+        return
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(content, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # The cache is only an optimization; a read-only home is fine
+        pass
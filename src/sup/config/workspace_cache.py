@@ -0,0 +1,66 @@
+"""
+On-disk cache of the workspaces an account has access to.
+
+Listing workspaces takes one request per team, and commands like
+``sup workspace use`` only need it to look up a single workspace. The list is
+stored as JSON under ``~/.sup/cache/workspaces/``, one file per API token, and
+reused for a few minutes.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sup.config.paths import get_global_config_dir
+
+WORKSPACE_CACHE_TTL = 300  # seconds
+
+
+def get_workspace_cache_dir() -> Path:
+    """Get the directory holding cached workspace lists (~/.sup/cache/workspaces/)."""
+    return get_global_config_dir() / "cache" / "workspaces"
+
+
+def get_cache_file(api_token: str) -> Path:
+    """Get the cache file for an API token, without storing the token itself."""
+    digest = hashlib.sha1(api_token.encode()).hexdigest()
+    return get_workspace_cache_dir() / f"{digest}.json"
+
+
+def load_workspaces(api_token: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load the cached workspaces for an API token.
+
+    Returns None when there's no cache or it's older than ``WORKSPACE_CACHE_TTL``.
+    The age comes from the file's modification time, so it holds across runs.
+    """
+    cache_file = get_cache_file(api_token)
+    try:
+        if time.time() - cache_file.stat().st_mtime > WORKSPACE_CACHE_TTL:
+            return None
+        with open(cache_file, "r", encoding="utf-8") as f:
+            workspaces = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return workspaces if isinstance(workspaces, list) else None
+
+
+def save_workspaces(api_token: str, workspaces: List[Dict[str, Any]]) -> None:
+    """Cache the workspaces for an API token."""
+    cache_file = get_cache_file(api_token)
+    try:
+        content = json.dumps(workspaces)
+    except (TypeError, ValueError):
+        return
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(content, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # The cache is only an optimization; a read-only home is fine
+        pass
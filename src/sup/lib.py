@@ -7,12 +7,18 @@ from pathlib import Path
 
 import yaml
 
+from preset_cli.lib import YAML_LOADER  # noqa: F401  # re-exported for sup modules
+
 # Jinja2 escaping markers — centralized so changes propagate everywhere
 JINJA2_OPEN_MARKER = "__JINJA2_OPEN__"
 JINJA2_CLOSE_MARKER = "__JINJA2_CLOSE__"
 JINJA2_OPEN_PATTERN = r"\{\{"
 JINJA2_CLOSE_PATTERN = r"\}\}"
 
+# Prefer libyaml's C safe dumper when PyYAML was built with it; it is several
+# times faster than the pure-Python one. ``YAML_LOADER`` comes from preset_cli.
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def remove_root(file_name: str) -> str:
     """Strip the first path component from a ZIP entry name.
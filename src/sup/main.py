@@ -5,28 +5,17 @@ sup - The Ultimate Superset CLI 🚀
 Main entry point for the sup command-line interface.
 """
 
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
 import typer
+from rich.console import Group
 from rich.theme import Theme
+from typer.core import TyperCommand, TyperGroup
 from typing_extensions import Annotated
 
-from sup.commands import (
-    chart,
-    dashboard,
-    database,
-    dataset,
-    dbt,
-    group,
-    ownership,
-    query,
-    rls,
-    role,
-    sql,
-    sync,
-    theme,
-    user,
-    workspace,
-)
-from sup.commands import config as config_cmd
+from sup.commands import COMMAND_SUMMARIES
 from sup.output.console import get_console
 from sup.output.styles import RICH_STYLES
 
@@ -105,9 +94,90 @@ def format_help():
     )
 
 
+def show_banner():
+    """Display the sup banner with beautiful Preset emerald green branding."""
+    from sup.output.styles import COLORS
+
+    primary = f"bold {COLORS.primary}"  # Beautiful emerald green
+    lines = [
+        (BANNER, primary),
+        (APP_TITLE, RICH_STYLES["info"]),
+        ("   Brought to you and fully compatible with Preset", primary),
+        ("   For power users and AI agents\n", RICH_STYLES["dim"]),
+        # High-level use cases
+        ("[bold]Key capabilities:[/]", RICH_STYLES["header"]),
+        *((f"• {use_case}", RICH_STYLES["accent"]) for use_case in USE_CASES),
+        ("", ""),
+    ]
+
+    # One print lays the whole banner out at once
+    console.print(Group(*(console.render_str(text, style=style) for text, style in lines)))
+
+
+# Command modules with logical sectioning: name -> (module, help panel).
+# Importing them is slow (clients, pandas), so a module is only imported when its
+# command runs; ``sup --help`` lists the shared ``COMMAND_SUMMARIES`` without
+# importing anything.
+_LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "config": ("sup.commands.config", "Configuration & Setup"),
+    "sql": ("sup.commands.sql", "Direct Data Access"),
+    "workspace": ("sup.commands.workspace", "Manage Assets"),
+    "database": ("sup.commands.database", "Manage Assets"),
+    "dataset": ("sup.commands.dataset", "Manage Assets"),
+    "chart": ("sup.commands.chart", "Manage Assets"),
+    "dashboard": ("sup.commands.dashboard", "Manage Assets"),
+    "query": ("sup.commands.query", "Manage Assets"),
+    "user": ("sup.commands.user", "Manage Assets"),
+    "group": ("sup.commands.group", "Manage Assets"),
+    "rls": ("sup.commands.rls", "Security & Governance"),
+    "role": ("sup.commands.role", "Security & Governance"),
+    "ownership": ("sup.commands.ownership", "Security & Governance"),
+    "sync": ("sup.commands.sync", "Synchronize Assets Across Workspaces"),
+    "dbt": ("sup.commands.dbt", "Integrations & Metadata"),
+    "theme": ("sup.commands.theme", "Manage Assets"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group that imports each command module only when it's resolved."""
+
+    _listing = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        # Resolved lazy commands are registered too, so drop the repeats
+        return list(dict.fromkeys([*super().list_commands(ctx), *_LAZY_COMMANDS]))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in _LAZY_COMMANDS:
+            return command
+
+        module_name, panel = _LAZY_COMMANDS[cmd_name]
+        summary = COMMAND_SUMMARIES[cmd_name]
+        if self._listing:
+            # Help only needs a name, summary and panel for each command
+            return TyperCommand(cmd_name, short_help=summary, rich_help_panel=panel)
+
+        module = importlib.import_module(module_name)
+        command = typer.main.get_group(module.app)
+        command.name = cmd_name
+        command.short_help = summary
+        command.rich_help_panel = panel  # type: ignore[attr-defined]
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+
 # Initialize the main Typer app with -h support
 app = typer.Typer(
     name="sup",
+    cls=LazyGroup,
     help=format_help(),
     rich_markup_mode="rich",
     no_args_is_help=False,  # We'll handle this ourselves
@@ -115,66 +185,6 @@ app = typer.Typer(
 )
 
 
-def show_banner():
-    """Display the sup banner with beautiful Preset emerald green branding."""
-    from sup.output.styles import COLORS
-
-    console.print(BANNER, style=f"bold {COLORS.primary}")  # Beautiful emerald green
-    console.print(APP_TITLE, style=RICH_STYLES["info"])
-    console.print(
-        "   Brought to you and fully compatible with Preset",
-        style=f"bold {COLORS.primary}",
-    )
-    console.print("   For power users and AI agents\n", style=RICH_STYLES["dim"])
-
-    # High-level use cases
-    console.print("[bold]Key capabilities:[/]", style=RICH_STYLES["header"])
-    for use_case in USE_CASES:
-        console.print(f"• {use_case}", style=RICH_STYLES["accent"])
-    console.print()
-
-
-# Add command modules with logical sectioning
-
-app.add_typer(config_cmd.app, name="config", rich_help_panel="Configuration & Setup")
-app.add_typer(sql.app, name="sql", rich_help_panel="Direct Data Access")
-app.add_typer(
-    workspace.app, name="workspace", help="Manage workspaces", rich_help_panel="Manage Assets"
-)
-app.add_typer(
-    database.app, name="database", help="Manage databases", rich_help_panel="Manage Assets"
-)
-app.add_typer(dataset.app, name="dataset", help="Manage datasets", rich_help_panel="Manage Assets")
-app.add_typer(chart.app, name="chart", help="Manage charts", rich_help_panel="Manage Assets")
-app.add_typer(
-    dashboard.app, name="dashboard", help="Manage dashboards", rich_help_panel="Manage Assets"
-)
-app.add_typer(query.app, name="query", help="Manage saved queries", rich_help_panel="Manage Assets")
-app.add_typer(user.app, name="user", help="Manage users", rich_help_panel="Manage Assets")
-app.add_typer(group.app, name="group", help="Manage SCIM groups", rich_help_panel="Manage Assets")
-app.add_typer(
-    rls.app,
-    name="rls",
-    help="Manage row-level security",
-    rich_help_panel="Security & Governance",
-)
-app.add_typer(
-    role.app,
-    name="role",
-    help="Manage roles and permissions",
-    rich_help_panel="Security & Governance",
-)
-app.add_typer(
-    ownership.app,
-    name="ownership",
-    help="Manage asset ownership",
-    rich_help_panel="Security & Governance",
-)
-app.add_typer(sync.app, name="sync", rich_help_panel="Synchronize Assets Across Workspaces")
-app.add_typer(dbt.app, name="dbt", rich_help_panel="Integrations & Metadata")
-app.add_typer(theme.app, name="theme", help="Manage themes", rich_help_panel="Manage Assets")
-
-
 def version_callback(value: bool):
     if value:
         from sup import __version__
@@ -5,12 +5,44 @@ Provides a console factory that respects user preferences like monochrome mode.
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from rich.console import Console
 from rich.theme import Theme
 
 _console_cache: Optional[Console] = None
+_no_color_cache: Optional[bool] = None
+# Themed consoles, by theme object (themes hash by identity) and no_color
+_themed_console_cache: Dict[Tuple[Theme, bool], Console] = {}
+
+
+def _resolve_no_color() -> bool:
+    """
+    Work out whether colors are disabled, from NO_COLOR or the sup config.
+
+    Loading the config is comparatively slow, so the answer is kept until
+    ``reset_console_cache()`` is called.
+    """
+    global _no_color_cache
+
+    if _no_color_cache is None:
+        # Check NO_COLOR env var (universal standard: https://no-color.org/)
+        if os.environ.get("NO_COLOR"):
+            _no_color_cache = True
+        else:
+            # Check sup config
+            try:
+                # Only the global config holds color_output; skip the project state
+                from sup.config.settings import SupGlobalConfig
+
+                config = SupGlobalConfig.load_from_file()
+                # Invert color_output to get no_color
+                _no_color_cache = not config.color_output
+            except Exception:
+                # If config loading fails, default to colors enabled
+                _no_color_cache = False
+
+    return _no_color_cache
 
 
 def get_console(force_no_color: bool = False, theme: Optional[Theme] = None) -> Console:
@@ -32,41 +64,30 @@ def get_console(force_no_color: bool = False, theme: Optional[Theme] = None) ->
     global _console_cache
 
     # Determine if we should disable colors
-    no_color = force_no_color
-
-    if not no_color:
-        # Check NO_COLOR env var (universal standard: https://no-color.org/)
-        if os.environ.get("NO_COLOR"):
-            no_color = True
-
-    if not no_color:
-        # Check sup config
-        try:
-            from sup.config.settings import SupContext
-
-            ctx = SupContext()
-            config = ctx.global_config
-            # Invert color_output to get no_color
-            no_color = not config.color_output
-        except Exception:
-            # If config loading fails, default to colors enabled
-            no_color = False
+    no_color = force_no_color or _resolve_no_color()
 
     # Create console with appropriate settings (cache it)
-    # Note: We don't cache themed consoles since they may differ
     if theme is not None:
-        return Console(no_color=no_color, theme=theme)
+        key = (theme, no_color)
+        if key not in _themed_console_cache:
+            _themed_console_cache[key] = Console(no_color=no_color, theme=theme)
+        return _themed_console_cache[key]
 
     if _console_cache is None or _console_cache.no_color != no_color:
         _console_cache = Console(no_color=no_color)
+        # Drop methods the proxy bound to the console being replaced
+        console.__dict__.clear()
 
     return _console_cache
 
 
 def reset_console_cache():
     """Reset the console cache (useful for testing or config changes)."""
-    global _console_cache
+    global _console_cache, _no_color_cache
     _console_cache = None
+    _no_color_cache = None
+    _themed_console_cache.clear()
+    console.__dict__.clear()
 
 
 # Export a default console instance for convenience
@@ -74,10 +95,15 @@ def reset_console_cache():
 
 
 class _ConsoleProxy:
-    """Proxy object that always returns the current console."""
+    """Proxy object that returns the current console."""
 
     def __getattr__(self, name):
-        return getattr(get_console(), name)
+        attr = getattr(get_console(), name)
+        if callable(attr):
+            # Bind methods like print, so later calls skip __getattr__ until
+            # the default console is replaced; properties like width stay live
+            self.__dict__[name] = attr
+        return attr
 
     def __call__(self, *args, **kwargs):
         return get_console()(*args, **kwargs)
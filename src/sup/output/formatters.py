@@ -5,6 +5,7 @@ Beautiful data formatting for query results and other outputs.
 """
 
 import json
+import sys
 import time
 from io import StringIO
 from typing import Any, Callable, Dict, List, Optional
@@ -258,29 +259,28 @@ def display_porcelain(df: pd.DataFrame, max_rows: int = 100) -> None:
     if len(df) == 0:
         return  # No output for empty results in porcelain mode
 
-    # Simple tab-separated output, no headers, no decorations
+    # Simple tab-separated output, no headers, no decorations.
+    # NaN/None become empty values, and all rows are written at once
     display_df = df.head(max_rows)
-    for _, row in display_df.iterrows():
-        # Convert each value to string, handling NaN/None as empty
-        formatted_row = []
-        for val in row:
-            if pd.isna(val):
-                formatted_row.append("")
-            else:
-                formatted_row.append(str(val))
-
-        # Output as tab-separated values
-        print("\t".join(formatted_row))
+    lines = (
+        "\t".join("" if pd.isna(val) else str(val) for val in row)
+        for row in display_df.itertuples(index=False, name=None)
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_porcelain_list(items: List[Dict[str, Any]], fields: List[str]) -> None:
     """Display list data in porcelain mode - tab-separated fields."""
-    for item in items:
-        values = []
-        for field in fields:
-            value = item.get(field, "")
-            values.append(str(value) if value is not None else "")
-        print("\t".join(values))
+    if not items:
+        return
+
+    lines = ("\t".join(_porcelain_value(item.get(field, "")) for field in fields) for item in items)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _porcelain_value(value: Any) -> str:
+    """Format a value for porcelain output, with None as an empty field."""
+    return "" if value is None else str(value)
 
 
 def display_porcelain_json(df: pd.DataFrame, max_rows: int = 100) -> None:
@@ -7,20 +7,17 @@ Provides elegant loading indicators and status updates.
 from contextlib import contextmanager
 from typing import Optional
 
-from halo import Halo
-
+from sup.output.console import get_console
 from sup.output.styles import EMOJIS
 
+DEFAULT_SUCCESS_TEXT = f"{EMOJIS['success']} Done"
+DEFAULT_ERROR_TEXT = f"{EMOJIS['error']} Failed"
+
 
 def _should_use_color() -> bool:
     """Check if colors should be used (respects monochrome setting)."""
-    try:
-        from sup.output.console import get_console
-
-        console = get_console()
-        return not console.no_color
-    except Exception:
-        return True  # Default to colors if can't determine
+    # get_console() already falls back to colors when the config can't be read
+    return not get_console().no_color
 
 
 @contextmanager
@@ -45,10 +42,12 @@ def spinner(
             sp.text = f"Found {len(datasets)} datasets"
     """
     if silent:
-        # In silent mode (porcelain), don't show spinner
+        # In silent mode (porcelain), don't show spinner (or import halo at all)
         yield None
         return
 
+    from halo import Halo
+
     # Respect monochrome mode
     use_color = _should_use_color()
     color = "cyan" if use_color else None
@@ -60,16 +59,10 @@ def spinner(
         try:
             yield sp
             # Success message
-            if success_text:
-                sp.succeed(success_text)
-            else:
-                sp.succeed(f"{EMOJIS['success']} Done")
+            sp.succeed(success_text or DEFAULT_SUCCESS_TEXT)
         except Exception:
             # Error message
-            if error_text:
-                sp.fail(error_text)
-            else:
-                sp.fail(f"{EMOJIS['error']} Failed")
+            sp.fail(error_text or DEFAULT_ERROR_TEXT)
             raise
 
 
@@ -83,16 +83,19 @@ def get_status_emoji(status: str) -> str:
     return EMOJIS.get(status, "")
 
 
+# Rich styles by status, for get_status_style
+STATUS_STYLES = {
+    "success": RICH_STYLES["success"],
+    "error": RICH_STYLES["error"],
+    "warning": RICH_STYLES["warning"],
+    "info": RICH_STYLES["info"],
+    "loading": RICH_STYLES["accent"],
+}
+
+
 def get_status_style(status: str) -> str:
     """Get Rich style for a given status."""
-    status_styles = {
-        "success": RICH_STYLES["success"],
-        "error": RICH_STYLES["error"],
-        "warning": RICH_STYLES["warning"],
-        "info": RICH_STYLES["info"],
-        "loading": RICH_STYLES["accent"],
-    }
-    return status_styles.get(status, RICH_STYLES["muted"])
+    return STATUS_STYLES.get(status, RICH_STYLES["muted"])
 
 
 class SemanticColors:
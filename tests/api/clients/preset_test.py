@@ -514,3 +514,18 @@ def test_get_group_membership(requests_mock: Mocker) -> None:
         "startIndex": 1,
         "totalResults": 2,
     }
+
+
+def test_get_group_membership_count(requests_mock: Mocker) -> None:
+    """
+    Test the ``get_group_membership`` method with a custom page size.
+    """
+    requests_mock.get(
+        "https://ws.preset.io/v1/teams/testSlug/scim/v2/Groups?startIndex=501&count=500",
+        json={"Resources": [], "startIndex": 501, "totalResults": 500},
+    )
+
+    auth = Auth()
+    client = PresetClient("https://ws.preset.io/", auth)
+    assert client.get_group_membership("testSlug", 501, count=500)["startIndex"] == 501
+    assert requests_mock.last_request.qs == {"startindex": ["501"], "count": ["500"]}
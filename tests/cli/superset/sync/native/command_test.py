@@ -5,6 +5,7 @@ Tests for the native import command.
 # pylint: disable=redefined-outer-name, invalid-name, too-many-lines, too-many-locals
 
 import json
+from io import StringIO
 from pathlib import Path
 from typing import Any, Dict, List
 from unittest import mock
@@ -24,10 +25,13 @@ from preset_cli.cli.superset.main import superset_cli
 from preset_cli.cli.superset.sync.native.command import (
     ResourceType,
     add_password_to_config,
+    compile_template,
     import_resources,
     import_resources_individually,
+    load_template,
     load_user_modules,
     raise_helper,
+    render_yaml,
     verify_db_connectivity,
 )
 from preset_cli.exceptions import ErrorLevel, ErrorPayload, SupersetError
@@ -245,6 +249,32 @@ def test_import_resources_error(mocker: MockerFixture) -> None:
     assert excinfo.value.errors == errors
 
 
+def test_import_resources_error_output(
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """
+    Test that ``import_resources`` echoes errors to an explicit output stream.
+    """
+    client = mocker.MagicMock()
+    errors: List[ErrorPayload] = [
+        {
+            "message": "Error importing database",
+            "error_type": "GENERIC_COMMAND_ERROR",
+            "level": ErrorLevel.WARNING,
+            "extra": {},
+        },
+    ]
+    client.import_zip.side_effect = SupersetError(errors)
+
+    output = StringIO()
+    contents = {"bundle/databases/gsheets.yaml": "GSheets"}
+    with pytest.raises(SupersetError):
+        import_resources(contents, client, False, ResourceType.ASSET, output)
+    assert "Error importing database" in output.getvalue()
+    assert capsys.readouterr().out == ""
+
+
 def test_native(mocker: MockerFixture, fs: FakeFilesystem) -> None:
     # pylint: disable=line-too-long
     """
@@ -749,6 +779,31 @@ def test_raise_helper() -> None:
     assert str(excinfo.value) == "Invalid number: -1"
 
 
+def test_compile_template_cached() -> None:
+    """
+    Test that ``compile_template`` reuses templates for identical content.
+    """
+    compile_template.cache_clear()
+    template = compile_template("name: {{ name }}")
+    assert compile_template("name: {{ name }}") is template
+    assert compile_template.cache_info().hits == 1
+    assert template.render(name="a") == "name: a"
+
+
+def test_render_yaml_with_template(fs: FakeFilesystem) -> None:
+    """
+    Test that ``render_yaml`` renders a loaded template without reading the file again.
+    """
+    path = Path("/path/to/root/databases/gsheets.yaml")
+    fs.create_file(path, contents="name: {{ name }}\npath: {{ filepath }}\n")
+
+    template = load_template(path)
+    path.unlink()
+
+    assert render_yaml(path, {"name": "a"}, template) == {"name": "a", "path": str(path)}
+    assert render_yaml(path, {"name": "b"}, template)["name"] == "b"
+
+
 def test_template_in_environment(mocker: MockerFixture, fs: FakeFilesystem) -> None:
     """
     Test that the underlying template is passed to the Jinja renderer.
@@ -1070,6 +1125,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1081,6 +1137,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1090,6 +1147,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1100,6 +1158,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1110,6 +1169,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1120,6 +1180,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1135,6 +1196,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1146,6 +1208,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1160,6 +1223,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
         ],
         any_order=True,
@@ -1308,6 +1372,7 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1317,6 +1382,7 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1327,6 +1393,7 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1337,6 +1404,7 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
             mock.call(
                 {
@@ -1348,6 +1416,7 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.ASSET,
+                None,
             ),
         ],
         any_order=True,
@@ -1469,6 +1538,36 @@ def test_import_resources_individually_retries(
     assert str(excinfo.value) == "Connection aborted."
 
 
+def test_import_resources_individually_serializes_once(
+    mocker: MockerFixture,
+    fs: FakeFilesystem,  # pylint: disable=unused-argument
+) -> None:
+    """
+    Test that ``import_resources_individually`` dumps each config only once.
+    """
+    mocker.patch("preset_cli.cli.superset.lib.LOG_FILE_PATH", Path("progress.log"))
+    import_resources = mocker.patch(
+        "preset_cli.cli.superset.sync.native.command.import_resources",
+    )
+    dump = mocker.patch(
+        "preset_cli.cli.superset.sync.native.command.yaml.dump",
+        side_effect=yaml.dump,
+    )
+
+    database = {"name": "db", "uuid": "uuid1"}
+    configs = {
+        Path("bundle/databases/db.yaml"): database,
+        Path("bundle/datasets/a.yaml"): {"name": "a", "uuid": "uuid2", "database_uuid": "uuid1"},
+        Path("bundle/datasets/b.yaml"): {"name": "b", "uuid": "uuid3", "database_uuid": "uuid1"},
+    }
+    import_resources_individually(configs, mocker.MagicMock(), True, ResourceType.ASSET)
+
+    assert import_resources.call_count == 3
+    assert [call.args[0] for call in dump.call_args_list].count(database) == 1
+    for call in import_resources.call_args_list:
+        assert call.args[0]["bundle/databases/db.yaml"] == yaml.dump(database)
+
+
 def test_import_resources_individually_checkpoint(
     mocker: MockerFixture,
     fs: FakeFilesystem,  # pylint: disable=unused-argument
@@ -1505,6 +1604,7 @@ def test_import_resources_individually_checkpoint(
                 client,
                 True,
                 ResourceType.ASSET,
+                None,
             ),
             mocker.call(
                 {
@@ -1515,6 +1615,7 @@ def test_import_resources_individually_checkpoint(
                 client,
                 True,
                 ResourceType.ASSET,
+                None,
             ),
         ],
     )
@@ -1545,6 +1646,7 @@ def test_import_resources_individually_checkpoint(
         client,
         True,
         ResourceType.ASSET,
+        None,
     )
 
     assert not Path("progress.log").exists()
@@ -1630,6 +1732,7 @@ def test_import_resources_individually_continue(
                 client,
                 True,
                 ResourceType.ASSET,
+                None,
             ),
             mocker.call(
                 {
@@ -1640,6 +1743,7 @@ def test_import_resources_individually_continue(
                 client,
                 True,
                 ResourceType.ASSET,
+                None,
             ),
             mocker.call(
                 {
@@ -1650,6 +1754,7 @@ def test_import_resources_individually_continue(
                 client,
                 True,
                 ResourceType.ASSET,
+                None,
             ),
             mocker.call(
                 {
@@ -1660,6 +1765,7 @@ def test_import_resources_individually_continue(
                 client,
                 True,
                 ResourceType.ASSET,
+                None,
             ),
         ],
     )
@@ -2192,6 +2298,7 @@ def test_native_split_asset_types(
                 client,
                 False,
                 resource_type,
+                None,
             )
             for content in expected_contents
         ],
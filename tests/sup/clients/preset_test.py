@@ -0,0 +1,102 @@
+"""Tests for SupPresetClient workspace lookups and their on-disk cache."""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sup.clients.preset import SupPresetClient
+from sup.config.workspace_cache import (
+    WORKSPACE_CACHE_TTL,
+    get_cache_file,
+    load_workspaces,
+    save_workspaces,
+)
+
+WORKSPACES = [
+    {"id": 1, "hostname": "one.preset.io", "team_name": "team"},
+    {"id": 2, "hostname": "two.preset.io", "team_name": "team"},
+]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk workspace cache out of the real home directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(
+        "sup.config.workspace_cache.get_workspace_cache_dir",
+        lambda: cache_dir,
+    )
+    return cache_dir
+
+
+def _make_client(workspaces):
+    """Build a SupPresetClient whose get_all_workspaces returns ``workspaces``."""
+    auth = MagicMock()
+    auth.api_token = "token"
+    with patch("sup.clients.preset.PresetClient"):
+        client = SupPresetClient(auth)
+    client.get_all_workspaces = MagicMock(return_value=workspaces)
+    return client
+
+
+def test_get_workspace_hostname_uses_cache():
+    """A second client reuses the workspaces fetched by the first."""
+    assert _make_client(WORKSPACES).get_workspace_hostname(2) == "two.preset.io"
+
+    client = _make_client([])
+    assert client.get_workspace_hostname(1) == "one.preset.io"
+    client.get_all_workspaces.assert_not_called()
+
+
+def test_get_workspace_hostname_refreshes_on_miss():
+    save_workspaces("token", WORKSPACES[:1])
+
+    client = _make_client(WORKSPACES)
+    assert client.get_workspace_hostname(2) == "two.preset.io"
+    client.get_all_workspaces.assert_called_once_with(silent=False)
+    assert load_workspaces("token") == WORKSPACES
+
+
+def test_get_workspace_hostname_not_found():
+    """A missing workspace is only fetched once, and failures aren't cached."""
+    client = _make_client([])
+    assert client.get_workspace_hostname(3) is None
+    client.get_all_workspaces.assert_called_once_with(silent=False)
+    assert not get_cache_file("token").exists()
+
+
+def test_load_workspaces_expired():
+    save_workspaces("token", WORKSPACES)
+    assert load_workspaces("token") == WORKSPACES
+    assert load_workspaces("other") is None
+
+    stale = time.time() - WORKSPACE_CACHE_TTL - 1
+    os.utime(get_cache_file("token"), (stale, stale))
+    assert load_workspaces("token") is None
+
+
+def test_get_workspace_id_by_hostname():
+    save_workspaces("token", WORKSPACES[:1])
+
+    client = _make_client(WORKSPACES)
+    assert client.get_workspace_id_by_hostname("one.preset.io") == 1
+    client.get_all_workspaces.assert_not_called()
+
+    # A miss in the cached list checks the API once
+    assert client.get_workspace_id_by_hostname("two.preset.io") == 2
+    assert client.get_workspace_id_by_hostname("three.preset.io") is None
+    client.get_all_workspaces.assert_called_once_with(silent=False)
+
+
+def test_get_workspace_refresh_fetches_once():
+    save_workspaces("token", [dict(WORKSPACES[0], status="HIBERNATED")])
+
+    client = _make_client(WORKSPACES)
+    assert client.get_workspace(1)["status"] == "HIBERNATED"
+
+    # A refresh fetches current details, and later refreshes reuse them
+    assert client.get_workspace(1, refresh=True) == WORKSPACES[0]
+    assert client.get_workspace(2, refresh=True) == WORKSPACES[1]
+    client.get_all_workspaces.assert_called_once_with(silent=False)
@@ -103,14 +103,14 @@ def _ctx_for_from_context(current_workspace_id):
 
 
 @contextmanager
-def _patched_from_context(workspaces):
+def _patched_from_context(workspaces, workspace_lookup):
     """Patch the Preset/auth/client collaborators from_context resolves through.
 
-    ``workspaces`` is the list returned by get_all_workspaces (the hostname
-    resolution source).
+    ``workspaces`` is the list get_workspace looks workspaces up in (the
+    hostname resolution source).
     """
     preset_client = MagicMock()
-    preset_client.get_all_workspaces.return_value = workspaces
+    preset_client.get_workspace.side_effect = workspace_lookup(workspaces)
 
     with patch(
         "sup.clients.preset.SupPresetClient.from_context",
@@ -125,7 +125,7 @@ def _patched_from_context(workspaces):
         yield
 
 
-def test_from_context_scoped_workspace_id_does_not_persist():
+def test_from_context_scoped_workspace_id_does_not_persist(workspace_lookup):
     """A --workspace-id filter pointing elsewhere must not touch state.yml.
 
     Regression: passing a workspace id as a filter used to overwrite the
@@ -133,18 +133,18 @@ def test_from_context_scoped_workspace_id_does_not_persist():
     """
     ctx = _ctx_for_from_context(current_workspace_id=100)
 
-    with _patched_from_context([{"id": 200, "hostname": "ws200.example.com"}]):
+    with _patched_from_context([{"id": 200, "hostname": "ws200.example.com"}], workspace_lookup):
         client = SupSupersetClient.from_context(ctx, workspace_id=200)
 
     assert client.workspace_url == "https://ws200.example.com/"
     ctx.set_workspace_context.assert_not_called()
 
 
-def test_from_context_default_workspace_caches_hostname():
+def test_from_context_default_workspace_caches_hostname(workspace_lookup):
     """Without an explicit id, the active workspace's hostname is cached."""
     ctx = _ctx_for_from_context(current_workspace_id=100)
 
-    with _patched_from_context([{"id": 100, "hostname": "ws100.example.com"}]):
+    with _patched_from_context([{"id": 100, "hostname": "ws100.example.com"}], workspace_lookup):
         client = SupSupersetClient.from_context(ctx)
 
     assert client.workspace_url == "https://ws100.example.com/"
@@ -154,7 +154,7 @@ def test_from_context_default_workspace_caches_hostname():
     )
 
 
-def test_from_context_explicit_active_workspace_id_caches_hostname():
+def test_from_context_explicit_active_workspace_id_caches_hostname(workspace_lookup):
     """An explicit id equal to the active workspace still warms the cache.
 
     Callers such as `sup sql` pre-resolve the workspace id and pass it
@@ -163,7 +163,7 @@ def test_from_context_explicit_active_workspace_id_caches_hostname():
     """
     ctx = _ctx_for_from_context(current_workspace_id=100)
 
-    with _patched_from_context([{"id": 100, "hostname": "ws100.example.com"}]):
+    with _patched_from_context([{"id": 100, "hostname": "ws100.example.com"}], workspace_lookup):
         client = SupSupersetClient.from_context(ctx, workspace_id=100)
 
     assert client.workspace_url == "https://ws100.example.com/"
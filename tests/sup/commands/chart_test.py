@@ -5,6 +5,7 @@ import json
 import zipfile
 from unittest.mock import MagicMock, patch
 
+import pytest
 from rich.console import Console
 from typer.testing import CliRunner
 
@@ -918,6 +919,10 @@ class TestPullCharts:
 
 
 class TestPushCharts:
+    @pytest.fixture(autouse=True)
+    def _use_workspace_lookup(self, workspace_lookup):
+        self.workspace_lookup = workspace_lookup
+
     def _invoke(
         self,
         tmp_path,
@@ -937,7 +942,7 @@ class TestPushCharts:
             ]
         )
         pcl = MagicMock()
-        pcl.get_all_workspaces.return_value = ws
+        pcl.get_workspace.side_effect = self.workspace_lookup(ws)
 
         with patch(_CTX, return_value=ct), patch(_NATIVE) as mn, patch(
             _PAUTH, **{"from_sup_config.return_value": MagicMock()}
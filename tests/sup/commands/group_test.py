@@ -1,11 +1,16 @@
 """Tests for sup.commands.group module."""
 
+import json
 from unittest.mock import MagicMock, patch
 
+import pytest
 import yaml
 from typer.testing import CliRunner
+from yarl import URL
 
 from sup.commands.group import (
+    SCIM_PAGE_SIZE,
+    _build_user_index,
     app,
     create_scim_group,
     delete_scim_group,
@@ -15,8 +20,10 @@ from sup.commands.group import (
     display_sync_results,
     execute_group_sync,
     get_all_groups,
+    get_all_scim_users,
     needs_update,
     plan_group_sync,
+    resolve_members,
     save_groups_to_file,
     update_scim_group,
 )
@@ -49,12 +56,12 @@ SAMPLE_GROUPS = [
 ]
 
 
-# Patch targets for local imports inside functions
-_P_CTX = "sup.config.settings.SupContext"
-_P_AUTH = "sup.auth.preset.get_preset_auth"
-_P_PC = "preset_cli.api.clients.preset.PresetClient"
-_P_DS = "sup.output.spinners.data_spinner"
-_P_SP = "sup.output.spinners.spinner"
+# Patch targets for names imported into the group module
+_P_CTX = "sup.commands.group.SupContext"
+_P_AUTH = "sup.commands.group.get_preset_auth"
+_P_PC = "sup.commands.group.PresetClient"
+_P_DS = "sup.commands.group.data_spinner"
+_P_SP = "sup.commands.group.spinner"
 
 
 # ---------------------------------------------------------------------------
@@ -438,11 +445,12 @@ class TestSyncGroups:
         cfg = tmp_path / "config.yml"
         cfg.write_text(yaml.dump({"groups": [{"name": "G1", "members": []}]}))
         client = MagicMock()
-        client.get_teams.return_value = ["onlyteam"]
+        client.get_teams.return_value = [{"name": "onlyteam", "title": "Only Team"}]
         mock_pc_cls.return_value = client
 
         result = runner.invoke(app, ["sync", str(cfg)])
         assert result.exit_code == 0
+        mock_gag.assert_called_once_with(client, "onlyteam")
 
     @patch("sup.commands.group.typer.prompt", return_value="t1")
     @patch("sup.commands.group.get_all_groups", return_value=[])
@@ -456,24 +464,32 @@ class TestSyncGroups:
         cfg = tmp_path / "config.yml"
         cfg.write_text(yaml.dump({"groups": [{"name": "G1", "members": []}]}))
         client = MagicMock()
-        client.get_teams.return_value = ["t1", "t2"]
+        client.get_teams.return_value = [
+            {"name": "t1", "title": "Team 1"},
+            {"name": "t2", "title": "Team 2"},
+        ]
         mock_pc_cls.return_value = client
 
         result = runner.invoke(app, ["sync", str(cfg)])
         assert result.exit_code == 0
+        assert "Team 2 (t2)" in result.output
+        mock_gag.assert_called_once_with(client, "t1")
 
+    @patch("sup.commands.group._build_user_index", return_value={"a@co.com": "u1"})
     @patch("sup.commands.group.get_all_groups")
     @patch(_P_SP)
     @patch(_P_PC)
     @patch(_P_AUTH)
     @patch(_P_CTX)
-    def test_all_in_sync(self, mock_ctx, mock_auth, mock_pc_cls, mock_sp, mock_gag, tmp_path):
+    def test_all_in_sync(
+        self, mock_ctx, mock_auth, mock_pc_cls, mock_sp, mock_gag, mock_index, tmp_path
+    ):
         cfg = tmp_path / "config.yml"
         cfg.write_text(
-            yaml.dump({"groups": [{"name": "Engineers", "members": [{"email": "a@co.com"}]}]})
+            yaml.dump({"groups": [{"name": "Engineers", "members": [{"email": "A@co.com"}]}]})
         )
         mock_gag.return_value = [
-            {"id": "g1", "displayName": "Engineers", "members": [{"value": "a@co.com"}]}
+            {"id": "g1", "displayName": "Engineers", "members": [{"value": "u1"}]}
         ]
         mock_pc_cls.return_value = MagicMock()
 
@@ -499,6 +515,41 @@ class TestSyncGroups:
         assert "Dry run complete" in result.output
         mock_exec.assert_not_called()
 
+    @patch("sup.commands.group.execute_group_sync")
+    @patch("sup.commands.group.get_all_groups", return_value=[])
+    @patch(_P_SP)
+    @patch(_P_PC)
+    @patch(_P_AUTH)
+    @patch(_P_CTX)
+    def test_json_config(
+        self, mock_ctx, mock_auth, mock_pc_cls, mock_sp, mock_gag, mock_exec, tmp_path
+    ):
+        cfg = tmp_path / "config.json"
+        cfg.write_text(json.dumps({"groups": [{"name": "FromJson", "members": []}]}))
+        mock_pc_cls.return_value = MagicMock()
+
+        result = runner.invoke(app, ["sync", str(cfg), "--team", "t1", "--dry-run"])
+        assert result.exit_code == 0
+        assert "FromJson" in result.output
+        assert "Large YAML configuration" not in result.output
+
+    @patch("sup.commands.group.LARGE_CONFIG_BYTES", 10)
+    @patch("sup.commands.group.get_all_groups", return_value=[])
+    @patch(_P_SP)
+    @patch(_P_PC)
+    @patch(_P_AUTH)
+    @patch(_P_CTX)
+    def test_large_yaml_config_warning(
+        self, mock_ctx, mock_auth, mock_pc_cls, mock_sp, mock_gag, tmp_path
+    ):
+        cfg = tmp_path / "config.yml"
+        cfg.write_text(yaml.dump({"groups": [{"name": "New", "members": []}]}))
+        mock_pc_cls.return_value = MagicMock()
+
+        result = runner.invoke(app, ["sync", str(cfg), "--team", "t1", "--dry-run"])
+        assert result.exit_code == 0
+        assert "Large YAML configuration" in result.output
+
     @patch("sup.commands.group.typer.confirm", return_value=False)
     @patch("sup.commands.group.execute_group_sync")
     @patch("sup.commands.group.get_all_groups", return_value=[])
@@ -629,17 +680,19 @@ class TestSyncGroups:
     def test_multiple_teams_porcelain(
         self, mock_ctx, mock_auth, mock_pc_cls, mock_sp, mock_pgs, mock_gag, tmp_path
     ):
-        """Branch 223->230: multiple teams with porcelain skips prompt."""
+        """Multiple teams with porcelain cannot prompt, so nothing is synced."""
         cfg = tmp_path / "config.yml"
         cfg.write_text(yaml.dump({"groups": [{"name": "G1", "members": []}]}))
         client = MagicMock()
-        client.get_teams.return_value = ["team_a", "team_b"]
+        client.get_teams.return_value = [
+            {"name": "team_a", "title": "Team A"},
+            {"name": "team_b", "title": "Team B"},
+        ]
         mock_pc_cls.return_value = client
 
-        # porcelain=True and no --team: 'if not porcelain' is False -> skips to 230
-        # team stays None, which is fine for mocked get_all_groups
         result = runner.invoke(app, ["sync", str(cfg), "--porcelain"])
         assert result.exit_code == 0
+        mock_gag.assert_not_called()
 
     @patch("sup.commands.group.get_all_groups", return_value=[])
     @patch(
@@ -841,19 +894,26 @@ class TestCreateGroup:
         result = runner.invoke(app, ["create", "MyGroup"])
         assert result.exit_code == 0
 
+    @patch("sup.commands.group._build_user_index", return_value={"a@co.com": "u1"})
     @patch("sup.commands.group.create_scim_group", return_value={"id": "new3"})
     @patch(_P_SP)
     @patch(_P_PC)
     @patch(_P_AUTH)
     @patch(_P_CTX)
-    def test_with_members_warning(self, mock_ctx, mock_auth, mock_pc_cls, mock_sp, mock_csg):
+    def test_with_members(self, mock_ctx, mock_auth, mock_pc_cls, mock_sp, mock_csg, mock_index):
         cm, _ = _make_spinner_cm()
         mock_sp.return_value = cm
         mock_pc_cls.return_value = MagicMock()
 
-        result = runner.invoke(app, ["create", "MyGroup", "--team", "t1", "--member", "a@co.com"])
+        result = runner.invoke(
+            app,
+            ["create", "MyGroup", "--team", "t1", "--member", "A@co.com", "--member", "x@co.com"],
+        )
         assert result.exit_code == 0
-        assert "not yet implemented" in result.output
+        assert "Skipping members not found in team t1: x@co.com" in result.output
+        mock_index.assert_called_once_with(mock_pc_cls.return_value, "t1")
+        group_data = mock_csg.call_args[0][2]
+        assert group_data["members"] == [{"value": "u1", "display": "A@co.com"}]
 
     @patch("sup.commands.group.create_scim_group", return_value={"id": "p1"})
     @patch(_P_SP)
@@ -891,13 +951,16 @@ class TestCreateGroup:
         result = runner.invoke(app, ["create", "MyGroup", "--porcelain"])
         assert result.exit_code == 0
 
+    @patch("sup.commands.group._build_user_index", return_value={})
     @patch("sup.commands.group.create_scim_group", return_value={"id": "p3"})
     @patch(_P_SP)
     @patch(_P_PC)
     @patch(_P_AUTH)
     @patch(_P_CTX)
-    def test_with_members_porcelain(self, mock_ctx, mock_auth, mock_pc_cls, mock_sp, mock_csg):
-        """Branch 346->354: members warning with porcelain."""
+    def test_with_members_porcelain(
+        self, mock_ctx, mock_auth, mock_pc_cls, mock_sp, mock_csg, mock_index
+    ):
+        """Missing members are not reported in porcelain mode."""
         cm, _ = _make_spinner_cm()
         mock_sp.return_value = cm
         mock_pc_cls.return_value = MagicMock()
@@ -906,7 +969,8 @@ class TestCreateGroup:
             app, ["create", "MyGroup", "--team", "t1", "--member", "a@co.com", "--porcelain"]
         )
         assert result.exit_code == 0
-        assert "not yet implemented" not in result.output
+        assert "Skipping members" not in result.output
+        assert result.output == "p3\tMyGroup\n"
 
     @patch(_P_SP)
     @patch(_P_PC, side_effect=RuntimeError("boom"))
@@ -963,6 +1027,24 @@ class TestGetAllGroups:
         result = get_all_groups(client, "t1")
         assert result == []
 
+    def test_short_pages(self):
+        client = MagicMock()
+        client.get_group_membership.side_effect = [
+            {"totalResults": 3, "Resources": [{"id": "g1"}, {"id": "g2"}]},
+            {"totalResults": 3, "Resources": [{"id": "g3"}]},
+        ]
+        result = get_all_groups(client, "t1")
+        assert [g["id"] for g in result] == ["g1", "g2", "g3"]
+        assert [c.args[1] for c in client.get_group_membership.call_args_list] == [1, 3]
+        client.get_group_membership.assert_called_with("t1", 3, count=SCIM_PAGE_SIZE)
+
+    def test_empty_page_terminates(self):
+        client = MagicMock()
+        client.get_group_membership.return_value = {"totalResults": 50, "Resources": []}
+        result = get_all_groups(client, "t1")
+        assert result == []
+        assert client.get_group_membership.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # display_groups_table
@@ -1075,6 +1157,13 @@ class TestPlanGroupSync:
         assert len(ops["update"]) == 0
         assert len(ops["delete"]) == 0
 
+    def test_unresolved_members_not_planned(self):
+        """Emails missing from the user index can't be added, so don't plan an update."""
+        desired = [{"name": "Eng", "members": [{"email": "a@co.com"}, {"email": "x@co.com"}]}]
+        existing = {"Eng": {"id": "g1", "displayName": "Eng", "members": [{"value": "u1"}]}}
+        ops = plan_group_sync(desired, existing, {"a@co.com": "u1"})
+        assert ops["update"] == []
+
 
 # ---------------------------------------------------------------------------
 # needs_update
@@ -1097,6 +1186,59 @@ class TestNeedsUpdate:
     def test_empty_both(self):
         assert needs_update({}, {}) is False
 
+    def test_resolves_emails_with_index(self):
+        desired = {"members": [{"email": "A@co.com"}]}
+        existing = {"members": [{"value": "u1"}]}
+        assert needs_update(desired, existing, {"a@co.com": "u1"}) is False
+        assert needs_update(desired, existing, {"a@co.com": "u2"}) is True
+
+
+# ---------------------------------------------------------------------------
+# user index
+# ---------------------------------------------------------------------------
+
+
+class TestUserIndex:
+    def _client(self, pages):
+        client = MagicMock()
+        client.get_base_url.return_value = URL("https://api.app.preset.io/v1")
+        client.session.get.return_value.json.side_effect = pages
+        return client
+
+    def test_get_all_scim_users(self):
+        client = self._client(
+            [
+                {"totalResults": 2, "Resources": [{"id": "u1"}]},
+                {"totalResults": 2, "Resources": [{"id": "u2"}]},
+            ]
+        )
+        assert get_all_scim_users(client, "t1") == [{"id": "u1"}, {"id": "u2"}]
+        urls = [str(c.args[0]) for c in client.session.get.call_args_list]
+        assert urls == [
+            "https://api.app.preset.io/v1/teams/t1/scim/v2/Users?startIndex=1&count=500",
+            "https://api.app.preset.io/v1/teams/t1/scim/v2/Users?startIndex=2&count=500",
+        ]
+
+    def test_build_user_index(self):
+        client = self._client(
+            [
+                {
+                    "totalResults": 3,
+                    "Resources": [
+                        {"id": "u1", "emails": [{"value": "Alice@Co.com"}]},
+                        {"id": "u2", "userName": "bob@co.com"},
+                        {"id": "u3"},
+                    ],
+                }
+            ]
+        )
+        assert _build_user_index(client, "t1") == {"alice@co.com": "u1", "bob@co.com": "u2"}
+
+    def test_resolve_members(self):
+        resolved, missing = resolve_members(["A@co.com", "x@co.com"], {"a@co.com": "u1"})
+        assert resolved == [{"value": "u1", "display": "A@co.com"}]
+        assert missing == ["x@co.com"]
+
 
 # ---------------------------------------------------------------------------
 # display_sync_plan
@@ -1140,6 +1282,13 @@ class TestDisplaySyncPlan:
         panel = mock_console.print.call_args[0][0]
         assert "No changes required" in str(panel.renderable)
 
+    @patch("sup.commands.group.console")
+    def test_keeps_line_styles(self, mock_console):
+        ops = {"create": [{"name": "New", "members": []}], "update": [], "delete": []}
+        display_sync_plan(ops, dry_run=False)
+        body = mock_console.print.call_args[0][0].renderable
+        assert {str(span.style) for span in body.spans} >= {"green", "dim"}
+
 
 # ---------------------------------------------------------------------------
 # execute_group_sync
@@ -1180,11 +1329,97 @@ class TestExecuteGroupSync:
             results = execute_group_sync(client, "t1", ops)
         assert results["updated"] == 1
 
+    def test_update_with_user_index(self):
+        client = MagicMock()
+        ops = {
+            "create": [{"name": "New", "members": [{"email": "b@co.com"}]}],
+            "update": [
+                {
+                    "id": "g1",
+                    "name": "Eng",
+                    "desired": {"members": [{"email": "a@co.com"}, {"email": "x@co.com"}]},
+                    "existing": {},
+                }
+            ],
+            "delete": [],
+        }
+        index = {"a@co.com": "u1", "b@co.com": "u2"}
+        with patch("sup.commands.group.create_scim_group") as mock_create, patch(
+            "sup.commands.group.update_scim_group"
+        ) as mock_update:
+            results = execute_group_sync(client, "t1", ops, index)
+        assert results["created"] == 1
+        assert results["updated"] == 1
+        assert mock_create.call_args[0][2]["members"] == [{"value": "u2", "display": "b@co.com"}]
+        patch_ops = mock_update.call_args[0][3]["Operations"]
+        assert patch_ops == [
+            {"op": "add", "path": "members", "value": [{"value": "u1", "display": "a@co.com"}]}
+        ]
+
+    @pytest.mark.parametrize("porcelain", [False, True])
+    def test_unknown_members_warning(self, porcelain):
+        client = MagicMock()
+        ops = {
+            "create": [{"name": "New", "members": [{"email": "x@co.com"}]}],
+            "update": [],
+            "delete": [],
+        }
+        with patch("sup.commands.group.create_scim_group"), patch(
+            "sup.commands.group.console"
+        ) as mock_console:
+            execute_group_sync(client, "t1", ops, {}, porcelain)
+        warnings = [
+            c for c in mock_console.print.call_args_list if "Skipping unknown members" in c.args[0]
+        ]
+        assert len(warnings) == (0 if porcelain else 1)
+
+    def test_update_sends_member_deltas(self):
+        client = MagicMock()
+        ops = plan_group_sync(
+            [{"name": "Eng", "members": [{"email": "a@co.com"}, {"email": "c@co.com"}]}],
+            {"Eng": {"id": "g1", "members": [{"value": "u1"}, {"value": "u2"}]}},
+            {"a@co.com": "u1", "c@co.com": "u3"},
+        )
+        assert ops["update"][0]["diff"] == {"added": {"c@co.com"}, "removed": {"u2"}}
+        with patch("sup.commands.group.update_scim_group") as mock_update:
+            results = execute_group_sync(client, "t1", ops, {"a@co.com": "u1", "c@co.com": "u3"})
+        assert results["updated"] == 1
+        assert mock_update.call_args[0][3]["Operations"] == [
+            {"op": "add", "path": "members", "value": [{"value": "u3", "display": "c@co.com"}]},
+            {"op": "remove", "path": 'members[value eq "u2"]'},
+        ]
+
+    def test_update_skipped_without_deltas(self):
+        client = MagicMock()
+        ops = {
+            "create": [],
+            "update": [
+                {
+                    "id": "g1",
+                    "name": "Eng",
+                    "desired": {"members": [{"email": "x@co.com"}]},
+                    "existing": {},
+                }
+            ],
+            "delete": [],
+        }
+        with patch("sup.commands.group.update_scim_group") as mock_update:
+            results = execute_group_sync(client, "t1", ops, {})
+        mock_update.assert_not_called()
+        assert results["updated"] == 0
+
     def test_update_error(self):
         client = MagicMock()
         ops = {
             "create": [],
-            "update": [{"id": "g1", "name": "Eng", "desired": {"members": []}, "existing": {}}],
+            "update": [
+                {
+                    "id": "g1",
+                    "name": "Eng",
+                    "desired": {"members": [{"email": "a@co.com"}]},
+                    "existing": {},
+                }
+            ],
             "delete": [],
         }
         with patch("sup.commands.group.update_scim_group", side_effect=RuntimeError("fail")):
@@ -1,12 +1,15 @@
 """Tests for sup.commands.sync module."""
 
+from io import StringIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from rich.console import Console
 from typer.testing import CliRunner
 
 from sup.commands.sync import (
+    _find_push_assets,
     app,
     display_sync_summary,
     execute_pull,
@@ -76,6 +79,16 @@ class TestFormatSyncHelp:
         assert "Multi-target" in result
         assert "Quick Start" in result
 
+    def test_built_on_help(self):
+        assert "Quick Start" not in app.info.help
+
+        with patch("sup.commands.sync.format_sync_help", return_value="Lazy help") as mock_help:
+            result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "Lazy help" in result.output
+        mock_help.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # run_sync command
@@ -83,46 +96,46 @@ class TestFormatSyncHelp:
 
 
 class TestRunSync:
-    @patch("sup.commands.sync.validate_sync_folder")
+    @patch("sup.config.sync.validate_sync_folder")
     def test_pull_only_and_push_only_error(self, mock_validate):
         result = runner.invoke(app, ["run", "/tmp/s", "--pull-only", "--push-only"])
         assert result.exit_code == 1
 
-    @patch("sup.commands.sync.validate_sync_folder")
+    @patch("sup.config.sync.validate_sync_folder")
     def test_pull_only_and_push_only_porcelain(self, mock_validate):
         result = runner.invoke(app, ["run", "/tmp/s", "--pull-only", "--push-only", "--porcelain"])
         assert result.exit_code == 1
 
-    @patch("sup.commands.sync.validate_sync_folder", return_value=False)
+    @patch("sup.config.sync.validate_sync_folder", return_value=False)
     def test_invalid_sync_folder(self, mock_validate):
         result = runner.invoke(app, ["run", "/tmp/s"])
         assert result.exit_code == 1
         assert "Invalid sync folder" in result.output
 
-    @patch("sup.commands.sync.validate_sync_folder", return_value=False)
+    @patch("sup.config.sync.validate_sync_folder", return_value=False)
     def test_invalid_sync_folder_porcelain(self, mock_validate):
         result = runner.invoke(app, ["run", "/tmp/s", "--porcelain"])
         assert result.exit_code == 1
         assert "Invalid sync folder" not in result.output
 
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_config_load_failure(self, mock_validate, mock_cfg_cls):
         mock_cfg_cls.from_yaml.side_effect = Exception("bad yaml")
         result = runner.invoke(app, ["run", "/tmp/s"])
         assert result.exit_code == 1
         assert "Failed to load sync config" in result.output
 
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_config_load_failure_porcelain(self, mock_validate, mock_cfg_cls):
         mock_cfg_cls.from_yaml.side_effect = Exception("bad yaml")
         result = runner.invoke(app, ["run", "/tmp/s", "--porcelain"])
         assert result.exit_code == 1
         assert "Failed to load sync config" not in result.output
 
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_target_found_by_name(self, mock_validate, mock_cfg_cls):
         cfg = _make_sync_config()
         target = _make_target(workspace_id=456, name="prod")
@@ -135,8 +148,8 @@ class TestRunSync:
             result = runner.invoke(app, ["run", "/tmp/s", "--target", "prod", "--force"])
         assert result.exit_code == 0
 
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_target_found_by_workspace_id(self, mock_validate, mock_cfg_cls):
         cfg = _make_sync_config()
         target = _make_target(workspace_id=456)
@@ -150,8 +163,8 @@ class TestRunSync:
             result = runner.invoke(app, ["run", "/tmp/s", "--target", "456", "--force"])
         assert result.exit_code == 0
 
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_target_not_found(self, mock_validate, mock_cfg_cls):
         cfg = _make_sync_config()
         cfg.get_target_by_name.return_value = None
@@ -162,8 +175,8 @@ class TestRunSync:
         assert result.exit_code == 1
         assert "not found" in result.output
 
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_target_not_found_porcelain(self, mock_validate, mock_cfg_cls):
         cfg = _make_sync_config()
         cfg.get_target_by_name.return_value = None
@@ -173,8 +186,8 @@ class TestRunSync:
         result = runner.invoke(app, ["run", "/tmp/s", "--target", "nonexistent", "--porcelain"])
         assert result.exit_code == 1
 
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_target_not_found_non_numeric(self, mock_validate, mock_cfg_cls):
         """Target that is not a valid int and not found by name."""
         cfg = _make_sync_config()
@@ -183,12 +196,13 @@ class TestRunSync:
 
         result = runner.invoke(app, ["run", "/tmp/s", "--target", "abc"])
         assert result.exit_code == 1
+        cfg.get_target_by_workspace_id.assert_not_called()
 
     @patch("sup.commands.sync.execute_push")
     @patch("sup.commands.sync.execute_pull")
     @patch("sup.commands.sync.display_sync_summary")
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_confirm_decline(self, mock_validate, mock_cfg_cls, mock_display, mock_pull, mock_push):
         cfg = _make_sync_config()
         mock_cfg_cls.from_yaml.return_value = cfg
@@ -202,8 +216,8 @@ class TestRunSync:
     @patch("sup.commands.sync.execute_push")
     @patch("sup.commands.sync.execute_pull")
     @patch("sup.commands.sync.display_sync_summary")
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_confirm_accept(self, mock_validate, mock_cfg_cls, mock_display, mock_pull, mock_push):
         cfg = _make_sync_config()
         mock_cfg_cls.from_yaml.return_value = cfg
@@ -216,8 +230,8 @@ class TestRunSync:
     @patch("sup.commands.sync.execute_push")
     @patch("sup.commands.sync.execute_pull")
     @patch("sup.commands.sync.display_sync_summary")
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_pull_only(self, mock_validate, mock_cfg_cls, mock_display, mock_pull, mock_push):
         cfg = _make_sync_config()
         mock_cfg_cls.from_yaml.return_value = cfg
@@ -230,8 +244,8 @@ class TestRunSync:
     @patch("sup.commands.sync.execute_push")
     @patch("sup.commands.sync.execute_pull")
     @patch("sup.commands.sync.display_sync_summary")
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_push_only(self, mock_validate, mock_cfg_cls, mock_display, mock_pull, mock_push):
         cfg = _make_sync_config()
         mock_cfg_cls.from_yaml.return_value = cfg
@@ -244,8 +258,8 @@ class TestRunSync:
     @patch("sup.commands.sync.execute_push")
     @patch("sup.commands.sync.execute_pull")
     @patch("sup.commands.sync.display_sync_summary")
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_dry_run_skips_confirm(
         self, mock_validate, mock_cfg_cls, mock_display, mock_pull, mock_push
     ):
@@ -259,8 +273,8 @@ class TestRunSync:
 
     @patch("sup.commands.sync.execute_push")
     @patch("sup.commands.sync.execute_pull")
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_porcelain_skips_display(self, mock_validate, mock_cfg_cls, mock_pull, mock_push):
         cfg = _make_sync_config()
         mock_cfg_cls.from_yaml.return_value = cfg
@@ -270,8 +284,8 @@ class TestRunSync:
 
     @patch("sup.commands.sync.execute_pull", side_effect=Exception("pull failed"))
     @patch("sup.commands.sync.display_sync_summary")
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_sync_exception(self, mock_validate, mock_cfg_cls, mock_display, mock_pull):
         cfg = _make_sync_config()
         mock_cfg_cls.from_yaml.return_value = cfg
@@ -281,8 +295,8 @@ class TestRunSync:
         assert "Sync operation failed" in result.output
 
     @patch("sup.commands.sync.execute_pull", side_effect=Exception("pull failed"))
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_sync_exception_porcelain(self, mock_validate, mock_cfg_cls, mock_pull):
         cfg = _make_sync_config()
         mock_cfg_cls.from_yaml.return_value = cfg
@@ -294,8 +308,8 @@ class TestRunSync:
     @patch("sup.commands.sync.execute_push")
     @patch("sup.commands.sync.execute_pull")
     @patch("sup.commands.sync.display_sync_summary")
-    @patch("sup.commands.sync.SyncConfig")
-    @patch("sup.commands.sync.validate_sync_folder", return_value=True)
+    @patch("sup.config.sync.SyncConfig")
+    @patch("sup.config.sync.validate_sync_folder", return_value=True)
     def test_success_message(self, mock_validate, mock_cfg_cls, mock_display, mock_pull, mock_push):
         cfg = _make_sync_config()
         mock_cfg_cls.from_yaml.return_value = cfg
@@ -311,7 +325,7 @@ class TestRunSync:
 
 
 class TestCreateSync:
-    @patch("sup.commands.sync.SyncConfig")
+    @patch("sup.config.sync.SyncConfig")
     def test_folder_exists_no_force(self, mock_cfg_cls, tmp_path):
         folder = tmp_path / "existing"
         folder.mkdir()
@@ -321,11 +335,14 @@ class TestCreateSync:
 
     def test_invalid_target_ids(self, tmp_path):
         folder = tmp_path / "newsync"
-        result = runner.invoke(app, ["create", str(folder), "--source", "1", "--targets", "abc"])
+        result = runner.invoke(
+            app, ["create", str(folder), "--source", "1", "--targets", "2, abc,3"]
+        )
         assert result.exit_code == 1
-        assert "Invalid target workspace IDs" in result.output
+        assert "Invalid target workspace ID #2: 'abc'" in result.output
+        assert not folder.exists()
 
-    @patch("sup.commands.sync.SyncConfig")
+    @patch("sup.config.sync.SyncConfig")
     def test_success(self, mock_cfg_cls, tmp_path):
         folder = tmp_path / "newsync"
         cfg = _make_sync_config()
@@ -342,9 +359,10 @@ class TestCreateSync:
         assert (folder / "assets" / "dashboards").exists()
         assert (folder / "assets" / "datasets").exists()
         assert (folder / "assets" / "databases").exists()
+        assert (folder / "assets" / "themes").exists()
         cfg.to_yaml.assert_called_once()
 
-    @patch("sup.commands.sync.SyncConfig")
+    @patch("sup.config.sync.SyncConfig")
     def test_force_overwrite(self, mock_cfg_cls, tmp_path):
         folder = tmp_path / "existing"
         folder.mkdir()
@@ -358,7 +376,7 @@ class TestCreateSync:
         )
         assert result.exit_code == 0
 
-    @patch("sup.commands.sync.SyncConfig")
+    @patch("sup.config.sync.SyncConfig")
     def test_create_exception(self, mock_cfg_cls, tmp_path):
         folder = tmp_path / "newsync"
         mock_cfg_cls.create_example.side_effect = Exception("boom")
@@ -387,7 +405,7 @@ class TestValidateSync:
         assert "sync_config.yml not found" in result.output
 
     @patch("sup.commands.sync.display_sync_summary")
-    @patch("sup.commands.sync.SyncConfig")
+    @patch("sup.config.sync.SyncConfig")
     def test_valid_config(self, mock_cfg_cls, mock_display, tmp_path):
         folder = tmp_path / "good"
         folder.mkdir()
@@ -400,7 +418,7 @@ class TestValidateSync:
         assert "valid" in result.output
         mock_display.assert_called_once()
 
-    @patch("sup.commands.sync.SyncConfig")
+    @patch("sup.config.sync.SyncConfig")
     def test_invalid_config(self, mock_cfg_cls, tmp_path):
         folder = tmp_path / "bad"
         folder.mkdir()
@@ -411,56 +429,63 @@ class TestValidateSync:
         assert result.exit_code == 1
         assert "Invalid sync configuration" in result.output
 
+    @patch("sup.commands.sync.display_sync_summary")
+    @patch("sup.config.sync.SyncConfig")
+    def test_porcelain(self, mock_cfg_cls, mock_display, tmp_path):
+        mock_cfg_cls.from_yaml.return_value = _make_sync_config()
+        result = runner.invoke(app, ["validate", str(tmp_path), "--porcelain"])
+        assert result.exit_code == 0
+        assert result.output == ""
+        mock_display.assert_not_called()
+
+        mock_cfg_cls.from_yaml.side_effect = Exception("parse error")
+        result = runner.invoke(app, ["validate", str(tmp_path), "--porcelain"])
+        assert result.exit_code == 1
+        assert result.output == ""
+
+        mock_cfg_cls.from_yaml.side_effect = FileNotFoundError
+        result = runner.invoke(app, ["validate", str(tmp_path / "nope"), "--porcelain"])
+        assert result.exit_code == 1
+        assert result.output == ""
+
 
 # ---------------------------------------------------------------------------
 # display_sync_summary
 # ---------------------------------------------------------------------------
 
 
+def _render_summary(cfg, targets, pull_only=False, push_only=False, dry_run=False):
+    """Run display_sync_summary against a real console and return what it printed."""
+    output = StringIO()
+    with patch("sup.commands.sync.console", Console(file=output, width=200)):
+        display_sync_summary(cfg, targets, pull_only, push_only, dry_run, Path("/tmp/s"))
+    return output.getvalue()
+
+
 class TestDisplaySyncSummary:
-    @patch("sup.commands.sync.console")
-    def test_pull_only(self, mock_console):
+    def test_pull_only(self):
         cfg = _make_sync_config()
         targets = [_make_target(name="prod")]
-        display_sync_summary(
-            cfg, targets, pull_only=True, push_only=False, dry_run=False, sync_path=Path("/tmp/s")
-        )
-        calls = [str(c) for c in mock_console.print.call_args_list]
-        assert any("Pull Only" in c for c in calls)
-        assert any("prod" in c for c in calls)
+        output = _render_summary(cfg, targets, pull_only=True)
+        assert "Pull Only" in output
+        assert "prod" in output
 
-    @patch("sup.commands.sync.console")
-    def test_push_only(self, mock_console):
+    def test_push_only(self):
         cfg = _make_sync_config()
         targets = [_make_target()]
-        display_sync_summary(
-            cfg, targets, pull_only=False, push_only=True, dry_run=False, sync_path=Path("/tmp/s")
-        )
-        calls = [str(c) for c in mock_console.print.call_args_list]
-        assert any("Push Only" in c for c in calls)
+        assert "Push Only" in _render_summary(cfg, targets, push_only=True)
 
-    @patch("sup.commands.sync.console")
-    def test_full_sync(self, mock_console):
+    def test_full_sync(self):
         cfg = _make_sync_config()
         targets = [_make_target()]
-        display_sync_summary(
-            cfg, targets, pull_only=False, push_only=False, dry_run=False, sync_path=Path("/tmp/s")
-        )
-        calls = [str(c) for c in mock_console.print.call_args_list]
-        assert any("Full Sync" in c for c in calls)
+        assert "Full Sync" in _render_summary(cfg, targets)
 
-    @patch("sup.commands.sync.console")
-    def test_dry_run_appends(self, mock_console):
+    def test_dry_run_appends(self):
         cfg = _make_sync_config()
         targets = [_make_target()]
-        display_sync_summary(
-            cfg, targets, pull_only=True, push_only=False, dry_run=True, sync_path=Path("/tmp/s")
-        )
-        calls = [str(c) for c in mock_console.print.call_args_list]
-        assert any("Dry Run" in c for c in calls)
+        assert "Dry Run" in _render_summary(cfg, targets, pull_only=True, dry_run=True)
 
-    @patch("sup.commands.sync.console")
-    def test_ids_selection(self, mock_console):
+    def test_ids_selection(self):
         assets = MagicMock()
         assets.charts = _make_asset_selection(selection="ids", ids=[1, 2, 3])
         assets.dashboards = None
@@ -469,20 +494,14 @@ class TestDisplaySyncSummary:
         assets.themes = None
         cfg = _make_sync_config(assets=assets)
         targets = [_make_target(name="staging")]
-        display_sync_summary(cfg, targets, False, False, False, Path("/tmp/s"))
-        calls = [str(c) for c in mock_console.print.call_args_list]
-        assert any("3 items" in c for c in calls)
+        assert "3 items" in _render_summary(cfg, targets)
 
-    @patch("sup.commands.sync.console")
-    def test_target_without_name(self, mock_console):
+    def test_target_without_name(self):
         cfg = _make_sync_config()
         targets = [_make_target(name=None)]
-        display_sync_summary(cfg, targets, False, False, False, Path("/tmp/s"))
-        calls = [str(c) for c in mock_console.print.call_args_list]
-        assert any("456" in c for c in calls)
+        assert "• 456 [overwrite: False]" in _render_summary(cfg, targets)
 
-    @patch("sup.commands.sync.console")
-    def test_no_assets(self, mock_console):
+    def test_no_assets(self):
         """All asset configs are None."""
         assets = MagicMock()
         assets.charts = None
@@ -491,9 +510,16 @@ class TestDisplaySyncSummary:
         assets.databases = None
         assets.themes = None
         cfg = _make_sync_config(assets=assets)
-        display_sync_summary(cfg, [], False, False, False, Path("/tmp/s"))
-        calls = [str(c) for c in mock_console.print.call_args_list]
-        assert any("123" in c for c in calls)  # source workspace id still printed
+        output = _render_summary(cfg, [])
+        assert "Workspace ID: 123" in output  # source workspace id still printed
+        assert "Assets:" not in output
+
+    @patch("sup.commands.sync.console")
+    def test_single_print(self, mock_console):
+        cfg = _make_sync_config()
+        targets = [_make_target(workspace_id=i) for i in range(5)]
+        display_sync_summary(cfg, targets, False, False, False, Path("/tmp/s"))
+        mock_console.print.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -589,6 +615,90 @@ class TestExecutePull:
         call_kwargs = mock_export.call_args
         assert call_kwargs.kwargs["requested_ids"] == {5, 6}
 
+    @patch("sup.commands.sync.console")
+    @patch("sup.config.settings.SupContext")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("preset_cli.cli.superset.export.export_resource")
+    def test_real_pull_several_types(
+        self, mock_export, mock_client_cls, mock_ctx_cls, mock_console, tmp_path
+    ):
+        """Every asset type is exported and counted when pulled concurrently."""
+        mock_client_cls.from_context.return_value = MagicMock()
+
+        assets = MagicMock()
+        assets.charts = _make_asset_selection(
+            selection="ids", ids=[1, 2], include_dependencies=False
+        )
+        assets.dashboards = _make_asset_selection(
+            selection="ids", ids=[3], include_dependencies=False
+        )
+        assets.datasets = _make_asset_selection(
+            selection="ids", ids=[4, 5, 6], include_dependencies=False
+        )
+        assets.databases = None
+        assets.themes = None
+        cfg = _make_sync_config(assets=assets)
+        cfg.assets_folder.return_value = tmp_path / "assets"
+
+        execute_pull(cfg, tmp_path, dry_run=False, porcelain=False)
+        exported = {
+            call.kwargs["resource_name"]: call.kwargs["requested_ids"]
+            for call in mock_export.call_args_list
+        }
+        assert exported == {"chart": {1, 2}, "dashboard": {3}, "dataset": {4, 5, 6}}
+        calls = [str(c) for c in mock_console.print.call_args_list]
+        assert any("6 assets exported" in c for c in calls)
+
+    @patch("sup.config.settings.SupContext")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("preset_cli.cli.superset.export.export_resource")
+    def test_real_pull_with_dependencies_is_serial(
+        self, mock_export, mock_client_cls, mock_ctx_cls, tmp_path
+    ):
+        """Exports that include dependencies run one at a time, in order."""
+        import threading
+
+        mock_client_cls.from_context.return_value = MagicMock()
+        threads = []
+        mock_export.side_effect = lambda **kwargs: threads.append(threading.get_ident())
+
+        assets = MagicMock()
+        assets.charts = _make_asset_selection(selection="ids", ids=[1])
+        assets.dashboards = _make_asset_selection(
+            selection="ids", ids=[2], include_dependencies=False
+        )
+        assets.datasets = None
+        assets.databases = None
+        assets.themes = None
+        cfg = _make_sync_config(assets=assets)
+        cfg.assets_folder.return_value = tmp_path / "assets"
+
+        execute_pull(cfg, tmp_path, dry_run=False, porcelain=True)
+        assert threads == [threading.get_ident()] * 2
+        assert [call.kwargs["skip_related"] for call in mock_export.call_args_list] == [
+            False,
+            True,
+        ]
+
+    @patch("sup.config.settings.SupContext")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("preset_cli.cli.superset.export.export_resource")
+    def test_real_pull_export_failure(self, mock_export, mock_client_cls, mock_ctx_cls, tmp_path):
+        mock_client_cls.from_context.return_value = MagicMock()
+        mock_export.side_effect = Exception("export failed")
+
+        assets = MagicMock()
+        assets.charts = _make_asset_selection(selection="ids", ids=[1])
+        assets.dashboards = _make_asset_selection(selection="ids", ids=[2])
+        assets.datasets = None
+        assets.databases = None
+        assets.themes = None
+        cfg = _make_sync_config(assets=assets)
+        cfg.assets_folder.return_value = tmp_path / "assets"
+
+        with pytest.raises(Exception, match="export failed"):
+            execute_pull(cfg, tmp_path, dry_run=False, porcelain=True)
+
     @patch("sup.config.settings.SupContext")
     @patch("sup.clients.superset.SupSupersetClient")
     @patch("preset_cli.cli.superset.export.export_resource")
@@ -876,6 +986,59 @@ class TestExecutePush:
         execute_push(cfg, [target], tmp_path, dry_run=False, porcelain=False)
         mock_import.assert_called_once()
 
+    @pytest.mark.parametrize(
+        "value, enabled",
+        [("1", True), ("TRUE", True), ("yes", True), ("0", False), ("false", False), (None, False)],
+    )
+    @patch("preset_cli.cli.superset.sync.native.command.raise_helper")
+    @patch("preset_cli.cli.superset.sync.native.command.load_user_modules")
+    @patch("preset_cli.cli.superset.sync.native.command.render_yaml")
+    @patch("preset_cli.cli.superset.sync.native.command.import_resources_individually")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("sup.config.settings.SupContext")
+    def test_push_debug_bundle(
+        self,
+        mock_ctx,
+        mock_client_cls,
+        mock_import,
+        mock_render,
+        mock_load,
+        mock_raise,
+        value,
+        enabled,
+        tmp_path,
+        monkeypatch,
+    ):
+        """The debug bundle is only written when SUP_DEBUG_BUNDLE is true."""
+        from zipfile import ZipFile
+
+        if value is not None:
+            monkeypatch.setenv("SUP_DEBUG_BUNDLE", value)
+        else:
+            monkeypatch.delenv("SUP_DEBUG_BUNDLE", raising=False)
+        mock_client_cls.from_context.return_value.client.baseurl = "https://test.preset.io"
+
+        charts_dir = tmp_path / "assets" / "charts"
+        charts_dir.mkdir(parents=True)
+        (charts_dir / "chart_1.yaml").write_text("title: test")
+
+        cfg = _make_sync_config()
+        cfg.assets_folder.return_value = tmp_path / "assets"
+        mock_render.return_value = {"title": "test"}
+
+        execute_push(cfg, [_make_target()], tmp_path, dry_run=False, porcelain=False)
+        mock_import.assert_called_once()
+
+        debug_zip_path = tmp_path / "debug_bundle.zip"
+        assert debug_zip_path.exists() is enabled
+        if enabled:
+            with ZipFile(debug_zip_path) as bundle:
+                assert sorted(bundle.namelist()) == [
+                    "bundle/charts/chart_1.yaml",
+                    "bundle/metadata.yaml",
+                ]
+                assert bundle.read("bundle/charts/chart_1.yaml") == b"title: test\n"
+
     @patch("preset_cli.cli.superset.sync.native.command.raise_helper")
     @patch("preset_cli.cli.superset.sync.native.command.load_user_modules")
     @patch("preset_cli.cli.superset.sync.native.command.render_yaml")
@@ -1385,6 +1548,186 @@ class TestExecutePush:
         with pytest.raises(Exception, match="auth fail"):
             execute_push(cfg, [target], tmp_path, dry_run=False, porcelain=True)
 
+    @patch("sup.commands.sync.console")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("sup.config.settings.SupContext")
+    def test_push_parallel_targets_reraise(self, mock_ctx, mock_client_cls, mock_console, tmp_path):
+        """A failing target aborts a concurrent push and its output is still shown."""
+        mock_client_cls.from_context.side_effect = Exception("auth fail")
+
+        cfg = _make_sync_config()
+        cfg.assets_folder.return_value = tmp_path / "assets"
+        targets = [_make_target(workspace_id=100), _make_target(workspace_id=200)]
+
+        with pytest.raises(Exception, match="auth fail"):
+            execute_push(cfg, targets, tmp_path, dry_run=False, porcelain=False)
+
+        calls = [str(c) for c in mock_console.print.call_args_list]
+        assert any("Push to 100 failed" in c or "Push to 200 failed" in c for c in calls)
+
+    @patch("sup.commands.sync.console")
+    @patch("preset_cli.cli.superset.sync.native.command.raise_helper")
+    @patch("preset_cli.cli.superset.sync.native.command.load_user_modules")
+    @patch("preset_cli.cli.superset.sync.native.command.render_yaml")
+    @patch("preset_cli.cli.superset.sync.native.command.is_yaml_config")
+    @patch("preset_cli.cli.superset.sync.native.command.import_resources_individually")
+    @patch("preset_cli.cli.superset.sync.native.command.ResourceType")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("sup.config.settings.SupContext")
+    def test_push_parallel_output_grouped(
+        self,
+        mock_ctx,
+        mock_client_cls,
+        mock_rt,
+        mock_import,
+        mock_is_yaml,
+        mock_render,
+        mock_load,
+        mock_raise,
+        mock_console,
+        tmp_path,
+    ):
+        """Each target's lines are printed together when pushing concurrently."""
+        mock_client = MagicMock()
+        mock_client.client.baseurl = "https://test.preset.io"
+        mock_client_cls.from_context.return_value = mock_client
+
+        assets = tmp_path / "assets"
+        assets.mkdir(parents=True)
+        (assets / "chart.yaml").write_text("title: t")
+
+        cfg = _make_sync_config()
+        cfg.assets_folder.return_value = assets
+        targets = [_make_target(workspace_id=i, name=None) for i in (100, 200, 300)]
+
+        mock_is_yaml.return_value = True
+        mock_render.return_value = {"title": "t"}
+        mock_rt.ASSET.metadata_type = "assets"
+
+        execute_push(cfg, targets, tmp_path, dry_run=False, porcelain=False)
+        assert mock_import.call_count == 3
+
+        calls = [str(c) for c in mock_console.print.call_args_list]
+        starts = [i for i, c in enumerate(calls) if "Pushing to workspace" in c]
+        pushed = [i for i, c in enumerate(calls) if "assets to workspace" in c]
+        assert len(starts) == len(pushed) == 3
+        # every "Pushed" line follows its own header before the next target starts
+        for start, done in zip(starts, pushed):
+            assert start < done
+            assert not any(start < other < done for other in starts)
+
+    @patch("sup.commands.sync.console")
+    @patch("preset_cli.cli.superset.sync.native.command.raise_helper")
+    @patch("preset_cli.cli.superset.sync.native.command.load_user_modules")
+    @patch("preset_cli.cli.superset.sync.native.command.render_yaml")
+    @patch("preset_cli.cli.superset.sync.native.command.is_yaml_config")
+    @patch("preset_cli.cli.superset.sync.native.command.import_resources_individually")
+    @patch("preset_cli.cli.superset.sync.native.command.ResourceType")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("sup.config.settings.SupContext")
+    def test_push_parallel_stops_after_failed_target(
+        self,
+        mock_ctx,
+        mock_client_cls,
+        mock_rt,
+        mock_import,
+        mock_is_yaml,
+        mock_render,
+        mock_load,
+        mock_raise,
+        mock_console,
+        tmp_path,
+    ):
+        """A failed import stops the remaining targets, as a serial push would."""
+        clients = {i: MagicMock() for i in (100, 200)}
+        for workspace_id, client in clients.items():
+            client.client.baseurl = f"https://{workspace_id}.preset.io"
+        mock_client_cls.from_context.side_effect = lambda ctx, workspace_id: clients[workspace_id]
+
+        assets = tmp_path / "assets"
+        assets.mkdir(parents=True)
+        (assets / "chart.yaml").write_text("title: t")
+
+        cfg = _make_sync_config()
+        cfg.assets_folder.return_value = assets
+        targets = [_make_target(workspace_id=i, name=None) for i in (100, 200)]
+
+        mock_is_yaml.return_value = True
+        mock_render.return_value = {"title": "t"}
+        mock_rt.ASSET.metadata_type = "assets"
+
+        def import_side_effect(configs, client, *args, **kwargs):
+            if client is clients[100].client:
+                raise Exception("dataset import failed")
+
+        mock_import.side_effect = import_side_effect
+
+        with pytest.raises(Exception, match="dataset import failed"):
+            execute_push(cfg, targets, tmp_path, dry_run=False, porcelain=False)
+
+        # Workspace 200 is rendered alongside, but never imported
+        mock_import.assert_called_once()
+        assert mock_import.call_args.args[1] is clients[100].client
+        calls = [str(c) for c in mock_console.print.call_args_list]
+        assert not any("Pushing to workspace 200" in c for c in calls)
+
+    @patch("sup.commands.sync.console")
+    @patch("preset_cli.cli.superset.sync.native.command.raise_helper")
+    @patch("preset_cli.cli.superset.sync.native.command.load_user_modules")
+    @patch("preset_cli.cli.superset.sync.native.command.render_yaml")
+    @patch("preset_cli.cli.superset.sync.native.command.is_yaml_config")
+    @patch("preset_cli.cli.superset.sync.native.command.import_resources_individually")
+    @patch("preset_cli.cli.superset.sync.native.command.ResourceType")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("sup.config.settings.SupContext")
+    def test_push_parallel_import_output_streams(
+        self,
+        mock_ctx,
+        mock_client_cls,
+        mock_rt,
+        mock_import,
+        mock_is_yaml,
+        mock_render,
+        mock_load,
+        mock_raise,
+        mock_console,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Each import streams its output once the target's own lines are shown."""
+        monkeypatch.delenv("SUP_CAPTURE_IMPORT_OUTPUT", raising=False)
+
+        mock_client = MagicMock()
+        mock_client.client.baseurl = "https://test.preset.io"
+        mock_client_cls.from_context.return_value = mock_client
+
+        assets = tmp_path / "assets"
+        assets.mkdir(parents=True)
+        (assets / "chart.yaml").write_text("title: t")
+
+        cfg = _make_sync_config()
+        cfg.assets_folder.return_value = assets
+        targets = [_make_target(workspace_id=i, name=None) for i in (100, 200)]
+
+        mock_is_yaml.return_value = True
+        mock_render.return_value = {"title": "t"}
+        mock_rt.ASSET.metadata_type = "assets"
+
+        # Lines already printed whenever an import starts
+        printed_before_import = []
+        mock_import.side_effect = lambda *args, **kwargs: printed_before_import.append(
+            [str(c) for c in mock_console.print.call_args_list]
+        )
+
+        execute_push(cfg, targets, tmp_path, dry_run=False, porcelain=False)
+
+        # Nothing is captured, so the import writes straight to the terminal
+        assert all("output" not in c.kwargs for c in mock_import.call_args_list)
+        for workspace_id, printed in zip((100, 200), printed_before_import):
+            assert any(f"Pushing to workspace {workspace_id}" in c for c in printed)
+            assert not any(f"assets to workspace {workspace_id}" in c for c in printed)
+
+    @patch("sup.commands.sync.console")
     @patch("preset_cli.cli.superset.sync.native.command.raise_helper")
     @patch("preset_cli.cli.superset.sync.native.command.load_user_modules")
     @patch("preset_cli.cli.superset.sync.native.command.render_yaml")
@@ -1393,7 +1736,7 @@ class TestExecutePush:
     @patch("preset_cli.cli.superset.sync.native.command.ResourceType")
     @patch("sup.clients.superset.SupSupersetClient")
     @patch("sup.config.settings.SupContext")
-    def test_push_import_captures_stdout(
+    def test_push_import_captures_output(
         self,
         mock_ctx,
         mock_client_cls,
@@ -1403,11 +1746,15 @@ class TestExecutePush:
         mock_render,
         mock_load,
         mock_raise,
+        mock_console,
         tmp_path,
+        monkeypatch,
     ):
-        """Verify stdout/stderr capture and restore during import."""
+        """Import output is collected in its own stream, leaving stdout alone."""
         import sys
 
+        monkeypatch.setenv("SUP_CAPTURE_IMPORT_OUTPUT", "1")
+
         mock_client = MagicMock()
         mock_client.client.baseurl = "https://test.preset.io"
         mock_client_cls.from_context.return_value = mock_client
@@ -1427,18 +1774,60 @@ class TestExecutePush:
         original_stdout = sys.stdout
         original_stderr = sys.stderr
 
-        def side_effect(*args, **kwargs):
-            import sys
-
-            sys.stdout.write("import output")
+        def side_effect(*args, output=None, **kwargs):
+            assert sys.stdout is original_stdout
+            assert sys.stderr is original_stderr
+            output.write("import output")
 
         mock_import.side_effect = side_effect
 
         execute_push(cfg, [target], tmp_path, dry_run=False, porcelain=False)
 
-        # Verify stdout/stderr are restored
-        assert sys.stdout is original_stdout
-        assert sys.stderr is original_stderr
+        calls = [c.args for c in mock_console.print.call_args_list]
+        assert ("   📝 Import output:",) in calls
+        assert ("import output",) in calls
+
+    @patch("sup.commands.sync.console")
+    @patch("preset_cli.cli.superset.sync.native.command.raise_helper")
+    @patch("preset_cli.cli.superset.sync.native.command.load_user_modules")
+    @patch("preset_cli.cli.superset.sync.native.command.render_yaml")
+    @patch("preset_cli.cli.superset.sync.native.command.import_resources_individually")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("sup.config.settings.SupContext")
+    def test_push_import_streams_stdout_by_default(
+        self,
+        mock_ctx,
+        mock_client_cls,
+        mock_import,
+        mock_render,
+        mock_load,
+        mock_raise,
+        mock_console,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Unless SUP_CAPTURE_IMPORT_OUTPUT is true the import writes to the real stdout."""
+        import sys
+
+        monkeypatch.setenv("SUP_CAPTURE_IMPORT_OUTPUT", "false")
+        mock_client_cls.from_context.return_value.client.baseurl = "https://test.preset.io"
+
+        charts_dir = tmp_path / "assets" / "charts"
+        charts_dir.mkdir(parents=True)
+        (charts_dir / "chart.yaml").write_text("t: 1")
+
+        cfg = _make_sync_config()
+        cfg.assets_folder.return_value = tmp_path / "assets"
+        mock_render.return_value = {"t": 1}
+
+        original_stdout = sys.stdout
+        seen = []
+        mock_import.side_effect = lambda *args, **kwargs: seen.append(sys.stdout)
+
+        execute_push(cfg, [_make_target()], tmp_path, dry_run=False, porcelain=False)
+        assert seen == [original_stdout]
+        calls = [str(c) for c in mock_console.print.call_args_list]
+        assert not any("Import output" in c for c in calls)
 
 
 # ---------------------------------------------------------------------------
@@ -1446,6 +1835,71 @@ class TestExecutePush:
 # ---------------------------------------------------------------------------
 
 
+class TestFindPushAssets:
+    def test_finds_assets_and_overrides(self, tmp_path):
+        charts = tmp_path / "charts"
+        charts.mkdir()
+        (charts / "c1.yaml").write_text("t: 1")
+        (charts / "c1.overrides.yaml").write_text("t: 2")
+        (charts / "c2.yaml").write_text("t: 3")
+        (charts / "metadata.yaml").write_text("version: 1")
+        (charts / "notes.txt").write_text("skip")
+        (tmp_path / "themes").mkdir()
+        (tmp_path / "themes" / "t.yaml").write_text("t: 4")
+        (tmp_path / ".hidden").mkdir()
+        (tmp_path / ".hidden" / "x.yaml").write_text("t: 5")
+
+        found = {rel: overrides for _, rel, overrides in _find_push_assets(tmp_path)}
+        assert found == {
+            Path("charts/c1.yaml"): charts / "c1.overrides.yaml",
+            Path("charts/c2.yaml"): None,
+        }
+
+    @patch("preset_cli.cli.superset.sync.native.command.raise_helper")
+    @patch("preset_cli.cli.superset.sync.native.command.load_user_modules")
+    @patch("preset_cli.cli.superset.sync.native.command.load_template")
+    @patch("preset_cli.cli.superset.sync.native.command.render_yaml")
+    @patch("preset_cli.cli.superset.sync.native.command.import_resources_individually")
+    @patch("preset_cli.cli.superset.sync.native.command.ResourceType")
+    @patch("sup.clients.superset.SupSupersetClient")
+    @patch("sup.config.settings.SupContext")
+    @patch("sup.commands.sync._find_push_assets")
+    def test_shared_work_once_for_all_targets(
+        self,
+        mock_find,
+        mock_ctx,
+        mock_client_cls,
+        mock_rt,
+        mock_import,
+        mock_render,
+        mock_template,
+        mock_load,
+        mock_raise,
+        tmp_path,
+    ):
+        mock_client_cls.from_context.return_value.client.baseurl = "https://test.preset.io"
+        assets = tmp_path / "assets"
+        assets.mkdir()
+        mock_find.return_value = [(assets / "charts/c.yaml", Path("charts/c.yaml"), None)]
+        mock_render.return_value = {"t": 1}
+        mock_rt.ASSET.metadata_type = "assets"
+
+        cfg = _make_sync_config()
+        cfg.assets_folder.return_value = assets
+        targets = [_make_target(workspace_id=100), _make_target(workspace_id=200)]
+
+        execute_push(cfg, targets, tmp_path, dry_run=False, porcelain=True)
+        mock_find.assert_called_once_with(assets)
+        mock_load.assert_called_once_with(assets / "functions")
+        mock_template.assert_called_once_with(assets / "charts/c.yaml")
+        assert mock_render.call_count == 2
+        assert mock_render.call_args.args[2] is mock_template.return_value
+        jinja_env = mock_render.call_args.args[1]
+        assert jinja_env["functions"] is mock_load.return_value
+        assert jinja_env["instance"] == "https://test.preset.io"
+        assert mock_import.call_count == 2
+
+
 class TestThemeSyncPull:
     """Tests for the theme-specific branch in execute_pull."""
 
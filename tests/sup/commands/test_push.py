@@ -47,13 +47,13 @@ def _call_push(**overrides):
     push_assets(**defaults)
 
 
-def _setup_success_mocks(stack, mock_ctx, hostname="ws200.preset.io", ws_id=200):
+def _setup_success_mocks(stack, mock_ctx, workspace_lookup, hostname="ws200.preset.io", ws_id=200):
     stack.enter_context(patch(PATCH_CTX, return_value=mock_ctx))
     mock_client_cls = stack.enter_context(patch(PATCH_CLIENT))
     mock_auth_cls = stack.enter_context(patch(PATCH_AUTH))
     mock_native = stack.enter_context(patch(PATCH_NATIVE))
     mock_client = MagicMock()
-    mock_client.get_all_workspaces.return_value = [{"id": ws_id, "hostname": hostname}]
+    mock_client.get_workspace.side_effect = workspace_lookup([{"id": ws_id, "hostname": hostname}])
     mock_client_cls.from_context.return_value = mock_client
     mock_auth_cls.from_sup_config.return_value = MagicMock()
     return mock_native
@@ -106,19 +106,21 @@ class TestPushAssetsWorkspaceConfig:
 
 
 class TestPushAssetsSafetyConfirmation:
-    def test_cross_workspace_confirm_yes(self, tmp_path):
+    def test_cross_workspace_confirm_yes(self, tmp_path, workspace_lookup):
         mock_ctx = _make_ctx(workspace_id=100, target_workspace_id=200)
         mock_ctx.get_assets_folder.return_value = str(tmp_path)
         with ExitStack() as stack:
-            _setup_success_mocks(stack, mock_ctx)
+            _setup_success_mocks(stack, mock_ctx, workspace_lookup)
             stack.enter_context(patch("typer.confirm", return_value=True))
             _call_push(force=False, porcelain=False)
 
-    def test_same_workspace_confirm_yes(self, tmp_path):
+    def test_same_workspace_confirm_yes(self, tmp_path, workspace_lookup):
         mock_ctx = _make_ctx(workspace_id=100, target_workspace_id=100)
         mock_ctx.get_assets_folder.return_value = str(tmp_path)
         with ExitStack() as stack:
-            _setup_success_mocks(stack, mock_ctx, ws_id=100, hostname="ws100.preset.io")
+            _setup_success_mocks(
+                stack, mock_ctx, workspace_lookup, ws_id=100, hostname="ws100.preset.io"
+            )
             stack.enter_context(patch("typer.confirm", return_value=True))
             _call_push(force=False, porcelain=False)
 
@@ -133,11 +135,11 @@ class TestPushAssetsSafetyConfirmation:
 
 
 class TestPushAssetsWorkspaceResolution:
-    def test_target_workspace_not_found(self, tmp_path):
+    def test_target_workspace_not_found(self, tmp_path, workspace_lookup):
         mock_ctx = _make_ctx()
         mock_ctx.get_assets_folder.return_value = str(tmp_path)
         mock_client = MagicMock()
-        mock_client.get_all_workspaces.return_value = [{"id": 999, "hostname": "o.io"}]
+        mock_client.get_workspace.side_effect = workspace_lookup([{"id": 999, "hostname": "o.io"}])
         with ExitStack() as stack:
             stack.enter_context(patch(PATCH_CTX, return_value=mock_ctx))
             mc = stack.enter_context(patch(PATCH_CLIENT))
@@ -145,11 +147,11 @@ class TestPushAssetsWorkspaceResolution:
             with pytest.raises(click.exceptions.Exit):
                 _call_push()
 
-    def test_target_workspace_no_hostname(self, tmp_path):
+    def test_target_workspace_no_hostname(self, tmp_path, workspace_lookup):
         mock_ctx = _make_ctx()
         mock_ctx.get_assets_folder.return_value = str(tmp_path)
         mock_client = MagicMock()
-        mock_client.get_all_workspaces.return_value = [{"id": 200, "hostname": None}]
+        mock_client.get_workspace.side_effect = workspace_lookup([{"id": 200, "hostname": None}])
         with ExitStack() as stack:
             stack.enter_context(patch(PATCH_CTX, return_value=mock_ctx))
             mc = stack.enter_context(patch(PATCH_CLIENT))
@@ -159,27 +161,27 @@ class TestPushAssetsWorkspaceResolution:
 
 
 class TestPushAssetsSuccess:
-    def test_successful_push_porcelain(self, tmp_path):
+    def test_successful_push_porcelain(self, tmp_path, workspace_lookup):
         mock_ctx = _make_ctx()
         mock_ctx.get_assets_folder.return_value = str(tmp_path)
         with ExitStack() as stack:
-            mn = _setup_success_mocks(stack, mock_ctx)
+            mn = _setup_success_mocks(stack, mock_ctx, workspace_lookup)
             _call_push(porcelain=True)
             mn.assert_called_once()
 
-    def test_successful_push_non_porcelain(self, tmp_path):
+    def test_successful_push_non_porcelain(self, tmp_path, workspace_lookup):
         mock_ctx = _make_ctx()
         mock_ctx.get_assets_folder.return_value = str(tmp_path)
         with ExitStack() as stack:
-            mn = _setup_success_mocks(stack, mock_ctx)
+            mn = _setup_success_mocks(stack, mock_ctx, workspace_lookup)
             _call_push(porcelain=False)
             mn.assert_called_once()
 
-    def test_push_with_template_options(self, tmp_path):
+    def test_push_with_template_options(self, tmp_path, workspace_lookup):
         mock_ctx = _make_ctx()
         mock_ctx.get_assets_folder.return_value = str(tmp_path)
         with ExitStack() as stack:
-            mn = _setup_success_mocks(stack, mock_ctx)
+            mn = _setup_success_mocks(stack, mock_ctx, workspace_lookup)
             _call_push(
                 overwrite=True,
                 template_options=["env=prod"],
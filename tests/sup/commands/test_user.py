@@ -132,7 +132,8 @@ class TestListUsers:
     def test_with_limit(self):
         cm, obj = _spinner_mocks()
         mc = MagicMock()
-        mc.client.export_users.return_value = iter(SAMPLE_USERS)
+        users = iter(SAMPLE_USERS)
+        mc.client.export_users.return_value = users
 
         with patch("sup.output.spinners.data_spinner", return_value=cm), patch(
             PATCH_CONTEXT
@@ -140,6 +141,8 @@ class TestListUsers:
             r = runner.invoke(app, ["list", "--limit", "1"])
         assert r.exit_code == 0
         assert len(mc.display_users_table.call_args[0][0]) == 1
+        # The export stops once the limit is reached
+        assert next(users) == SAMPLE_USERS[1]
 
     def test_spinner_none(self):
         cm = MagicMock()
@@ -115,6 +115,26 @@ class TestListUsers:
         )
         mock_ds.assert_called_once_with("users", silent=True)
 
+    def test_porcelain_rows(self):
+        spinner_cm, _ = _make_spinner_mocks()
+        mock_client = MagicMock()
+        users = [dict(SAMPLE_USERS[0], last_name=None), SAMPLE_USERS[1]]
+        mock_client.client.export_users.return_value = iter(users)
+
+        with patch("sup.output.spinners.data_spinner", return_value=spinner_cm), patch(
+            "sup.config.settings.SupContext"
+        ), patch(
+            "sup.clients.superset.SupSupersetClient.from_context",
+            return_value=mock_client,
+        ):
+            result = runner.invoke(app, ["list", "--porcelain"])
+
+        assert result.exit_code == 0
+        assert result.output == (
+            "1\talice@example.com\tAlice\t\talice\t['Admin']\n"
+            "2\tbob@example.com\tBob\tJones\tbob\t['Creator']\n"
+        )
+
     def test_with_limit(self):
         spinner_cm, spinner_obj = _make_spinner_mocks()
         mock_client = MagicMock()
@@ -196,6 +216,23 @@ class TestUserInfo:
         mock_display.assert_called_once()
         assert mock_display.call_args[0][0]["id"] == 1
 
+    def test_stops_export_when_found(self):
+        spinner_cm, _ = _make_spinner_mocks()
+        mock_client = MagicMock()
+        users = iter(SAMPLE_USERS)
+        mock_client.client.export_users.return_value = users
+
+        with patch("sup.output.spinners.data_spinner", return_value=spinner_cm), patch(
+            "sup.config.settings.SupContext"
+        ), patch(
+            "sup.clients.superset.SupSupersetClient.from_context",
+            return_value=mock_client,
+        ), patch("sup.commands.user.display_user_details"):
+            result = runner.invoke(app, ["info", "1"])
+
+        assert result.exit_code == 0
+        assert next(users) == SAMPLE_USERS[1]
+
     def test_found_porcelain(self):
         spinner_cm, _ = _make_spinner_mocks()
         mock_client = MagicMock()
@@ -10,6 +10,7 @@ new workspace on the next command.
 from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
 
 from sup.config.settings import SupContext, SupProjectState
 
@@ -138,3 +139,21 @@ def test_resolve_and_set_workspace_offline_fallback(temp_state):
     reloaded = SupProjectState.load_from_file()
     assert reloaded.current_workspace_id == 2
     assert reloaded.current_workspace_hostname is None
+
+
+def test_state_file_parsed_once(temp_state):
+    # Building several contexts only parses an unchanged state file once, and
+    # each context gets its own copy of the data.
+    temp_state.write_text("current_workspace_id: 4\n")
+
+    with patch("sup.config.settings.yaml.load", wraps=yaml.load) as load:
+        first = SupProjectState.load_from_file()
+        first.current_workspace_id = 5
+        second = SupProjectState.load_from_file()
+
+    assert second.current_workspace_id == 4
+    assert load.call_count == 1
+
+    # Saving invalidates the cache
+    first.save_to_file()
+    assert SupProjectState.load_from_file().current_workspace_id == 5
@@ -0,0 +1,138 @@
+"""Tests for loading sync configs from YAML."""
+
+import os
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from sup.config.sync import SyncConfig, TargetConfig, _load_sync_config, validate_sync_folder
+from sup.config.sync_cache import get_cache_file, load_sync_data
+
+CONFIG = """\
+source:
+  workspace_id: 1
+  assets:
+    charts:
+      selection: all
+targets:
+  - workspace_id: {target}
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk sync config cache out of the real home directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("sup.config.sync_cache.get_sync_cache_dir", lambda: cache_dir)
+    _load_sync_config.cache_clear()
+    return cache_dir
+
+
+def test_from_yaml_parses_once(tmp_path):
+    """Validating a folder and then loading it reuses the parsed config."""
+    config_path = tmp_path / "sync_config.yml"
+    config_path.write_text(CONFIG.format(target=2))
+
+    assert validate_sync_folder(tmp_path)
+    sync_config = SyncConfig.from_yaml(config_path)
+
+    assert sync_config.targets[0].workspace_id == 2
+    assert SyncConfig.from_yaml(config_path) is sync_config
+
+
+def test_from_yaml_reloads_modified_file(tmp_path):
+    config_path = tmp_path / "sync_config.yml"
+    config_path.write_text(CONFIG.format(target=2))
+    first = SyncConfig.from_yaml(config_path)
+
+    config_path.write_text(CONFIG.format(target=3))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = SyncConfig.from_yaml(config_path)
+    assert second is not first
+    assert second.targets[0].workspace_id == 3
+
+
+def test_from_yaml_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Sync config file not found"):
+        SyncConfig.from_yaml(tmp_path / "sync_config.yml")
+    assert not validate_sync_folder(tmp_path)
+    assert not validate_sync_folder(tmp_path / "missing")
+
+
+def test_from_yaml_empty_file(tmp_path):
+    config_path = tmp_path / "sync_config.yml"
+    config_path.write_text("")
+
+    with pytest.raises(ValueError, match="Sync config file is empty"):
+        SyncConfig.from_yaml(config_path)
+    assert not validate_sync_folder(tmp_path)
+
+
+def test_load_sync_data_uses_disk_cache(tmp_path, monkeypatch):
+    """A later run reads the JSON cache instead of parsing the YAML again."""
+    config_path = tmp_path / "sync_config.yml"
+    config_path.write_text(CONFIG.format(target=2))
+    stat = config_path.stat()
+
+    data = load_sync_data(config_path, stat.st_mtime_ns, stat.st_size)
+    assert get_cache_file(config_path).exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML should not be parsed")
+
+    monkeypatch.setattr("sup.config.sync_cache.yaml.load", fail)
+    assert load_sync_data(config_path, stat.st_mtime_ns, stat.st_size) == data
+
+    with pytest.raises(AssertionError, match="should not be parsed"):
+        load_sync_data(config_path, stat.st_mtime_ns + 1, stat.st_size)
+
+
+def test_load_sync_data_skips_non_json_content(tmp_path):
+    """Content that JSON can't represent exactly is parsed every time."""
+    config_path = tmp_path / "sync_config.yml"
+    config_path.write_text("released: 2024-01-01\n1: one\n")
+    stat = config_path.stat()
+
+    data = load_sync_data(config_path, stat.st_mtime_ns, stat.st_size)
+    assert data == {"released": date(2024, 1, 1), 1: "one"}
+    assert not get_cache_file(config_path).exists()
+
+
+def test_load_sync_data_ignores_corrupt_cache(tmp_path):
+    config_path = tmp_path / "sync_config.yml"
+    config_path.write_text(CONFIG.format(target=2))
+    stat = config_path.stat()
+
+    cache_file = get_cache_file(config_path)
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text("{not json")
+
+    data = load_sync_data(config_path, stat.st_mtime_ns, stat.st_size)
+    assert data["targets"] == [{"workspace_id": 2}]
+
+
+def test_get_target_lookups():
+    example = SyncConfig.create_example(1, [2, 3])
+    sync_config = SyncConfig(
+        source=example.source,
+        targets=[*example.targets, TargetConfig(workspace_id=4, name="target_1")],
+    )
+
+    assert sync_config.get_target_by_name("target_2").workspace_id == 3
+    assert sync_config.get_target_by_name("target_1").workspace_id == 2
+    assert sync_config.get_target_by_name("missing") is None
+    assert sync_config.get_target_by_workspace_id(2).name == "target_1"
+    assert sync_config.get_target_by_workspace_id(5) is None
+
+
+def test_sync_config_is_frozen():
+    """Targets can't be reassigned once the lookups may have been cached."""
+    sync_config = SyncConfig.create_example(1, [2])
+    assert sync_config.get_target_by_workspace_id(2) is not None
+
+    with pytest.raises(ValidationError):
+        sync_config.targets = [TargetConfig(workspace_id=3)]
+    assert sync_config.get_target_by_workspace_id(3) is None
@@ -0,0 +1,14 @@
+"""Shared fixtures for the sup tests."""
+
+import pytest
+
+
+@pytest.fixture
+def workspace_lookup():
+    """Build a stand-in for SupPresetClient.get_workspace over a list of workspaces."""
+
+    def lookup(workspaces):
+        by_id = {ws["id"]: ws for ws in workspaces}
+        return lambda workspace_id, **kwargs: by_id.get(workspace_id)
+
+    return lookup
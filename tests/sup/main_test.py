@@ -0,0 +1,86 @@
+"""Tests for the top-level sup app and its lazily imported commands."""
+
+import importlib
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+import click
+import pytest
+import typer
+from rich.text import Text
+from typer.testing import CliRunner
+
+from sup.commands import COMMAND_SUMMARIES
+from sup.main import _LAZY_COMMANDS, app
+
+runner = CliRunner()
+
+
+def test_help_does_not_import_commands():
+    with patch("sup.main.importlib.import_module") as import_module:
+        result = runner.invoke(app, ["--help"], env={"COLUMNS": "200"})
+
+    assert result.exit_code == 0
+    import_module.assert_not_called()
+    for name, (_, panel) in _LAZY_COMMANDS.items():
+        assert name in result.output
+        assert COMMAND_SUMMARIES[name] in result.output
+        assert panel in result.output
+
+
+def test_subcommand_imported_when_invoked():
+    result = runner.invoke(app, ["workspace", "--help"])
+
+    assert result.exit_code == 0
+    assert "Manage workspaces" in result.output
+    assert "use" in result.output
+    assert "--install-completion" not in result.output
+
+
+def test_list_commands_after_resolving():
+    group = typer.main.get_command(app)
+    ctx = click.Context(group)
+    group.get_command(ctx, "workspace")
+
+    commands = group.list_commands(ctx)
+    assert commands.count("workspace") == 1
+    assert set(_LAZY_COMMANDS) <= set(commands)
+
+
+@pytest.mark.parametrize("name", sorted(_LAZY_COMMANDS))
+def test_summary_matches_module_help(name):
+    module_name, _ = _LAZY_COMMANDS[name]
+    help_text = importlib.import_module(module_name).app.info.help
+
+    # config and dbt build their help with Rich markup; the summary is its heading
+    assert COMMAND_SUMMARIES[name] == Text.from_markup(help_text).plain.splitlines()[0]
+
+
+def test_docs_generator_finds_every_command():
+    spec = importlib.util.spec_from_file_location(
+        "generate_cli_docs",
+        Path(__file__).parents[2] / "scripts" / "generate_cli_docs.py",
+    )
+    generate_cli_docs = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generate_cli_docs)
+
+    commands = generate_cli_docs.extract_command_info(app)
+    assert set(_LAZY_COMMANDS) <= set(commands)
+    assert "use" in commands["workspace"]["subcommands"]
+
+
+def test_unknown_command():
+    result = runner.invoke(app, ["nope"])
+
+    assert result.exit_code != 0
+    assert "No such command" in result.output
+
+
+def test_banner_without_command():
+    with patch("sup.main.console.print") as mock_print:
+        result = runner.invoke(app, [])
+
+    assert result.exit_code == 0
+    # The banner is one renderable, followed by the --help hint
+    assert mock_print.call_count == 2
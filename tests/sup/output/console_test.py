@@ -0,0 +1,28 @@
+"""Tests for the shared console and its proxy."""
+
+import pytest
+
+from sup.output import console as console_module
+from sup.output.console import console, get_console, reset_console_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_console(monkeypatch):
+    """Start each test without cached consoles or color settings."""
+    monkeypatch.setenv("NO_COLOR", "1")
+    reset_console_cache()
+    yield
+    reset_console_cache()
+
+
+def test_proxy_follows_replaced_console(monkeypatch):
+    """Methods bound by the proxy are dropped when the default console is rebuilt."""
+    first = get_console()
+    assert console.print.__self__ is first
+
+    # The no_color decision changes without an explicit reset
+    monkeypatch.setattr(console_module, "_no_color_cache", False)
+    second = get_console()
+
+    assert second is not first
+    assert console.print.__self__ is second